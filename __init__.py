@@ -11,11 +11,30 @@ bl_info = {
 import sys
 sys.dont_write_bytecode = True
 import bpy
-from . import addon_updater_ops
 from .addon.register import register_addon, unregister_addon
 from bpy.app.handlers import persistent
 
 
+def make_annotations(cls):
+	"""Turn the legacy "name = bpy.props.X()" fields into annotations on 2.8+.
+	Same as addon_updater_ops.make_annotations, which is only imported in register()
+	so loading the add-on doesn't pull in the updater."""
+	if bpy.app.version < (2, 80):
+		return cls
+	if bpy.app.version < (2, 93, 0):
+		bl_props = {k: v for k, v in cls.__dict__.items() if isinstance(v, tuple)}
+	else:
+		bl_props = {k: v for k, v in cls.__dict__.items() if isinstance(v, bpy.props._PropertyDeferred)}
+	if bl_props:
+		if '__annotations__' not in cls.__dict__:
+			setattr(cls, '__annotations__', {})
+		annotations = cls.__dict__['__annotations__']
+		for k, v in bl_props.items():
+			annotations[k] = v
+			delattr(cls, k)
+	return cls
+
+
 @persistent
 def _tmc_on_load(dummy):
 	try:
@@ -25,7 +44,7 @@ def _tmc_on_load(dummy):
 		pass
 
 
-@addon_updater_ops.make_annotations
+@make_annotations
 class HS_PieItem(bpy.types.PropertyGroup):
 	# legacy assignment style; decorator converts them to annotations on 2.8+
 	name = bpy.props.StringProperty(name="Label", default="")  # visible label
@@ -33,7 +52,7 @@ class HS_PieItem(bpy.types.PropertyGroup):
 	icon = bpy.props.StringProperty(name="Icon", default="")  # optional icon file name within icons folder
 
 
-@addon_updater_ops.make_annotations
+@make_annotations
 class HS_OT_PieItemAdd(bpy.types.Operator):
 	bl_idname = "tmc.pie_item_add"
 	bl_label = "Add Pie Item"
@@ -95,7 +114,7 @@ class HS_OT_PieItemAdd(bpy.types.Operator):
 		return ret
 
 
-@addon_updater_ops.make_annotations
+@make_annotations
 class HS_OT_PieItemAddConfirm(bpy.types.Operator):
 	bl_idname = "tmc.pie_item_add_confirm"
 	bl_label = "Add Item (Confirm)"
@@ -127,7 +146,7 @@ class HS_OT_PieItemClear(bpy.types.Operator):
 		return {'FINISHED'}
 
 
-@addon_updater_ops.make_annotations
+@make_annotations
 class HS_OT_PieItemsSeedDefaults(bpy.types.Operator):
 	bl_idname = "tmc.pie_items_seed_defaults"
 	bl_label = "Load Defaults"
@@ -167,7 +186,7 @@ class HS_OT_PieItemsSeedDefaults(bpy.types.Operator):
 		prefs.pie_items_index = max(0, len(prefs.pie_items) - 1)
 		return {'FINISHED'}
 
-@addon_updater_ops.make_annotations
+@make_annotations
 class HS_OT_PieItemAddSearch(bpy.types.Operator):
 	bl_idname = "tmc.pie_item_add_search"
 	bl_label = "Add Pie Item"
@@ -228,7 +247,7 @@ class HS_OT_PieItemAddSearch(bpy.types.Operator):
 		context.window_manager.invoke_search_popup(self)
 		return self.execute(context)
 
-@addon_updater_ops.make_annotations
+@make_annotations
 class HS_OT_PieItemRemove(bpy.types.Operator):
 	bl_idname = "tmc.pie_item_remove"
 	bl_label = "Remove Pie Item"
@@ -243,7 +262,17 @@ class HS_OT_PieItemRemove(bpy.types.Operator):
 		return {'FINISHED'}
 
 
-@addon_updater_ops.make_annotations
+def _update_profiling(self, context):
+	from .addon.utility import profiler
+	profiler.sync_from_prefs()
+
+
+def _update_draw_monitor(self, context):
+	from .addon.utility import frame_monitor
+	frame_monitor.sync_from_prefs()
+
+
+@make_annotations
 class AddonPreferences(bpy.types.AddonPreferences):
 	bl_idname = __package__
 
@@ -258,11 +287,42 @@ class AddonPreferences(bpy.types.AddonPreferences):
 	pie_items = bpy.props.CollectionProperty(type=HS_PieItem)
 	pie_items_index = bpy.props.IntProperty(default=0)
 
+	# Profiling (off by default: nothing is wrapped until enabled)
+	profiling_enabled = bpy.props.BoolProperty(name="Profile Operators", default=False, update=_update_profiling,
+		description="Time every HS Tool operator call and its hot helper functions")
+	profiling_cprofile = bpy.props.BoolProperty(name="Capture cProfile", default=False, update=_update_profiling,
+		description="Also record a cProfile dump for each operator execute/invoke (slower)")
+	profiling_buffer_size = bpy.props.IntProperty(name="Records Kept", default=5000, min=100, max=1000000, update=_update_profiling,
+		description="Size of the ring buffer of recorded calls; the oldest are dropped first")
+	profiling_export_path = bpy.props.StringProperty(name="Export Folder", default="", subtype='DIR_PATH',
+		description="Folder for exported traces (empty: system temp folder)")
+	draw_monitor_enabled = bpy.props.BoolProperty(name="Monitor Draw Handlers", default=False, update=_update_draw_monitor,
+		description="Time the HS Tool viewport overlays every frame and count the GPU batches they build")
+	draw_budget_ms = bpy.props.FloatProperty(name="Frame Budget (ms)", default=1.0, min=0.05, max=100.0, precision=2, update=_update_draw_monitor,
+		description="Report a draw handler on the console when one frame of it takes longer than this")
+
 	def draw(self, context):
 		layout = self.layout
 		# Updater block
+		from . import addon_updater_ops
 		addon_updater_ops.update_settings_ui(self, context)
 
+		box = layout.box()
+		row = box.row(align=True)
+		row.prop(self, "profiling_enabled")
+		sub = row.row(align=True)
+		sub.active = self.profiling_enabled
+		sub.prop(self, "profiling_cprofile")
+		sub.prop(self, "profiling_buffer_size")
+		row = box.row(align=True)
+		row.active = self.profiling_enabled
+		row.prop(self, "profiling_export_path")
+		row = box.row(align=True)
+		row.prop(self, "draw_monitor_enabled")
+		sub = row.row(align=True)
+		sub.active = self.draw_monitor_enabled
+		sub.prop(self, "draw_budget_ms")
+
 		box = layout.box()
 		row = box.row(align=True)
 		row.label(text="Pie Menu Items")
@@ -272,9 +332,18 @@ class AddonPreferences(bpy.types.AddonPreferences):
 
 		# List header
 		col = box.column(align=True)
+		try:
+			from .addon.ui.menu import get_icon_id, DEFAULT_ICON_MAP
+		except Exception:
+			get_icon_id = lambda name: 0
+			DEFAULT_ICON_MAP = {}
 		for i, it in enumerate(self.pie_items):
 			r = col.row(align=True)
-			r.label(text=f"{i+1}", icon='DOT')
+			icon_id = get_icon_id(it.icon or DEFAULT_ICON_MAP.get(it.op, ""))
+			if icon_id:
+				r.label(text=f"{i+1}", icon_value=icon_id)
+			else:
+				r.label(text=f"{i+1}", icon='DOT')
 			# Robust property access (older Blender reloads can lose RNA defs temporarily)
 			try:
 				r.prop(it, "name", text="")
@@ -292,8 +361,12 @@ class AddonPreferences(bpy.types.AddonPreferences):
 
 
 def register():
+	from .addon.register.lazy import timed
 	# Update add-ons
-	addon_updater_ops.register(bl_info)
+	with timed("addon_updater", 'import_ms'):
+		from . import addon_updater_ops
+	with timed("addon_updater"):
+		addon_updater_ops.register(bl_info)
 	bpy.utils.register_class(HS_PieItem)
 	bpy.utils.register_class(HS_OT_PieItemAdd)
 	bpy.utils.register_class(HS_OT_PieItemAddSearch)
@@ -313,6 +386,7 @@ def register():
 
 def unregister():
 	# Update add-ons
+	from . import addon_updater_ops
 	addon_updater_ops.unregister()
 	bpy.utils.unregister_class(AddonPreferences)
 	bpy.utils.unregister_class(HS_OT_PieItemRemove)
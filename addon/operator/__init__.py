@@ -1,151 +1,152 @@
+import os
 import bpy
 from bpy.props import PointerProperty
-# Menu
-from .bevel import *
-from .boolean import *
-## Panel
-from .check import *
-from .modifier import *
-from .material import *
-from .modeling import *
-from .looptools import  LoopToolsProps, Circle, Curve, Flatten, Relax, Space
-from .normal import *
-from .vertex_group import *
-from .geometry_data import *
-from .bridge import *
-from .screenshot import *
-from .mirror import *
-from .collection import *
-from .uv import *
-from .bakeset import *
-from .auto_delete import *
-from .edge_constraint import *
-from .rebevel import TMC_OP_Unbevel, TMC_OP_BevelCurve, TMC_OP_reBevelCurve, TMC_OT_RebevelSmart
+from ..register.lazy import resolve_classes, timed, clear_lazy_modules
 
 
-classes = [
+# (module, class name) in registration order. Modules whose classes can be described from
+# their source are registered as stubs and imported on first poll/execute/invoke (see register.lazy)
+class_specs = [
 	# Menu
-	TMC_OP_Boolean,
+	("boolean", "TMC_OP_Boolean"),
+	("boolean", "TMC_OP_SelectCutterUsers"),
+	("boolean", "TMC_OP_ConsolidateBoolean"),
 
 	# Panel
 	## Check
-	TMC_OP_CheckAll,
-	TMC_OP_CheckMeshNoTris,
-	TMC_OP_CheckNgonsFace,
-	TMC_OP_CheckNonManifold,
-	TMC_OP_CheckIntersectFace,
-	TMC_OP_CheckZeroEdgeLength,
-	TMC_OP_CheckZeroFaceArea,
-	TMC_OP_CheckIsolatedVertex,
-	TMC_OP_CheckZeroUVSet,
-	TMC_OP_CheckSilhouette,
+	("check", "TMC_OP_CheckAll"),
+	("check", "TMC_OP_CheckMeshNoTris"),
+	("check", "TMC_OP_CheckNgonsFace"),
+	("check", "TMC_OP_CheckNonManifold"),
+	("check", "TMC_OP_CheckIntersectFace"),
+	("check", "TMC_OP_CheckZeroEdgeLength"),
+	("check", "TMC_OP_CheckZeroFaceArea"),
+	("check", "TMC_OP_CheckIsolatedVertex"),
+	("check", "TMC_OP_CheckZeroUVSet"),
+	("check", "TMC_OP_CheckSilhouette"),
 	## Modifier
-	TMC_OP_ToggleModifier,
-	TMC_OP_ApplyModifier,
-	TMC_OP_BevelCustomSetting,
-	TMC_OP_GetBevelModifiersFromVertex,
-	TMC_OP_SelectObjectFromCurrentMirror,
-	TMC_OP_SetCurrentMirrorToTargetMirror,
+	("modifier", "TMC_OP_ToggleModifier"),
+	("modifier", "TMC_OP_ApplyModifier"),
+	("bevel", "TMC_OP_BevelCustomSetting"),
+	("bevel", "TMC_OP_GetBevelModifiersFromVertex"),
+	("mirror", "TMC_OP_SelectObjectFromCurrentMirror"),
+	("mirror", "TMC_OP_SetCurrentMirrorToTargetMirror"),
 	## Collection
-	TMC_OP_CollapseAllCollections,
-	TMC_OP_ToggleCurrentHideGroup,
+	("collection", "TMC_OP_CollapseAllCollections"),
+	("collection", "TMC_OP_ToggleCurrentHideGroup"),
 	## Material
-	TMC_OP_DeleteDuplicateMaterials,
-	TMC_OP_CleanMaterialSlots,
-	TMC_OP_DeleteAllMaterials,
-	TMC_OP_AddMaterial,
-	TMC_OP_SelectObjectsByMaterial,
-	TMC_OP_SelectFacesOnActiveByMaterial,
-	TMC_OP_AssignMaterialToSelection,
+	("material", "TMC_OP_DeleteDuplicateMaterials"),
+	("material", "TMC_OP_CleanMaterialSlots"),
+	("material", "TMC_OP_DeleteAllMaterials"),
+	("material", "TMC_OP_AddMaterial"),
+	("material", "TMC_OP_SelectObjectsByMaterial"),
+	("material", "TMC_OP_SelectFacesOnActiveByMaterial"),
+	("material", "TMC_OP_AssignMaterialToSelection"),
 	## UV
-	TMC_OP_UVBySharpEdge,
-	TMC_OP_RenameUV1,
-	TMC_OP_DeleteRedundantUV,
+	("uv", "TMC_OP_UVBySharpEdge"),
+	("uv", "TMC_OP_RenameUV1"),
+	("uv", "TMC_OP_DeleteRedundantUV"),
 	## Bakeset
-	TMC_OP_RenameHighpoly,
-	TMC_OP_CreateBakeSet,
-	TMC_OP_AutoCreateBakeSet,
-	TMC_OP_ExportBakeSet,
-	TMC_OP_ExportSelectedHighLow,
+	("bakeset", "TMC_OP_RenameHighpoly"),
+	("bakeset", "TMC_OP_CreateBakeSet"),
+	("bakeset", "TMC_OP_AutoCreateBakeSet"),
+	("bakeset", "TMC_OP_ExportBakeSet"),
+	("bakeset", "TMC_OP_ExportSelectedHighLow"),
 
 	## Modeling
 	### Edge Length
-	TMC_OP_SetEdgeLength,
-	TMC_OP_GetEdgeLength,
-	TMC_OP_AddLockVertex,
-	TMC_OP_ClearLockVertex,
+	("modeling", "TMC_OP_SetEdgeLength"),
+	("modeling", "TMC_OP_GetEdgeLength"),
+	("modeling", "TMC_OP_AddLockVertex"),
+	("modeling", "TMC_OP_ClearLockVertex"),
 	### Circle Edge
-	TMC_OP_CircleEdge,
-	TMC_OP_AddPriorityVertex,
-	TMC_OP_ClearPriorityVertex,
-	TMC_OP_GetCircleDiameter,
-	TMC_OP_GetCircleAngle,
+	("modeling", "TMC_OP_CircleEdge"),
+	("modeling", "TMC_OP_AddPriorityVertex"),
+	("modeling", "TMC_OP_ClearPriorityVertex"),
+	("modeling", "TMC_OP_GetCircleDiameter"),
+	("modeling", "TMC_OP_GetCircleAngle"),
 	### Straight Edge
-	TMC_OP_StraightEdge,
+	("modeling", "TMC_OP_StraightEdge"),
 	### Relax Edge
-	TMC_OP_RelaxEdge,
+	("modeling", "TMC_OP_RelaxEdge"),
 	### Space Edge
-	TMC_OP_SpaceEdge,
+	("modeling", "TMC_OP_SpaceEdge"),
 	### Smooth Edge
-	TMC_OP_SmoothEdge,
+	("modeling", "TMC_OP_SmoothEdge"),
 	### Flatten Face
-	TMC_OP_FlattenFace,
+	("modeling", "TMC_OP_FlattenFace"),
 	### Edge Constraints (Rotate/Scale along edge direction)
-	TMC_OP_EdgeConstraints,
+	("edge_constraint", "TMC_OP_EdgeConstraints"),
 	### ReBevel (Mesh/Curve)
-	TMC_OP_Unbevel,
-	TMC_OP_BevelCurve,
-	TMC_OP_reBevelCurve,
-	TMC_OT_RebevelSmart,
+	("rebevel", "TMC_OP_Unbevel"),
+	("rebevel", "TMC_OP_BevelCurve"),
+	("rebevel", "TMC_OP_reBevelCurve"),
+	("rebevel", "TMC_OT_RebevelSmart"),
 	### Loop Tools
-	LoopToolsProps,
-	Circle,
-	Curve,
-	Flatten,
-	Relax,
-	Space,
+	("looptools", "LoopToolsProps"),
+	("looptools", "Circle"),
+	("looptools", "Curve"),
+	("looptools", "Flatten"),
+	("looptools", "Relax"),
+	("looptools", "Space"),
 
 	### Detach Element
-	TMC_OP_DetachElement,
+	("modeling", "TMC_OP_DetachElement"),
 
 	### Clone Element
-	TMC_OP_CloneElement,
+	("modeling", "TMC_OP_CloneElement"),
 
 	## Bridge
-	TMC_OP_ExportToMaya,
-	TMC_OP_ImportFromMaya,
+	("bridge", "TMC_OP_ExportToMaya"),
+	("bridge", "TMC_OP_ImportFromMaya"),
 
 	## Screenshot
-	TMC_OP_AutoScreenshot,
-	TMC_OP_CustomScreenshot,
+	("screenshot", "TMC_OP_AutoScreenshot"),
+	("screenshot", "TMC_OP_CustomScreenshot"),
 
 	### Vertex Group
-	TMC_OP_CleanVertexGroup,
+	("vertex_group", "TMC_OP_CleanVertexGroup"),
 	### Vertex Normal
-	TMC_OP_Set_Normal_With_Active_Face,
+	("normal", "TMC_OP_Set_Normal_With_Active_Face"),
 
 	### Geometry Data
-	TMC_OP_ClearCustomNormalsData,
+	("geometry_data", "TMC_OP_ClearCustomNormalsData"),
 
 	# Utilities
-	TMC_OP_AutoDelete,
+	("auto_delete", "TMC_OP_AutoDelete"),
+	("profiling", "TMC_OP_ExportProfile"),
+	("profiling", "TMC_OP_ClearProfile"),
 ]
 
+# Filled by register_operators: stub or real class for each entry of class_specs
+classes = []
+
 def menu_func(self, context):
 	self.layout.menu("VIEW3D_MT_edit_mesh_looptools")
 	self.layout.separator()
 
 def register_operators():
 	from bpy.utils import register_class
-	for cls in classes:
-		register_class(cls)
+	classes[:] = resolve_classes(__name__, os.path.dirname(__file__), class_specs)
+	for cls, (module_name, _) in zip(classes, class_specs):
+		with timed(module_name):
+			register_class(cls)
 	bpy.types.VIEW3D_MT_edit_mesh_context_menu.prepend(menu_func)
-	bpy.types.WindowManager.looptools = PointerProperty(type=LoopToolsProps)
+	# the registered class, which may be the stub: importing looptools here would defeat it
+	looptools_props = classes[class_specs.index(("looptools", "LoopToolsProps"))]
+	bpy.types.WindowManager.looptools = PointerProperty(type=looptools_props)
+	from ..utility import profiler, frame_monitor
+	profiler.sync_from_prefs()
+	frame_monitor.sync_from_prefs()
 	
 def unregister_operators():
 	from bpy.utils import unregister_class
+	from ..utility import profiler
+	profiler.disable()
 	for cls in reversed(classes):
 		unregister_class(cls)
+	classes.clear()
+	clear_lazy_modules()
 			
 	bpy.types.VIEW3D_MT_edit_mesh_context_menu.remove(menu_func)
 	try:
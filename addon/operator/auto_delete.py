@@ -1,9 +1,34 @@
 import bpy
-
-def find_connected_verts(me, found_index):
-    edges = me.edges
-    connecting_edges = [i for i in edges if found_index in i.vertices[:]]
-    return len(connecting_edges)
+import bmesh
+
+def dissolve_selected_edges(bm):
+    """Dissolve the selected edges of an edit bmesh. Edges between two faces merge
+    them; boundary, wire and non-manifold edges can't be dissolved and are deleted.
+    Verts of the selection left between two edges are dissolved afterwards, checked
+    through link_edges on that set only. Returns False when no edge was selected."""
+    edges = [e for e in bm.edges if e.select]
+    if not edges:
+        return False
+    affected = {v for e in edges for v in e.verts}
+    between_faces = [e for e in edges if len(e.link_faces) == 2]
+    loose = [e for e in edges if len(e.link_faces) != 2]
+    region = []
+    if between_faces:
+        region = bmesh.ops.dissolve_edges(bm, edges=between_faces, use_verts=True, use_face_split=False)['region']
+    if loose:
+        bmesh.ops.delete(bm, geom=loose, context='EDGES')
+    two_edged = [v for v in affected if v.is_valid and len(v.link_edges) == 2]
+    if two_edged:
+        bmesh.ops.dissolve_verts(bm, verts=two_edged, use_face_split=False, use_boundary_tear=False)
+    # leave nothing selected, touching only what the dissolve produced
+    for face in region:
+        if face.is_valid:
+            face.select_set(False)
+    for v in affected:
+        if v.is_valid:
+            v.select_set(False)
+    bm.select_history.clear()
+    return True
 
 class TMC_OP_AutoDelete(bpy.types.Operator):
     """ Dissolves mesh elements based on context instead
@@ -39,30 +64,12 @@ class TMC_OP_AutoDelete(bpy.types.Operator):
 
 
             elif select_mode[1] and not select_mode[2]:
-                edges1 = me.edges
-
-                bpy.ops.mesh.dissolve_edges(use_verts=True, use_face_split=False)
-                if edges1 == me.edges:
-                    bpy.ops.mesh.delete(type='EDGE')
-
-                bpy.ops.mesh.select_mode(type='EDGE')
-
-                bpy.ops.object.mode_set(mode='OBJECT')
-                bpy.ops.object.mode_set(mode='EDIT')
-                vs = [v.index for v in me.vertices if v.select]
-                bpy.ops.mesh.select_all(action='DESELECT')
-                bpy.ops.object.mode_set(mode='OBJECT')
-
-                for v in vs:
-                    vv = find_connected_verts(me, v)
-                    if vv == 2:
-                        me.vertices[v].select = True
-                bpy.ops.object.mode_set(mode='EDIT')
-                bpy.ops.mesh.dissolve_verts()
-                bpy.ops.mesh.select_all(action='DESELECT')
-
-                for v in vs:
-                    me.vertices[v].select = True
+                for obj in context.objects_in_mode_unique_data:
+                    if obj.type != 'MESH' or not obj.data.total_edge_sel:
+                        continue
+                    bm = bmesh.from_edit_mesh(obj.data)
+                    if dissolve_selected_edges(bm):
+                        bmesh.update_edit_mesh(obj.data)
 
 
             elif select_mode[2] and not select_mode[1]:
@@ -52,7 +52,7 @@ class TMC_OP_AutoCreateBakeSet(bpy.types.Operator):
                         checked_object_list.append(j)
                         break
         # start numbering from the next available index so consecutive runs continue numbering
-        next_index = get_next_bakeset_index(context.scene.bakeset_name)
+        next_index = get_next_bakeset_index(context.scene.hstool.bakeset.bakeset_name)
         for obj_pair in object_pair_list:
             if check_highpoly_name(obj_pair[0].name):
                 highpoly_mesh = obj_pair[0]
@@ -62,7 +62,7 @@ class TMC_OP_AutoCreateBakeSet(bpy.types.Operator):
                 lowpoly_mesh = obj_pair[0]
             # Rename & group mesh (use the next available index and increment for the next pair)
             i = next_index
-            bakeset_name = f"{context.scene.bakeset_name}_{i}"
+            bakeset_name = f"{context.scene.hstool.bakeset.bakeset_name}_{i}"
             next_index += 1
 
             # name High and Low with numeric suffix ensuring uniqueness: {bakeset_name}_High_{n}
@@ -84,7 +84,7 @@ class TMC_OP_AutoCreateBakeSet(bpy.types.Operator):
             obj_list_names.append(l_candidate)
 
             # ensure a base collection exists with the base bakeset name
-            base_collection_name = context.scene.bakeset_name
+            base_collection_name = context.scene.hstool.bakeset.bakeset_name
             if base_collection_name in bpy.data.collections:
                 base_coll = bpy.data.collections[base_collection_name]
             else:
@@ -177,8 +177,8 @@ class TMC_OP_CreateBakeSet(bpy.types.Operator):
             return {'CANCELLED'}
 
         # If user selected multiple highs and lows, create a single bakeset containing them
-        i = get_next_bakeset_index(context.scene.bakeset_name)
-        bakeset_name = f"{context.scene.bakeset_name}_{i}"
+        i = get_next_bakeset_index(context.scene.hstool.bakeset.bakeset_name)
+        bakeset_name = f"{context.scene.hstool.bakeset.bakeset_name}_{i}"
 
     # no empties/groups required — we'll only use collections
 
@@ -206,7 +206,7 @@ class TMC_OP_CreateBakeSet(bpy.types.Operator):
             lcount += 1
 
         # ensure base collection exists and child collection for this bakeset
-        base_collection_name = context.scene.bakeset_name
+        base_collection_name = context.scene.hstool.bakeset.bakeset_name
         if base_collection_name in bpy.data.collections:
             base_coll = bpy.data.collections[base_collection_name]
         else:
@@ -361,7 +361,7 @@ def check_overlap(context, object_a, object_b):
     a_bbox = get_bounding_box(object_a)
     b_bbox = get_bounding_box(object_b)
     diagonal_line_length = get_distance(b_bbox[0], b_bbox[-1])
-    min_distance = diagonal_line_length * context.scene.threshold_value
+    min_distance = diagonal_line_length * context.scene.hstool.bakeset.threshold_value
     # print("Min Distance:", min_distance)
     # print("Distance A:", get_distance(a_bbox[0], b_bbox[0]))
     # print("Distance B:", get_distance(a_bbox[-1], b_bbox[-1]))
@@ -377,7 +377,7 @@ def export_fbx_for_baking(context, object_name, folder_path):
     else:
         triangle = True
     # Unlock normal
-    if context.scene.export_bakeset_unlock_normal:
+    if context.scene.hstool.bakeset.export_bakeset_unlock_normal:
         smooth_type = 'FACE' 
     else:
         smooth_type = 'OFF'
@@ -423,10 +423,10 @@ def export_fbx_for_baking(context, object_name, folder_path):
 
 def export_bakeset_function(context, mode):
     # Get FBX folder
-    fbx_path = context.scene.get("bakeset_export_path", "")
+    fbx_path = context.scene.hstool.bakeset.bakeset_export_path
 
     # Get Bakeset name
-    bakeset_name = context.scene.bakeset_name
+    bakeset_name = context.scene.hstool.bakeset.bakeset_name
 
     # Get object list
     if mode == 'selected':
@@ -435,7 +435,7 @@ def export_bakeset_function(context, mode):
         mesh_list = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH' and bakeset_name in obj.name]
     
     # Get export mode: Single/Multiple
-    export_mode = context.scene.export_bakeset_mode
+    export_mode = context.scene.hstool.bakeset.export_bakeset_mode
     
     # Export FBX
     bpy.ops.object.select_all(action='DESELECT')
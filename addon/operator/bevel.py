@@ -1,5 +1,83 @@
 import bpy
+import bmesh
+import numpy as np
 from ..ui import controller
+from ..utility.vertex_group_index import group_membership, groups_in_membership
+
+
+BEVEL_WEIGHT_ATTRIBUTE = 'bevel_weight_edge'
+
+
+def _selected_mesh_objects(context):
+    # Edit Mode: every mesh being edited (one per mesh data); Object Mode: the selected meshes
+    if context.mode == 'EDIT_MESH':
+        return [o for o in context.objects_in_mode_unique_data if o.type == 'MESH']
+    return [o for o in context.selected_objects if o.type == 'MESH']
+
+
+def set_edit_bevel_weight(obj, value):
+    # Write straight into the edit mesh's float edge layer, no mode switch needed
+    bm = bmesh.from_edit_mesh(obj.data)
+    layer = bm.edges.layers.float.get(BEVEL_WEIGHT_ATTRIBUTE)
+    if layer is None:
+        layer = bm.edges.layers.float.new(BEVEL_WEIGHT_ATTRIBUTE)
+    count = 0
+    for edge in bm.edges:
+        if edge.select:
+            edge[layer] = value
+            count += 1
+    if count:
+        bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
+    return count
+
+
+def set_mesh_bevel_weight(mesh, value):
+    # Object Mode: one foreach_get/foreach_set pair over the edges, masked with NumPy
+    selected = np.zeros(len(mesh.edges), dtype=bool)
+    mesh.edges.foreach_get('select', selected)
+    count = int(np.count_nonzero(selected))
+    if not count:
+        return 0
+    attribute = mesh.attributes.get(BEVEL_WEIGHT_ATTRIBUTE)
+    if attribute is not None and (attribute.domain != 'EDGE' or attribute.data_type != 'FLOAT'):
+        mesh.attributes.remove(attribute)
+        attribute = None
+    if attribute is None:
+        attribute = mesh.attributes.new(name=BEVEL_WEIGHT_ATTRIBUTE, type='FLOAT', domain='EDGE')
+    weights = np.empty(len(mesh.edges), dtype=np.float32)
+    attribute.data.foreach_get('value', weights)
+    weights[selected] = value
+    attribute.data.foreach_set('value', weights)
+    mesh.update()
+    return count
+
+
+def set_bevel_weight(objects, value=1.0):
+    '''Set the bevel weight of the selected edges of every object; returns the edge count'''
+    count = 0
+    done = set()
+    for obj in objects:
+        if obj.data in done:
+            continue
+        done.add(obj.data)
+        if obj.mode == 'EDIT':
+            count += set_edit_bevel_weight(obj, value)
+        else:
+            count += set_mesh_bevel_weight(obj.data, value)
+    return count
+
+
+def new_bevel_modifier(obj, settings):
+    mod = obj.modifiers.new(settings.bevel_modifier_name, 'BEVEL')
+    mod.offset_type = 'OFFSET'
+    mod.width = settings.bevel_unit_value
+    mod.segments = settings.bevel_segment_value
+    mod.limit_method = settings.bevel_type
+    mod.miter_outer = 'MITER_ARC'
+    mod.miter_inner = 'MITER_SHARP'
+    mod.use_clamp_overlap = False
+    mod.loop_slide = True
+    return mod
 
 
 class TMC_OP_BevelCustomSetting(bpy.types.Operator):
@@ -9,49 +87,32 @@ class TMC_OP_BevelCustomSetting(bpy.types.Operator):
 
     def execute(self, context):
         # Get the custom bevel settings from the scene properties
+        settings = context.scene.hstool.modifier
         is_exists = False
         obj = context.active_object
         for mod in obj.modifiers:
             if mod.type == "BEVEL":
-                if mod.name == context.scene.bevel_modifier_name:
+                if mod.name == settings.bevel_modifier_name:
                     is_exists = True
                     break
         if not is_exists:
             # Create Bevel Vertex Group Modifier
-            mod = obj.modifiers.new(context.scene.bevel_modifier_name, 'BEVEL')
-            mod.offset_type = 'OFFSET'
-            mod.width = context.scene.bevel_unit_value
-            mod.segments = context.scene.bevel_segment_value
-            mod.limit_method = context.scene.bevel_type
-            mod.miter_outer = 'MITER_ARC'
-            mod.miter_inner = 'MITER_SHARP'
-            mod.use_clamp_overlap = False
-            mod.loop_slide = True
-            if context.scene.bevel_type == "VGROUP":
+            mod = new_bevel_modifier(obj, settings)
+            if settings.bevel_type == "VGROUP":
                 # Create Vertex Group
-                new_vertex_group = bpy.context.object.vertex_groups.new(name=context.scene.bevel_modifier_name)
+                new_vertex_group = bpy.context.object.vertex_groups.new(name=settings.bevel_modifier_name)
                 bpy.ops.object.vertex_group_assign()
                 mod.vertex_group = new_vertex_group.name
-            elif context.scene.bevel_type == "WEIGHT":
-                mode = bpy.context.active_object.mode
-                if mode != 'OBJECT':
-                    # we need to switch from Edit mode to Object mode so the selection gets updated
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    obj = bpy.context.active_object
-                    obj_data = obj.evaluated_get(bpy.context.evaluated_depsgraph_get()).data
-                    # create bevel weight edge data
-                    if 'bevel_weight_edge' not in obj_data.attributes:
-                        obj.data.attributes.new(
-                            name='bevel_weight_edge',
-                            type='FLOAT',
-                            domain='EDGE'
-                        )
-                    for index, edge in enumerate(obj.data.edges):
-                        if edge.select:
-                            obj.data.attributes['bevel_weight_edge'].data[index].value = 1.0
-                    # back to whatever mode we were in
-                    bpy.ops.object.mode_set(mode=mode)
-            elif context.scene.bevel_type == "ANGLE":
+            elif settings.bevel_type == "WEIGHT":
+                # Weight the selected edges of all selected meshes; each gets the modifier too
+                objects = _selected_mesh_objects(context)
+                if obj not in objects:
+                    objects.append(obj)
+                for other in objects:
+                    if other is not obj and other.modifiers.get(settings.bevel_modifier_name) is None:
+                        new_bevel_modifier(other, settings)
+                set_bevel_weight(objects, 1.0)
+            elif settings.bevel_type == "ANGLE":
                 mod.angle_limit = 1.0471975512 # 60 Degrees
         else:
             controller.show_message(context, "ERROR", "This name already exists. Please enter another name!")
@@ -63,20 +124,10 @@ class TMC_OP_GetBevelModifiersFromVertex(bpy.types.Operator):
     bl_description = "Get bevel modifiers from vertex"
 
     def execute(self, context):
-        vtg_list = []
         have_vertex_group_bevel = False
-        obj = bpy.context.selected_objects[0]
-        # Get selected verties
-        edit_mode = bpy.context.active_object.mode
-        bpy.ops.object.mode_set(mode='OBJECT')
-        selected_vertices = [v.index for v in bpy.context.active_object.data.vertices if v.select]
-        bpy.ops.object.mode_set(mode=edit_mode)
-    
-        for vert in selected_vertices:
-            for group in obj.vertex_groups:
-                vert_in_group = [vert.index for vert in obj.data.vertices if group.index in [i.group for i in vert.groups]]
-                if vert in vert_in_group and group.name not in vtg_list:
-                    vtg_list.append(group.name)
+        obj = context.active_object
+        # Groups of the selected vertices, read from the live edit mesh (no mode toggle needed)
+        vtg_list = groups_in_membership(obj, group_membership(obj, selected_only=True))
 
         modifier_list = obj.modifiers
         for mod in modifier_list:
@@ -1,13 +1,21 @@
 import bpy, traceback
+import time
 
 from ..utility.mouse import mouse_warp
 from ..utility.draw import draw_quad, draw_text, get_blf_text_dims
 from ..ui import controller
+from ..utility.modifier_index import find_modifier_users
+
+BOOLEAN_COLLECTION_NAME = "HS_Boolean"
+# Exact handles coplanar/non-manifold cutters well but scales poorly; above this many cutters use Fast
+BOOLEAN_FAST_SOLVER_THRESHOLD = 8
+# Modifier settings a consolidated run must share; they are copied onto the merged boolean
+BOOLEAN_RUN_SETTINGS = ('solver', 'use_self', 'use_hole_tolerant', 'double_threshold', 'show_render')
 
 class TMC_OP_Boolean(bpy.types.Operator):
     bl_idname = "tmc.boolean"
     bl_label = "Boolean"
-    bl_description = "Fast Boolean Union"
+    bl_description = "Fast Boolean Difference. With several cutters selected they share one collection boolean on the active object"
     bl_options = {"REGISTER", "UNDO"}
 
     @classmethod
@@ -17,64 +25,209 @@ class TMC_OP_Boolean(bpy.types.Operator):
             if context.active_object.type == 'MESH':
                 if sel:
                     active = context.view_layer.objects.active
-                    if active in sel and len(sel) == 2:
+                    if active in sel and len(sel) >= 2:
                         return True
         return False
 
     def execute(self, context):
         sel = list(context.selected_objects)
         active = context.view_layer.objects.active
-        boolean_obj = [o for o in sel if o is not active][0] 
-
-        # set "Display as" of boolean object to "Wire"
-        boolean_obj.display_type = 'WIRE'
+        cutters = [o for o in sel if o is not active]
+        boolean_collection = get_boolean_collection(context)
 
-        # create a collection for booleans if it doesn't exist
-        boolean_collection_name = "HS_Boolean"
-        if boolean_collection_name not in bpy.data.collections:
-            boolean_collection = bpy.data.collections.new(boolean_collection_name)
-            context.scene.collection.children.link(boolean_collection)
-        # else get the collection
+        if len(cutters) == 1:
+            # add boolean modifier
+            modifier = active.modifiers.new('Boolean', 'BOOLEAN')
+            modifier.operation = 'DIFFERENCE'
+            modifier.object = cutters[0]
+            stash_cutter(cutters[0], boolean_collection, active)
         else:
-            boolean_collection = bpy.data.collections[boolean_collection_name]
+            # one collection operand for every cutter instead of a modifier per cutter
+            modifier, cutter_collection = get_cutter_modifier(active, boolean_collection)
+            for cutter in cutters:
+                stash_cutter(cutter, cutter_collection, active)
+            set_boolean_solver(modifier, len(cutter_collection.all_objects))
 
-        # add boolean modifier
-        modifier = active.modifiers.new('Boolean', 'BOOLEAN')
-        modifier.operation = 'DIFFERENCE'
-        modifier.object = boolean_obj
+        # deselect all, set active object to active
+        bpy.ops.object.select_all(action='DESELECT')
+        active.select_set(True)
 
-        # move the boolean object to the boolean collection
-        # Safely move the boolean object into the boolean collection.
-        # Capture original collections first, then link to the target
-        # and unlink from the originals (but don't unlink the target).
-        try:
-            orig_cols = list(boolean_obj.users_collection)
-        except Exception:
-            orig_cols = []
+        # hide the collection in viewport
+        context.view_layer.layer_collection.children.get(BOOLEAN_COLLECTION_NAME).hide_viewport = True
+
+        return {'FINISHED'}
+
+class TMC_OP_ConsolidateBoolean(bpy.types.Operator):
+    bl_idname = "tmc.consolidate_boolean"
+    bl_label = "Consolidate Boolean"
+    bl_description = "Merge consecutive per-object Difference booleans of the active object into collection booleans"
+    bl_options = {"REGISTER", "UNDO"}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj is not None and obj.type == 'MESH' and context.mode == 'OBJECT'
+
+    def execute(self, context):
+        obj = context.active_object
+        runs = get_consolidate_runs(obj)
+        if not runs:
+            controller.show_message(context, "ERROR", "No consecutive Difference booleans to merge!")
+            return {'CANCELLED'}
+        before = measure_evaluation(context, obj)
+        boolean_collection = get_boolean_collection(context)
+        merged = 0
+        # back to front so earlier indices stay valid
+        for run in reversed(runs):
+            index = list(obj.modifiers).index(run[0])
+            cutter_collection = bpy.data.collections.new("HS_Cutters_" + obj.name)
+            boolean_collection.children.link(cutter_collection)
+            for mod in run:
+                if mod.object.name not in cutter_collection.objects:
+                    cutter_collection.objects.link(mod.object)
+            names = [mod.name for mod in run]
+            settings = boolean_run_settings(run[0])
+            for name in names:
+                obj.modifiers.remove(obj.modifiers[name])
+            modifier = obj.modifiers.new(CUTTER_MODIFIER_NAME, 'BOOLEAN')
+            modifier.operation = 'DIFFERENCE'
+            modifier.operand_type = 'COLLECTION'
+            modifier.collection = cutter_collection
+            # keep the run's own solver and options so the result matches the modifiers it replaces
+            for attr, value in zip(BOOLEAN_RUN_SETTINGS, settings):
+                if value is not None:
+                    setattr(modifier, attr, value)
+            obj.modifiers.move(len(obj.modifiers) - 1, index)
+            merged += len(run)
+        after = measure_evaluation(context, obj)
+        controller.show_message(context, "INFO", "Consolidate: %d booleans -> %d, evaluation %.1f ms -> %.1f ms"
+                                % (merged, len(runs), before * 1000, after * 1000))
+        return {'FINISHED'}
+
+#region Boolean helpers
+CUTTER_MODIFIER_NAME = "HS_Cutters"
+
+def get_boolean_collection(context):
+    # create a collection for booleans if it doesn't exist
+    if BOOLEAN_COLLECTION_NAME not in bpy.data.collections:
+        boolean_collection = bpy.data.collections.new(BOOLEAN_COLLECTION_NAME)
+        context.scene.collection.children.link(boolean_collection)
+    # else get the collection
+    else:
+        boolean_collection = bpy.data.collections[BOOLEAN_COLLECTION_NAME]
+    return boolean_collection
+
+def get_cutter_modifier(active, boolean_collection):
+    '''The active object's collection boolean (created on first use) and its cutter collection'''
+    modifier = active.modifiers.get(CUTTER_MODIFIER_NAME)
+    if modifier and modifier.type == 'BOOLEAN' and modifier.operand_type == 'COLLECTION' and modifier.collection:
+        return modifier, modifier.collection
+    cutter_collection = bpy.data.collections.new("HS_Cutters_" + active.name)
+    boolean_collection.children.link(cutter_collection)
+    modifier = active.modifiers.new(CUTTER_MODIFIER_NAME, 'BOOLEAN')
+    modifier.operation = 'DIFFERENCE'
+    modifier.operand_type = 'COLLECTION'
+    modifier.collection = cutter_collection
+    return modifier, cutter_collection
+
+def set_boolean_solver(modifier, cutter_count):
+    if cutter_count <= BOOLEAN_FAST_SOLVER_THRESHOLD:
+        modifier.solver = 'EXACT'
+        return
+    try:
+        modifier.solver = 'FAST'
+    except TypeError:
+        # renamed in newer Blender versions
+        modifier.solver = 'FLOAT'
+
+def stash_cutter(boolean_obj, target_collection, active):
+    # set "Display as" of boolean object to "Wire"
+    boolean_obj.display_type = 'WIRE'
+
+    # move the boolean object to the target collection
+    # Safely move the boolean object into the target collection.
+    # Capture original collections first, then link to the target
+    # and unlink from the originals (but don't unlink the target).
+    try:
+        orig_cols = list(boolean_obj.users_collection)
+    except Exception:
+        orig_cols = []
+    try:
+        if target_collection not in boolean_obj.users_collection:
+            target_collection.objects.link(boolean_obj)
+    except Exception:
+        pass
+    # Unlink from original collections except the target collection
+    for col in orig_cols:
         try:
-            if boolean_collection not in boolean_obj.users_collection:
-                boolean_collection.objects.link(boolean_obj)
+            if col is target_collection:
+                continue
+            if boolean_obj.name in col.objects:
+                col.objects.unlink(boolean_obj)
         except Exception:
             pass
-        # Unlink from original collections except the boolean collection
-        for col in orig_cols:
-            try:
-                if col is boolean_collection:
-                    continue
-                if boolean_obj.name in col.objects:
-                    col.objects.unlink(boolean_obj)
-            except Exception:
-                pass
-
-        # parent boolean object to main object but keep transform
+
+    # parent boolean object to main object but keep transform
+    if boolean_obj.parent is not active:
         boolean_obj.parent = active
         boolean_obj.matrix_parent_inverse = active.matrix_world.inverted()
 
-        # deselect all, set active object to active
-        bpy.ops.object.select_all(action='DESELECT')
-        active.select_set(True)
+def boolean_run_settings(mod):
+    return tuple(getattr(mod, attr, None) for attr in BOOLEAN_RUN_SETTINGS)
 
-        # hide the collection in viewport
-        context.view_layer.layer_collection.children.get(boolean_collection_name).hide_viewport = True
+def get_consolidate_runs(obj):
+    '''Consecutive enabled object-operand Difference booleans (2+ long) sharing the same
+    BOOLEAN_RUN_SETTINGS; differences commute with each other, so each run can become a
+    single collection boolean'''
+    runs = []
+    run = []
+    for mod in obj.modifiers:
+        if (mod.type == 'BOOLEAN' and mod.operand_type == 'OBJECT' and mod.operation == 'DIFFERENCE'
+                and mod.object is not None and mod.show_viewport):
+            if run and boolean_run_settings(mod) != boolean_run_settings(run[0]):
+                # different solver or options: close the current run, start a new one here
+                if len(run) > 1:
+                    runs.append(run)
+                run = []
+            run.append(mod)
+            continue
+        if len(run) > 1:
+            runs.append(run)
+        run = []
+    if len(run) > 1:
+        runs.append(run)
+    return runs
+
+def measure_evaluation(context, obj):
+    '''Seconds the depsgraph takes to re-evaluate obj's modifier stack'''
+    obj.update_tag(refresh={'DATA'})
+    start = time.perf_counter()
+    context.view_layer.update()
+    return time.perf_counter() - start
+#endregion
+
+class TMC_OP_SelectCutterUsers(bpy.types.Operator):
+    bl_idname = "tmc.select_cutter_users"
+    bl_label = "Select Cutter Users"
+    bl_description = "Select every object whose Boolean modifier uses the selected cutters"
+    bl_options = {"REGISTER", "UNDO"}
 
-        return {'FINISHED'}
\ No newline at end of file
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and len(context.selected_objects) > 0
+
+    def execute(self, context):
+        cutters = list(context.selected_objects)
+        users = []
+        for cutter in cutters:
+            users += [obj for obj, mod in find_modifier_users(cutter, 'BOOLEAN') if obj not in users]
+        if not users:
+            controller.show_message(context, "ERROR", "No object uses the selected cutters!")
+            return {'CANCELLED'}
+        for cutter in cutters:
+            cutter.select_set(False)
+        for obj in users:
+            if obj.visible_get():
+                obj.select_set(True)
+        context.view_layer.objects.active = users[0]
+        return {'FINISHED'}
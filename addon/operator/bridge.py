@@ -1,7 +1,13 @@
 import os
+import re
+import json
+import time
+import hashlib
 import bpy
+import numpy as np
 from ..ui import controller
 from ..utility import variable
+from ..utility.system import default_exchange_dir
 
 class TMC_OP_ImportFromMaya(bpy.types.Operator):
     bl_idname = "tmc.import_from_maya"
@@ -9,7 +15,7 @@ class TMC_OP_ImportFromMaya(bpy.types.Operator):
     bl_description = "Import from Maya"
 
     def execute(self, context):
-        maya_to_blender_function(self, context, variable.BLENDER_MAYA_MAX_FBX_PATH)
+        maya_to_blender_function(self, context, os.path.join(get_bridge_dir(context), variable.BLENDER_MAYA_MAX_FBX_NAME))
         return {'FINISHED'}
 
 class TMC_OP_ExportToMaya(bpy.types.Operator):
@@ -18,16 +24,18 @@ class TMC_OP_ExportToMaya(bpy.types.Operator):
     bl_description = "Export to Maya"
 
     def execute(self, context):
-        blender_to_maya_function(self, context, variable.BLENDER_MAYA_MAX_FBX_PATH)
+        blender_to_maya_function(self, context, get_bridge_dir(context))
         return {'FINISHED'}
 
 #region Support Function    
-def set_up_fbx_path(self):
-    folder_path = r'C:/Blender_ImportExport'
-    if not os.path.exists(folder_path):
-        os.makedirs(folder_path)
+BRIDGE_MANIFEST_NAME = "manifest.json"
+BRIDGE_OBJECT_DIR = "objects"
+BRIDGE_CACHE_KEEP_SERIALS = 10  # exports a cached object may be left out of before it is pruned
 
-    return (folder_path)    
+def get_bridge_dir(context):
+    folder_path = bpy.path.abspath(context.scene.hstool.bridge.bridge_cache_path) if context.scene.hstool.bridge.bridge_cache_path else default_exchange_dir()
+    os.makedirs(os.path.join(folder_path, BRIDGE_OBJECT_DIR), exist_ok=True)
+    return folder_path
 
 def get_object_names(self, assets_path):
     names = []
@@ -35,54 +43,178 @@ def get_object_names(self, assets_path):
         names = [name for name in data_from.objects]
     return names
 
-def blender_to_maya_function(self, context, temp_file):
-    set_up_fbx_path(self)
-    if context.scene.blender_maya_normal_radiobox == "Lock":
+def object_file_name(name):
+    safe = re.sub(r'[^\w\-]', '_', name)
+    if safe != name:
+        # keep "a.b" and "a_b" from sharing a cache file
+        safe += "_" + hashlib.sha1(name.encode('utf-8')).hexdigest()[:6]
+    return safe + ".fbx"
+
+def _hash_foreach(h, collection, attr, dtype, width=1):
+    try:
+        data = np.empty(len(collection) * width, dtype=dtype)
+        collection.foreach_get(attr, data)
+        h.update(data.tobytes())
+    except (AttributeError, TypeError, RuntimeError):
+        pass
+
+def object_hash(obj, depsgraph, settings):
+    '''Hash of what the FBX would contain: export settings, transform and evaluated geometry'''
+    h = hashlib.sha1()
+    h.update(repr(settings).encode('utf-8'))
+    h.update(obj.type.encode('utf-8'))
+    h.update(np.array(obj.matrix_world, dtype=np.float64).tobytes())
+    h.update((obj.parent.name if obj.parent else "").encode('utf-8'))
+    if obj.type != 'MESH':
+        return h.hexdigest()
+    ob_eval = obj.evaluated_get(depsgraph)
+    me = ob_eval.to_mesh()
+    try:
+        _hash_foreach(h, me.vertices, 'co', np.float32, 3)
+        _hash_foreach(h, me.loops, 'vertex_index', np.int32)
+        _hash_foreach(h, me.polygons, 'loop_total', np.int32)
+        _hash_foreach(h, me.polygons, 'use_smooth', bool)
+        _hash_foreach(h, me.polygons, 'material_index', np.int32)
+        _hash_foreach(h, me.edges, 'use_edge_sharp', bool)
+        for uv_layer in me.uv_layers:
+            h.update(uv_layer.name.encode('utf-8'))
+            _hash_foreach(h, uv_layer.data, 'uv', np.float32, 2)
+        h.update("|".join(m.name if m else "" for m in me.materials).encode('utf-8'))
+    finally:
+        ob_eval.to_mesh_clear()
+    return h.hexdigest()
+
+def load_manifest(manifest_path):
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def write_manifest(manifest_path, manifest):
+    # Write then rename, so the receiving side never reads a half-written manifest
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, manifest_path)
+
+def prune_cache(cache, cache_dir, serial):
+    '''Drop cache entries of objects that no longer exist, or that were left out of the last
+    BRIDGE_CACHE_KEEP_SERIALS exports, and delete their files. Returns the removed names.'''
+    removed = []
+    for name, entry in list(cache.items()):
+        # entries from manifests older than the "serial" field count as seen by the last export
+        last_seen = entry.get("serial", serial - 1)
+        if name in bpy.data.objects and serial - last_seen <= BRIDGE_CACHE_KEEP_SERIALS:
+            continue
+        del cache[name]
+        removed.append(name)
+        if any(other["file"] == entry["file"] for other in cache.values()):
+            continue
+        try:
+            os.remove(os.path.join(cache_dir, entry["file"]))
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print("Export to Maya could not remove", entry["file"], ":", e)
+    return sorted(removed)
+
+def export_fbx(context, filepath, objects, lock_normal, axis_forward, axis_up):
+    # Override the selection instead of changing it, one object per file
+    with context.temp_override(selected_objects=objects, selected_editable_objects=objects):
+        bpy.ops.export_scene.fbx(filepath=filepath,
+                                    check_existing=False,
+                                    filter_glob="*.fbx",
+                                    use_selection=True,
+                                    use_active_collection=False,
+                                    global_scale=1,
+                                    apply_unit_scale=True,
+                                    apply_scale_options='FBX_SCALE_ALL',
+                                    bake_space_transform=True,
+                                    object_types={'MESH','EMPTY'},
+                                    use_mesh_modifiers=True,
+                                    use_mesh_modifiers_render=True,
+                                    mesh_smooth_type=lock_normal,
+                                    use_mesh_edges=False,
+                                    use_tspace=False,
+                                    use_custom_props=False,
+                                    add_leaf_bones=False,
+                                    primary_bone_axis='Y',
+                                    secondary_bone_axis='X',
+                                    use_armature_deform_only=False,
+                                    armature_nodetype='NULL',
+                                    bake_anim=False,
+                                    bake_anim_use_all_bones=False,
+                                    bake_anim_use_nla_strips=False,
+                                    bake_anim_use_all_actions=False,
+                                    bake_anim_force_startend_keying=False,
+                                    bake_anim_step=1,
+                                    bake_anim_simplify_factor=1,
+                                    path_mode='AUTO',
+                                    embed_textures=False,
+                                    batch_mode='OFF',
+                                    use_batch_own_dir=True,
+                                    use_metadata=True,
+                                    axis_forward=axis_forward,
+                                    axis_up=axis_up)
+
+def blender_to_maya_function(self, context, cache_dir):
+    '''Export the selection as one FBX per object into cache_dir/objects.
+    Objects whose geometry/transform hash matches the cache are not re-exported, and
+    manifest.json lists the transfer set plus the "changed" and "removed" deltas for the receiving side.'''
+    if context.scene.hstool.bridge.blender_maya_normal_radiobox == "Lock":
         lock_normal = 'OFF'
     else:
         lock_normal = 'EDGE'
-    #axis_forward = context.scene.blender_maya_axis_forward_combobox
-    #axis_up = context.scene.blender_maya_axis_up_combobox
+    #axis_forward = context.scene.hstool.bridge.blender_maya_axis_forward_combobox
+    #axis_up = context.scene.hstool.bridge.blender_maya_axis_up_combobox
     axis_up = 'Z'
     axis_forward = 'Y'
+    settings = (lock_normal, axis_forward, axis_up)
+
+    manifest_path = os.path.join(cache_dir, BRIDGE_MANIFEST_NAME)
+    previous = load_manifest(manifest_path)
+    cache = previous.get("cache", {})
+    serial = previous.get("serial", 0) + 1
+    depsgraph = context.evaluated_depsgraph_get()
 
-    bpy.ops.export_scene.fbx(filepath=temp_file,
-                                check_existing=True,
-                                filter_glob="*.fbx",
-                                use_selection=True,
-                                use_active_collection=False,
-                                global_scale=1,
-                                apply_unit_scale=True,
-                                apply_scale_options='FBX_SCALE_ALL',
-                                bake_space_transform=True,
-                                object_types={'MESH','EMPTY'},
-                                use_mesh_modifiers=True,
-                                use_mesh_modifiers_render=True,
-                                mesh_smooth_type=lock_normal,
-                                use_mesh_edges=False,
-                                use_tspace=False,
-                                use_custom_props=False,
-                                add_leaf_bones=False,
-                                primary_bone_axis='Y',
-                                secondary_bone_axis='X',
-                                use_armature_deform_only=False,
-                                armature_nodetype='NULL',
-                                bake_anim=False,
-                                bake_anim_use_all_bones=False,
-                                bake_anim_use_nla_strips=False,
-                                bake_anim_use_all_actions=False,
-                                bake_anim_force_startend_keying=False,
-                                bake_anim_step=1,
-                                bake_anim_simplify_factor=1,
-                                path_mode='AUTO',
-                                embed_textures=False,
-                                batch_mode='OFF',
-                                use_batch_own_dir=True,
-                                use_metadata=True,
-                                axis_forward=axis_forward,
-                                axis_up=axis_up)
-    
-    controller.show_message(context, "INFO", "Export: Done!")
+    objects = [o for o in context.selected_objects if o.type in {'MESH', 'EMPTY'}]
+    changed = []
+    failed = []
+    for obj in objects:
+        digest = object_hash(obj, depsgraph, settings)
+        rel_path = BRIDGE_OBJECT_DIR + "/" + object_file_name(obj.name)
+        entry = cache.get(obj.name)
+        if entry and entry.get("hash") == digest and os.path.isfile(os.path.join(cache_dir, entry["file"])):
+            entry["serial"] = serial
+            continue
+        try:
+            export_fbx(context, os.path.join(cache_dir, rel_path), [obj], lock_normal, axis_forward, axis_up)
+        except RuntimeError as e:
+            failed.append(obj.name)
+            print("Export to Maya failed for", obj.name, ":", e)
+            continue
+        cache[obj.name] = {"file": rel_path, "hash": digest, "serial": serial}
+        changed.append(obj.name)
+    removed = prune_cache(cache, cache_dir, serial)
+
+    write_manifest(manifest_path, {
+        "version": 1,
+        "serial": serial,
+        "time": time.time(),
+        "axis_forward": axis_forward,
+        "axis_up": axis_up,
+        "objects": [o.name for o in objects if o.name in cache],
+        "changed": changed,
+        "removed": removed,
+        "cache": cache,
+    })
+
+    message = "Export: " + str(len(changed)) + " changed, " + str(len(objects) - len(changed) - len(failed)) + " cached"
+    if failed:
+        controller.show_message(context, "ERROR", message + ", " + str(len(failed)) + " failed: " + ", ".join(failed))
+    else:
+        controller.show_message(context, "INFO", message)
 
 def maya_to_blender_function(self, context, temp_file):
     if os.path.isfile(temp_file) == True:
@@ -158,9 +158,9 @@ def check_mesh_no_tris_function(self, context):
             for obj in err_obj:
                 obj.select_set(True)
             # Change button icon
-            context.scene.check_mesh_no_tris = False
+            context.scene.hstool.check.check_mesh_no_tris = False
         else:
-            context.scene.check_mesh_no_tris = True
+            context.scene.hstool.check.check_mesh_no_tris = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -198,9 +198,9 @@ def check_ngons_face_function(self, context):
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_mode(type='FACE')
             # Change button icon
-            context.scene.check_ngons_face = False
+            context.scene.hstool.check.check_ngons_face = False
         else:
-            context.scene.check_ngons_face = True
+            context.scene.hstool.check.check_ngons_face = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -238,9 +238,9 @@ def check_non_manifold_function(self, context):
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_mode(type='VERT')
             # Change button icon
-            context.scene.check_non_manifold = False
+            context.scene.hstool.check.check_non_manifold = False
         else:
-            context.scene.check_non_manifold = True
+            context.scene.hstool.check.check_non_manifold = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -292,9 +292,9 @@ def check_intersect_face_function(self, context):
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_mode(type='FACE')
             # Change button icon
-            context.scene.check_intersect_face = False
+            context.scene.hstool.check.check_intersect_face = False
         else:
-            context.scene.check_intersect_face = True
+            context.scene.hstool.check.check_intersect_face = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -305,7 +305,7 @@ def check_zero_edge_length_function(self, context):
     if selection:
         err_obj = []
         # check small edge
-        tolerance = context.scene.min_edge_length_value  # increase to something like .1 or 1 to ignore small edge
+        tolerance = context.scene.hstool.check.min_edge_length_value  # increase to something like .1 or 1 to ignore small edge
         for obj in selection:
             bpy.ops.object.select_all(action='DESELECT')
             obj.select_set(True)
@@ -344,9 +344,9 @@ def check_zero_edge_length_function(self, context):
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_mode(type='EDGE')
             # Change button icon
-            context.scene.check_zero_edge_length = False
+            context.scene.hstool.check.check_zero_edge_length = False
         else:
-            context.scene.check_zero_edge_length = True
+            context.scene.hstool.check.check_zero_edge_length = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -357,7 +357,7 @@ def check_zero_face_area_function(self, context):
     if selection:
         err_obj = []
         # check small edge
-        tolerance = context.scene.min_face_area_value  # increase to something like .001 or .00001 to ignore small face
+        tolerance = context.scene.hstool.check.min_face_area_value  # increase to something like .001 or .00001 to ignore small face
         for obj in selection:
             bpy.ops.object.select_all(action='DESELECT')
             obj.select_set(True)
@@ -396,9 +396,9 @@ def check_zero_face_area_function(self, context):
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_mode(type='FACE')
             # Change button icon
-            context.scene.check_zero_face_area = False
+            context.scene.hstool.check.check_zero_face_area = False
         else:
-            context.scene.check_zero_face_area = True
+            context.scene.hstool.check.check_zero_face_area = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -436,9 +436,9 @@ def check_isolated_vertex_function(self, context):
             bpy.ops.object.mode_set(mode='EDIT')
             bpy.ops.mesh.select_mode(type='VERT')
             # Change button icon
-            context.scene.check_isolated_vertex = False
+            context.scene.hstool.check.check_isolated_vertex = False
         else:
-            context.scene.check_isolated_vertex = True
+            context.scene.hstool.check.check_isolated_vertex = True
         return err_obj
     else:
         controller.show_message(context, "ERROR", "Please select object to checking!")
@@ -470,9 +470,9 @@ class TMC_OP_CheckZeroUVSet(bpy.types.Operator):
             for obj in err_obj:
                 obj.select_set(True)
             # Change button icon
-            context.scene.check_zero_uvset = False
+            context.scene.hstool.check.check_zero_uvset = False
         else:
-            context.scene.check_zero_uvset = True
+            context.scene.hstool.check.check_zero_uvset = True
         return {'FINISHED'}
 
 def preview_silhouette_function(self, context):
@@ -495,7 +495,7 @@ def preview_silhouette_function(self, context):
                         space.shading.single_color = bg_black
                         # Background
                         space.shading.background_type = bg_types[2]
-                        space.shading.background_color = list(context.scene.viewport_background_color)
+                        space.shading.background_color = list(context.scene.hstool.check.viewport_background_color)
                         # Overlays
                         bpy.context.space_data.overlay.show_overlays = False
 
@@ -35,36 +35,95 @@ class TMC_OP_ToggleCurrentHideGroup(bpy.types.Operator):
     bl_label = "Toggle Current Hide Group"
     bl_description = "Toggle Current Hide Group"
 
-    def getChildrenCollectionRecursion(self, result_list, collection_list):
-        for children_collection in collection_list:
-            result_list.append(children_collection)
-            self.getChildrenCollectionRecursion(result_list, children_collection.children)
-
     def execute(self, context):
         # Fetch the area
-        outliner = next(a for a in bpy.context.screen.areas if a.type == "OUTLINER") 
-        outliner.spaces[0].show_restrict_column_viewport = True
-
-        #Get all Layer Collection
-        result_list = []
-        children_list = bpy.context.view_layer.layer_collection.children
-        self.getChildrenCollectionRecursion(result_list, children_list)
-        if variable.UNHIDE_COLLECTION_BOOL == True:
-            variable.HIDE_COLLECTION_LIST = []
-            for collection in result_list:
-                if collection.hide_viewport == True or bpy.data.collections[collection.name].hide_viewport == True:
-                    collection.hide_viewport = False
-                    bpy.data.collections[collection.name].hide_viewport = False
-                    variable.HIDE_COLLECTION_LIST.append(collection)
-                collection.exclude = False
-                bpy.data.collections[collection.name].hide_select = False
-                bpy.data.collections[collection.name].hide_render = False
+        outliner = next((a for a in bpy.context.screen.areas if a.type == "OUTLINER"), None)
+        if outliner:
+            outliner.spaces[0].show_restrict_column_viewport = True
+
+        # Snapshot pending for this view layer -> restore it, otherwise unhide everything and take one
+        if get_hide_snapshot(context) is None:
+            unhide_all_collections(context)
         else:
-            for collection in variable.HIDE_COLLECTION_LIST:
-                collection.hide_viewport = True
-                bpy.data.collections[collection.name].hide_viewport = True
-                collection.exclude = False
-                bpy.data.collections[collection.name].hide_select = False
-                bpy.data.collections[collection.name].hide_render = False
-        variable.UNHIDE_COLLECTION_BOOL = not variable.UNHIDE_COLLECTION_BOOL
-        return {'FINISHED'}
\ No newline at end of file
+            restore_hidden_collections(context)
+        return {'FINISHED'}
+
+#region Collection hide snapshot
+# Stored as scene custom property {view layer name: {collection name: flags}} so it survives undo
+# and reloads; holds only the collections that were hidden when the snapshot was taken.
+HIDE_SNAPSHOT_PROP = "hs_hide_snapshot"
+HIDE_LAYER = 1       # LayerCollection.hide_viewport
+HIDE_COLLECTION = 2  # Collection.hide_viewport
+HIDE_EXCLUDE = 4     # LayerCollection.exclude
+
+def iter_layer_collections(view_layer):
+    '''Every LayerCollection under the view layer, one iterative traversal'''
+    stack = list(view_layer.layer_collection.children)
+    while stack:
+        layer_collection = stack.pop()
+        yield layer_collection
+        stack.extend(layer_collection.children)
+
+def get_hide_snapshot(context):
+    snapshots = context.scene.get(HIDE_SNAPSHOT_PROP)
+    if snapshots is None or context.view_layer.name not in snapshots:
+        return None
+    return snapshots[context.view_layer.name].to_dict()
+
+def _set_hide_snapshot(context, snapshot):
+    snapshots = context.scene.get(HIDE_SNAPSHOT_PROP)
+    snapshots = snapshots.to_dict() if snapshots is not None else {}
+    if snapshot is None:
+        snapshots.pop(context.view_layer.name, None)
+    else:
+        snapshots[context.view_layer.name] = snapshot
+    if snapshots:
+        context.scene[HIDE_SNAPSHOT_PROP] = snapshots
+    elif HIDE_SNAPSHOT_PROP in context.scene:
+        del context.scene[HIDE_SNAPSHOT_PROP]
+
+def _hide_flags(layer_collection, collection):
+    return ((HIDE_LAYER if layer_collection.hide_viewport else 0)
+            | (HIDE_COLLECTION if collection.hide_viewport else 0)
+            | (HIDE_EXCLUDE if layer_collection.exclude else 0))
+
+def _show_collection(layer_collection, collection):
+    # Only write flags that differ; every RNA write tags the view layer for a resync
+    if collection.hide_select:
+        collection.hide_select = False
+    if collection.hide_render:
+        collection.hide_render = False
+
+def unhide_all_collections(context):
+    snapshot = {}
+    for layer_collection in iter_layer_collections(context.view_layer):
+        collection = layer_collection.collection
+        flags = _hide_flags(layer_collection, collection)
+        if flags:
+            snapshot[collection.name] = flags
+            if layer_collection.hide_viewport:
+                layer_collection.hide_viewport = False
+            if collection.hide_viewport:
+                collection.hide_viewport = False
+            if layer_collection.exclude:
+                layer_collection.exclude = False
+        _show_collection(layer_collection, collection)
+    _set_hide_snapshot(context, snapshot)
+
+def restore_hidden_collections(context):
+    snapshot = get_hide_snapshot(context) or {}
+    if snapshot:
+        for layer_collection in iter_layer_collections(context.view_layer):
+            collection = layer_collection.collection
+            flags = snapshot.get(collection.name)
+            if not flags:
+                continue
+            # put back exactly the flags that were set, writing only the ones that differ
+            if layer_collection.hide_viewport != bool(flags & HIDE_LAYER):
+                layer_collection.hide_viewport = bool(flags & HIDE_LAYER)
+            if collection.hide_viewport != bool(flags & HIDE_COLLECTION):
+                collection.hide_viewport = bool(flags & HIDE_COLLECTION)
+            if layer_collection.exclude != bool(flags & HIDE_EXCLUDE):
+                layer_collection.exclude = bool(flags & HIDE_EXCLUDE)
+    _set_hide_snapshot(context, None)
+#endregion
@@ -1,5 +1,6 @@
 import bpy
 import bmesh
+import numpy as np
 from bpy.props import EnumProperty, BoolProperty, IntProperty
 from bpy_extras.view3d_utils import (
     region_2d_to_origin_3d,
@@ -16,7 +17,6 @@ from mathutils import Vector, Matrix, Quaternion
 from mathutils.geometry import (
     intersect_line_plane,
     intersect_point_line,
-    intersect_line_line,
     distance_point_to_plane,
 )
 from math import radians, degrees
@@ -27,7 +27,10 @@ from ..utility.draw import (
     draw_points,
     draw_vector,
     draw_label,
+    draw_batch,
+    register_batch,
 )
+from ..utility import frame_monitor
 
 # ===== UI constants / helpers =====
 axis_color = {
@@ -59,6 +62,54 @@ def _face_center(face):
     except Exception:
         return _avg([v.co for v in face.verts])
 
+# ----- vectorized geometry (rows = verts; rows without a result are NaN) -----
+_EPS = 1.1920929e-07  # FLT_EPSILON, same tolerance as mathutils.geometry
+
+def _dot(a, b):
+    return np.einsum('ij,ij->i', a, np.broadcast_to(b, a.shape))
+
+def _normalize(a):
+    n = np.linalg.norm(a, axis=-1, keepdims=True)
+    return np.divide(a, n, out=np.zeros_like(a), where=n > 0.0)
+
+def _isect_line_plane(p, d, plane_co, plane_no):
+    '''intersect_line_plane(p, p + d, plane_co, plane_no) for every row'''
+    denom = _dot(d, plane_no)
+    hit = np.abs(denom) > _EPS
+    t = _dot(plane_co - p, plane_no) / np.where(hit, denom, 1.0)
+    out = p + t[:, None] * d
+    out[~hit] = np.nan
+    return out
+
+def _isect_line_line(a, u, b, v):
+    '''intersect_line_line(a, a + u, b, b + v)[1]: closest point on the second line, per row'''
+    w = a - b
+    uu = _dot(u, u); uv = _dot(u, v); vv = _dot(v, v); uw = _dot(u, w); vw = _dot(v, w)
+    denom = uu * vv - uv * uv
+    hit = np.abs(denom) > _EPS
+    t = (uu * vw - uv * uw) / np.where(hit, denom, 1.0)
+    out = b + t[:, None] * v
+    out[~hit] = np.nan
+    return out
+
+def _closest_on_line(pt, p, d):
+    '''intersect_point_line(pt, p, p + d)[0] for every row'''
+    dd = _dot(d, d)
+    t = _dot(pt - p, d) / np.where(dd > 0.0, dd, 1.0)
+    return p + t[:, None] * d
+
+def _first_valid(*candidates):
+    '''Row-wise fallback chain: take each row from the first candidate that is not NaN'''
+    out = candidates[0].copy()
+    for c in candidates[1:]:
+        missing = np.isnan(out[:, 0])
+        out[missing] = c[missing]
+    return out
+
+def _apply_mx(co, mx):
+    m = np.array(mx)
+    return co @ m[:3, :3].T + m[:3, 3]
+
 def get_zoom_factor(context, depth_location, scale=10, ignore_obj_scale=False):
     center = Vector((context.region.width / 2, context.region.height / 2))
     offset = center + Vector((scale, 0))
@@ -252,16 +303,34 @@ class TMC_OP_EdgeConstraints(bpy.types.Operator):
             axis = self.transform_axis[-1]
             v = self.mx.col[axis_mapping_dict[axis]].xyz.normalized()
             draw_line([self.origin - v*1000, self.origin, self.origin + v*1000], width=1.0, color=(*axis_color[axis], 0.5), xray=0.75)
-        for ax in ['X','Y','Z']:
-            v = self.mx.col[axis_mapping_dict[ax]].xyz.normalized()
-            zf = self.zoom_factor
-            draw_line([self.origin + v*0.3*zf, self.origin + v*zf], width=1.0, color=(*axis_color[ax], 0.75))
+        draw_batch(self._get_axis_handle(), width=1.0)
         if self.is_direction_locking or (self.transform_mode=='SCALE' and self.is_axis_locking):
             draw_vector(self.scale, origin=self.origin, color=(1,1,1,0.6))
         elif not (self.is_zero_scaling and self.is_axis_locking):
             draw_line([self.origin, self.intersection], width=1.0, color=(0,0,0,0.5))
         # Old/previous lines are intentionally hidden unless debugging
 
+    def _get_axis_handle(self):
+        # The axis tripod only moves when the origin or zoom changes, so keep its batch retained
+        key = (tuple(self.origin), self.zoom_factor)
+        handle = getattr(self, '_axis_handle', None)
+        if handle is not None and self._axis_key == key:
+            return handle
+        coords = []; colors = []
+        for ax in ['X','Y','Z']:
+            v = self.mx.col[axis_mapping_dict[ax]].xyz.normalized()
+            zf = self.zoom_factor
+            coords.extend([self.origin + v*0.3*zf, self.origin + v*zf])
+            colors.extend([(*axis_color[ax], 0.75)] * 2)
+        indices = [(0,1), (2,3), (4,5)]
+        if handle is None:
+            handle = register_batch(coords, indices=indices, colors=colors)
+        else:
+            handle.update(coords, indices=indices, colors=colors)
+        self._axis_handle = handle
+        self._axis_key = key
+        return handle
+
     # ---------- modal ----------
     def modal(self, context, event):
         context.area.tag_redraw()
@@ -365,8 +434,8 @@ class TMC_OP_EdgeConstraints(bpy.types.Operator):
         if _STATUSBAR:
             self._draw_statusbar()
         args = (context, event)
-        self.VIEW3D = bpy.types.SpaceView3D.draw_handler_add(self.draw_VIEW3D, (), 'WINDOW', 'POST_VIEW')
-        self.HUD = bpy.types.SpaceView3D.draw_handler_add(self.draw_HUD, (args,), 'WINDOW', 'POST_PIXEL')
+        self.VIEW3D = frame_monitor.add_handler('edge_constraint.draw_VIEW3D', self.draw_VIEW3D, (), 'POST_VIEW')
+        self.HUD = frame_monitor.add_handler('edge_constraint.draw_HUD', self.draw_HUD, (args,), 'POST_PIXEL')
         context.window_manager.modal_handler_add(self)
         return {'RUNNING_MODAL'}
 
@@ -378,100 +447,127 @@ class TMC_OP_EdgeConstraints(bpy.types.Operator):
             self.locked_intersection = None
 
     def _build_selection_data(self, sequences):
+        """Per-sequence info goes in the returned dict (verts, edges, cyclic, origin, index range).
+        Per-vertex state is stored struct-of-arrays on self, row i matching self.verts[i]."""
         data = {}
         self.draw_face_align = False
         self.original_edge_coords = []
+        verts = []
+        prev_idx = []; next_idx = []; seq_of = []
+        init_co = []; init_no = []; init_cross = []
+        # side 0 = left, 1 = right
+        edge_dirs = []; has_edge = []; face_dirs = []; has_face_dir = []
+        seq_cyclic = []; seq_flat = []; seq_origin_local = []
+        mx_inv = self.mx.inverted_safe()
+        zero = Vector((0, 0, 0))
         for sidx, (seq, cyclic) in enumerate(sequences):
-            d = {'cyclic': cyclic, 'verts': seq, 'edges': [], 'origin': self.mx @ _avg([v.co for v in seq])}
+            start = len(verts)
+            count = len(seq)
+            d = {'cyclic': cyclic, 'verts': seq, 'edges': [], 'origin': self.mx @ _avg([v.co for v in seq]),
+                 'start': start, 'end': start + count}
             data[sidx] = d
             for vidx, v in enumerate(seq):
-                prev_v = seq[(vidx-1) % len(seq)]
-                next_v = seq[(vidx+1) % len(seq)]
-                d[v] = {
-                    'co': v.co.copy(), 'no': v.normal.copy(), 'dir': None, 'cross': None,
-                    'prev_vert': prev_v if cyclic or vidx>0 else None,
-                    'next_vert': next_v if cyclic or vidx < len(seq)-1 else None,
-                    'prev_edge': None, 'next_edge': None,
-                    'loop': None, 'left_face': None, 'right_face': None,
-                    'left_edge': None, 'left_edge_dir': None, 'left_edge_coords': None,
-                    'right_edge': None, 'right_edge_dir': None, 'right_edge_coords': None,
-                    'left_face_edge': None, 'left_face_edge_dir': None, 'left_face_edge_coords': None,
-                    'right_face_edge': None, 'right_face_edge_dir': None, 'right_face_edge_coords': None,
-                    'left_face_dir': None, 'left_face_coords': None,
-                    'right_face_dir': None, 'right_face_coords': None,
-                }
-            # edges, dirs, faces, side edges
-            for v in seq:
-                vdata = d[v]
-                if vdata['next_vert']:
-                    e = self.bm.edges.get([v, vdata['next_vert']])
-                    vdata['next_edge'] = e; d['edges'].append(e)
-                if vdata['prev_vert']:
-                    e = self.bm.edges.get([v, vdata['prev_vert']])
-                    vdata['prev_edge'] = e; d['edges'].append(e)
+                has_prev = cyclic or vidx > 0
+                has_next = cyclic or vidx < count-1
+                prev_v = seq[(vidx-1) % count] if has_prev else None
+                next_v = seq[(vidx+1) % count] if has_next else None
+                co = v.co.copy(); no = v.normal.copy()
+                own_edges = []
+                if next_v:
+                    e = self.bm.edges.get([v, next_v]); own_edges.append(e); d['edges'].append(e)
+                if prev_v:
+                    e = self.bm.edges.get([v, prev_v]); own_edges.append(e); d['edges'].append(e)
                 # dir & cross
-                if vdata['prev_vert'] and vdata['next_vert']:
-                    vdir = ((vdata['next_vert'].co - vdata['co']).normalized() + (vdata['co'] - vdata['prev_vert'].co).normalized()).normalized()
-                elif vdata['next_vert']:
-                    vdir = (vdata['next_vert'].co - vdata['co']).normalized()
+                if prev_v and next_v:
+                    vdir = ((next_v.co - co).normalized() + (co - prev_v.co).normalized()).normalized()
+                elif next_v:
+                    vdir = (next_v.co - co).normalized()
                 else:
-                    vdir = (vdata['co'] - vdata['prev_vert'].co).normalized()
-                vdata['dir'] = vdir
-                vdata['cross'] = vdata['no'].cross(vdir).normalized()
-                # loop & faces (best-effort)
-                e = vdata['next_edge'] or vdata['prev_edge']
+                    vdir = (co - prev_v.co).normalized()
+                cross = no.cross(vdir).normalized()
+                # faces (best-effort)
+                faces = {'left': None, 'right': None}
+                e = own_edges[0] if own_edges else None
                 if e:
                     loops = [l for l in e.link_loops if l.vert == v]
                     if loops:
-                        left_face = loops[0].face
+                        faces['left'] = loops[0].face
                         right_face = loops[0].link_loop_radial_next.face
-                        vdata['loop'] = loops[0]
-                        vdata['left_face'] = left_face
-                        if right_face != left_face:
-                            vdata['right_face'] = right_face
+                        if right_face != faces['left']:
+                            faces['right'] = right_face
                     elif e.link_loops:
-                        vdata['right_face'] = e.link_loops[0].face
+                        faces['right'] = e.link_loops[0].face
                 # side edges: choose connected edges not in path leaning to cross direction
-                connected = [e for e in v.link_edges if e not in d['edges']]
-                for side in ('left','right'):
-                    if connected:
-                        options = []
-                        for e in connected:
-                            edir = (e.other_vert(v).co - vdata['co']).normalized()
-                            dot = edir.dot(vdata['cross'])
-                            if (side=='left' and dot>0.2) or (side=='right' and dot<-0.2):
-                                options.append((e, abs(dot)))
-                        if options:
-                            e_best = max(options, key=lambda x: x[1])[0]
-                            vdata[f'{side}_edge'] = e_best
-                            vdata[f'{side}_edge_dir'] = (e_best.other_vert(v).co - v.co).normalized()
-                            vdata[f'{side}_edge_coords'] = [v.co.copy() for v in e_best.verts]
+                connected = [e for e in v.link_edges if e not in own_edges]
+                sides = {}
+                for side in ('left', 'right'):
+                    edge_dir = face_dir = None
+                    options = []
+                    for e in connected:
+                        edir = (e.other_vert(v).co - co).normalized()
+                        dot = edir.dot(cross)
+                        if (side == 'left' and dot > 0.2) or (side == 'right' and dot < -0.2):
+                            options.append((edir, abs(dot)))
+                    if options:
+                        edge_dir = max(options, key=lambda x: x[1])[0]
                     # fallback via face normal to find projected dir on face
-                    if vdata.get(f'{side}_face') and not vdata.get(f'{side}_edge'):
-                        cross = vdata['cross'] if side=='left' else -vdata['cross']
-                        i = intersect_line_plane(vdata['co'] + cross, vdata['co'] + cross - vdata[f'{side}_face'].normal, vdata['co'], vdata[f'{side}_face'].normal)
+                    elif faces[side]:
+                        side_cross = cross if side == 'left' else -cross
+                        fno = faces[side].normal
+                        i = intersect_line_plane(co + side_cross, co + side_cross - fno, co, fno)
                         if i:
-                            fdir = (i - vdata['co']).normalized()
-                            vdata[f'{side}_face_dir'] = fdir
-                            vdata[f'{side}_face_coords'] = [vdata['co'], vdata['co'] + fdir]
+                            face_dir = (i - co).normalized()
                             self.draw_face_align = True
-            # flip to ensure both sides present
-            for v in seq:
-                vd = d[v]
-                if vd['left_edge'] and not vd['right_edge']:
-                    vd['right_edge'] = vd['left_edge']; vd['right_edge_dir'] = -vd['left_edge_dir']; vd['right_edge_coords'] = vd['left_edge_coords']
-                elif vd['right_edge'] and not vd['left_edge']:
-                    vd['left_edge'] = vd['right_edge']; vd['left_edge_dir'] = -vd['right_edge_dir']; vd['left_edge_coords'] = vd['right_edge_coords']
-                if vd['left_face_edge'] and not vd['right_face_edge']:
-                    vd['right_face_edge'] = vd['left_face_edge']; vd['right_face_edge_dir'] = -vd['left_face_edge_dir']; vd['right_face_edge_coords'] = vd['left_face_edge_coords']
-                elif vd['right_face_edge'] and not vd['left_face_edge']:
-                    vd['left_face_edge'] = vd['right_face_edge']; vd['left_face_edge_dir'] = -vd['right_face_edge_dir']; vd['left_face_edge_coords'] = vd['right_face_edge_coords']
-                if vd['left_face_dir'] and not vd['right_face_dir']:
-                    vd['right_face_dir'] = -vd['left_face_dir']
-                elif vd['right_face_dir'] and not vd['left_face_dir']:
-                    vd['left_face_dir'] = -vd['right_face_dir']
-                if vd.get('next_vert'):
-                    self.original_edge_coords.extend([vd['co'], d[vd['next_vert']]['co']])
+                    sides[side] = [edge_dir, face_dir]
+                # flip to ensure both sides present
+                for a, b in (('left', 'right'), ('right', 'left')):
+                    for k in (0, 1):
+                        if sides[a][k] is not None and sides[b][k] is None:
+                            sides[b][k] = -sides[a][k]
+                if next_v:
+                    self.original_edge_coords.extend([co, next_v.co.copy()])
+
+                verts.append(v)
+                prev_idx.append(start + (vidx-1) % count if prev_v else -1)
+                next_idx.append(start + (vidx+1) % count if next_v else -1)
+                seq_of.append(sidx)
+                init_co.append(co); init_no.append(no); init_cross.append(cross)
+                edge_dirs.append([sides[sd][0] or zero for sd in ('left', 'right')])
+                has_edge.append([sides[sd][0] is not None for sd in ('left', 'right')])
+                face_dirs.append([sides[sd][1] or zero for sd in ('left', 'right')])
+                has_face_dir.append([sides[sd][1] is not None for sd in ('left', 'right')])
+
+            # flat sequences: every vert lies on the plane of the second vert
+            flat = True
+            if count >= 3:
+                plane_co = init_co[start+1]; plane_no = init_no[start+1]
+                for k in range(start, start+count):
+                    if k != start+1 and abs(round(distance_point_to_plane(init_co[k], plane_co, plane_no), 6)) > 0:
+                        flat = False
+                        break
+            seq_cyclic.append(cyclic); seq_flat.append(flat)
+            seq_origin_local.append(mx_inv @ d['origin'])
+
+        self.verts = verts
+        self.prev_idx = np.array(prev_idx, dtype=np.int64)
+        self.next_idx = np.array(next_idx, dtype=np.int64)
+        self.seq_of = np.array(seq_of, dtype=np.int64)
+        self.init_co = np.array(init_co, dtype=np.float64).reshape(-1, 3)
+        self.init_no = np.array(init_no, dtype=np.float64).reshape(-1, 3)
+        self.init_cross = np.array(init_cross, dtype=np.float64).reshape(-1, 3)
+        self.edge_dirs = np.array(edge_dirs, dtype=np.float64).reshape(-1, 2, 3)
+        self.has_edge = np.array(has_edge, dtype=bool).reshape(-1, 2)
+        self.face_dirs = np.array(face_dirs, dtype=np.float64).reshape(-1, 2, 3)
+        self.has_face_dir = np.array(has_face_dir, dtype=bool).reshape(-1, 2)
+        self.vert_cyclic = np.array(seq_cyclic, dtype=bool)[self.seq_of]
+        self.vert_flat = np.array(seq_flat, dtype=bool)[self.seq_of]
+        self.vert_origin_local = np.array(seq_origin_local, dtype=np.float64).reshape(-1, 3)[self.seq_of]
+
+        # Neighbourhood touched by the transform: faces around the chains and every vert of those faces.
+        # Only these normals can change, so per-frame updates stay proportional to the selection.
+        faces = {f for v in verts for f in v.link_faces}
+        self.update_faces = list(faces)
+        self.update_verts = list({v for f in faces for v in f.verts})
         return data
 
     def _update_transform_axis(self, context, event):
@@ -557,10 +653,19 @@ class TMC_OP_EdgeConstraints(bpy.types.Operator):
         return self._update_view_plane(context, init=init)
 
     def _reset_mesh(self):
-        for sel in self.data.values():
-            for v in sel['verts']:
-                v.co = sel[v]['co']
-        self.bm.normal_update(); bmesh.update_edit_mesh(self.active.data)
+        self._write_coords(self.init_co)
+        self._update_mesh()
+
+    def _write_coords(self, coords):
+        for v, co in zip(self.verts, coords.tolist()):
+            v.co = co
+
+    def _update_mesh(self):
+        for f in self.update_faces:
+            f.normal_update()
+        for v in self.update_verts:
+            v.normal_update()
+        bmesh.update_edit_mesh(self.active.data, loop_triangles=True, destructive=False)
 
     def _transform(self, context):
         def get_rotation():
@@ -608,192 +713,104 @@ class TMC_OP_EdgeConstraints(bpy.types.Operator):
             vec = Vector((1,1,amount)); self.amount = amount
             return vec, space, current_scale
 
-        self._reset_mesh()
-        all_verts = [v for sel in self.data.values() for v in sel['verts']]
+        # Transform the initial coordinates directly with the equivalent of
+        # bmesh.ops.scale/rotate (space^-1 @ M @ space), one matrix per sequence.
+        co = np.empty_like(self.init_co)
         if self.transform_mode=='SCALE' or self.is_zero_scaling:
             vec, space, self.scale = get_scale()
-            if self.individual_origins:
-                for sel in self.data.values():
-                    origin = sel['origin']; verts = sel['verts']
-                    _, space, _ = get_scale(per_sequence_origin=origin)
-                    bmesh.ops.scale(self.bm, vec=vec, space=space, verts=verts)
-            else:
-                bmesh.ops.scale(self.bm, vec=vec, space=space, verts=all_verts)
+            smx = Matrix.Diagonal((*vec, 1.0))
+            for sel in self.data.values():
+                if self.individual_origins:
+                    _, space, _ = get_scale(per_sequence_origin=sel['origin'])
+                rng = slice(sel['start'], sel['end'])
+                co[rng] = _apply_mx(self.init_co[rng], space.inverted_safe() @ smx @ space)
         else:
             self.rotation = get_rotation()
-            if self.individual_origins:
-                for sel in self.data.values():
-                    origin = sel['origin']; verts = sel['verts']
-                    bmesh.ops.rotate(self.bm, cent=origin, matrix=self.rotation.to_matrix(), verts=verts, space=self.mx)
-            else:
-                bmesh.ops.rotate(self.bm, cent=self.origin, matrix=self.rotation.to_matrix(), verts=all_verts, space=self.mx)
-
-        self.tdata = self._get_transformed_data()
-        self._constrain_verts_to_edges()
-        self.bm.normal_update(); bmesh.update_edit_mesh(self.active.data)
-
-    def _constrain_verts_to_edges(self):
-        for sidx, sel in self.tdata.items():
-            for v in sel['verts']:
-                tv = self.tdata[sidx][v]
-                if not tv['edge_dir']:
-                    continue
-                if self.transform_mode=='SCALE' or self.is_zero_scaling:
-                    if tv['scale_plane_intersection_co']:
-                        v.co = tv['scale_plane_intersection_co']
-                else:
-                    cm = self.constrain_mode
-                    if cm=='DIRECT' and tv['direct_co']:
-                        v.co = tv['direct_co']
-                    elif cm=='PROXIMITY' and tv['proximity_co']:
-                        v.co = tv['proximity_co']
-                    elif cm=='INTERSECTION' and tv['intersection_co']:
-                        v.co = tv['intersection_co']
-                    elif cm=='PLANE_INTERSECTION' and tv['plane_intersection_co']:
-                        v.co = tv['plane_intersection_co']
-                    elif cm=='PROJECTED_PLANE_INTERSECTION':
-                        if tv['projected_plane_intersection_co']:
-                            v.co = tv['projected_plane_intersection_co']
-                        elif tv['direct_co']:
-                            v.co = tv['direct_co']
-                        elif tv['proximity_co']:
-                            v.co = tv['proximity_co']
-                    elif cm=='DIRECT_PLANE_INTERSECTION':
-                        if tv['direct_plane_intersection_co']:
-                            v.co = tv['direct_plane_intersection_co']
-                        elif tv['projected_plane_intersection_co']:
-                            v.co = tv['projected_plane_intersection_co']
-                        elif tv['direct_co']:
-                            v.co = tv['direct_co']
-                        elif tv['proximity_co']:
-                            v.co = tv['proximity_co']
-                    elif cm=='MOUSEDIR_PLANE_INTERSECTION' and tv['mousedir_plane_intersection_co']:
-                        v.co = tv['mousedir_plane_intersection_co']
-
-    def _get_transformed_data(self):
-        def check_flat():
-            if len(verts) >= 3:
-                plane_co = tdata[sidx][verts[1]]['init_co']
-                plane_no = tdata[sidx][verts[1]]['init_no']
-                for vv in [vv for vv in verts if vv != verts[1]]:
-                    d = distance_point_to_plane(tdata[sidx][vv]['init_co'], plane_co, plane_no)
-                    if abs(round(d, 6)) > 0:
-                        return False
-            return True
-        def get_rotated_dir():
-            if tv['prev_vert'] and tv['next_vert']:
-                rv = ((tv['next_vert'].co - v.co).normalized() + (v.co - tv['prev_vert'].co).normalized()).normalized()
-            elif tv['next_vert']:
-                rv = (tv['next_vert'].co - v.co).normalized()
+            rmx = self.rotation.to_matrix().to_4x4()
+            mx_inv = self.mx.inverted_safe()
+            for sel in self.data.values():
+                cent = sel['origin'] if self.individual_origins else self.origin
+                pivot = Matrix.Translation(cent) @ rmx @ Matrix.Translation(-cent)
+                rng = slice(sel['start'], sel['end'])
+                co[rng] = _apply_mx(self.init_co[rng], mx_inv @ pivot @ self.mx)
+
+        self._write_coords(self._constrain_coords(co))
+        self._update_mesh()
+
+    def _constrain_coords(self, co):
+        """Slide every transformed vert back onto its side edge (or face direction) according to
+        the constrain mode. Vectorized across all verts of all sequences; returns the final coords."""
+        count = len(co)
+        rows = np.arange(count)
+        self.slide_coords = []
+        init_co = self.init_co
+        mx_inv = self.mx.inverted_safe()
+        origin_local = np.array(mx_inv @ self.origin)
+        origin_dir_local = np.array(mx_inv.to_quaternion() @ self.origin_dir)
+        current_scale_local = np.array(mx_inv.to_quaternion() @ self.scale)
+        init_mousedir_local = np.array(self.mx.to_quaternion() @ (self.origin - self.init_intersection))
+        origins = self.vert_origin_local if self.individual_origins else np.broadcast_to(origin_local, co.shape)
+
+        # rotated direction along the chain from the transformed neighbours
+        has_prev = self.prev_idx >= 0
+        has_next = self.next_idx >= 0
+        to_next = _normalize(co[self.next_idx] - co)
+        from_prev = _normalize(co - co[self.prev_idx])
+        rvdir = np.where((has_prev & has_next)[:, None], _normalize(to_next + from_prev),
+                         np.where(has_next[:, None], to_next, from_prev))
+        # rotated normal / cross
+        rq = mx_inv.to_quaternion() @ self.rotation @ self.mx.to_quaternion()
+        no = self.init_no @ np.array(rq.to_matrix()).T
+        cross = np.cross(rvdir, no)
+
+        # pick the side edge the vert moved towards
+        moved = _normalize(co - init_co)
+        side = np.where(_dot(moved, self.init_cross) > 0, 0, 1)
+        side_edge = self.edge_dirs[rows, side]
+        side_face = self.face_dirs[rows, side]
+        use_edge = self.has_edge[rows, side]
+        use_face = ~use_edge & self.has_face_dir[rows, side]
+        has_dir = use_edge | use_face
+        edge_dir = np.where(use_edge[:, None], side_edge, side_face)
+        if self.face_align:
+            # align to whichever of edge / left face / right face direction best matches the movement
+            cands = np.stack([edge_dir, self.face_dirs[:, 0], self.face_dirs[:, 1]], axis=1)
+            scores = np.abs(np.einsum('ij,ikj->ik', moved, cands))
+            best = np.argmax(scores, axis=1)
+            align = has_dir & self.has_face_dir[:, 0]
+            edge_dir = np.where(align[:, None], cands[rows, best], edge_dir)
+
+        if self.transform_mode=='SCALE' or self.is_zero_scaling:
+            result = _isect_line_plane(init_co, edge_dir, co, current_scale_local)
+        else:
+            cm = self.constrain_mode
+            projected = _isect_line_plane(co, np.broadcast_to(origin_dir_local, co.shape), origins, origin_dir_local)
+            direct = _isect_line_line(origins, co - origins, init_co, edge_dir)
+            proximity = _closest_on_line(co, init_co, edge_dir)
+            if cm == 'INTERSECTION':
+                result = _isect_line_line(co, rvdir, init_co, edge_dir)
+            elif cm == 'PLANE_INTERSECTION':
+                result = _isect_line_plane(init_co, edge_dir, co, cross)
+            elif cm == 'MOUSEDIR_PLANE_INTERSECTION':
+                result = _isect_line_plane(init_co, edge_dir, co, init_mousedir_local)
+            elif cm == 'DIRECT':
+                result = direct
+            elif cm == 'PROXIMITY':
+                result = proximity
             else:
-                rv = (v.co - tv['prev_vert'].co).normalized()
-            tv['dir'] = rv; return rv
-        def get_rotated_no_cross():
-            rmx = self.mx.inverted_safe().to_quaternion() @ self.rotation @ self.mx.to_quaternion()
-            tv['no'] = rmx @ init_no
-            tv['cross'] = rvdir.cross(tv['no'])
-        def pick_edge_dir():
-            def align_face(edge_dir, slide_coords):
-                if self.face_align and vdata['left_face_dir']:
-                    dirs = [
-                        ('edge_dir', moved.dot(edge_dir)),
-                        ('left_face_dir', moved.dot(vdata['left_face_dir'])),
-                        ('right_face_dir', moved.dot(vdata['right_face_dir'])),
-                    ]
-                    md = max(dirs, key=lambda x: abs(x[1]))
-                    if md[0] != 'edge_dir':
-                        edge_dir = vdata[md[0]]; slide_coords = vdata[md[0].replace('dir','coords')]
-                return edge_dir, slide_coords
-            edge_dir = None; slide_coords = []
-            moved = (v.co - vdata['co']).normalized()
-            side = 'left' if moved.dot(cross) > 0 else 'right'
-            endvert = (v == verts[0] or v == verts[-1])
-            if self.end_align and not cyclic and endvert and vdata.get(f'{side}_face_edge_dir'):
-                edge_dir = vdata[f'{side}_face_edge_dir']; slide_coords = vdata[f'{side}_face_edge_coords']
-            elif vdata.get(f'{side}_edge_dir'):
-                edge_dir = vdata[f'{side}_edge_dir']; slide_coords = vdata[f'{side}_edge_coords']
-                edge_dir, slide_coords = align_face(edge_dir, slide_coords)
-            elif vdata.get(f'{side}_face_edge_dir'):
-                edge_dir = vdata[f'{side}_face_edge_dir']; slide_coords = vdata[f'{side}_face_edge_coords']
-                edge_dir, slide_coords = align_face(edge_dir, slide_coords)
-            elif vdata.get(f'{side}_face_dir'):
-                edge_dir = vdata[f'{side}_face_dir']; slide_coords = vdata[f'{side}_face_coords']
-                edge_dir, slide_coords = align_face(edge_dir, slide_coords)
-            tv['edge_dir'] = edge_dir
-            edges_differ = bool(vdata.get(f'{side}_edge') and vdata.get(f'{side}_face_edge') and vdata[f'{side}_edge'] != vdata[f'{side}_face_edge'])
-            if not cyclic and slide_coords and endvert and edges_differ:
-                self.slide_coords.extend(slide_coords); self.draw_end_align = True
-            return edge_dir
-        def get_projected_co():
-            i = intersect_line_plane(co, co + origin_dir_local, individual_origin_local if self.individual_origins else origin_local, origin_dir_local)
-            if i:
-                tv['projected_co'] = i; tv['projected_dir'] = i - co
-        def get_direct_co():
-            i = intersect_line_line(individual_origin_local if self.individual_origins else origin_local, co, init_co, init_co + edge_dir)
-            if i:
-                tv['direct_co'] = i[1]
-        def get_proximity_co():
-            i, _ = intersect_point_line(co, init_co, init_co + edge_dir); tv['proximity_co'] = i
-        def get_intersection_co():
-            i = intersect_line_line(co, co + rvdir, init_co, init_co + edge_dir)[1]
-            if i: tv['intersection_co'] = i
-        def get_plane_intersection_co():
-            i = intersect_line_plane(init_co, init_co + edge_dir, co, tv['cross'])
-            if i: tv['plane_intersection_co'] = i
-        def get_projected_plane_intersection_co():
-            projected_cross = rvdir.cross(tv['projected_dir']) if tv.get('projected_dir') else None
-            if projected_cross:
-                i = intersect_line_plane(init_co, init_co + edge_dir, co, projected_cross)
-                if i: tv['projected_plane_intersection_co'] = i
-        def get_direct_plane_intersection_co():
-            if is_flat:
-                tv['direct_plane_intersection_co'] = tv.get('projected_plane_intersection_co'); return
-            direct_dir = (co - (individual_origin_local if self.individual_origins else origin_local)).normalized()
-            direct_cross = rvdir.cross(direct_dir)
-            i = intersect_line_plane(init_co, init_co + edge_dir, co, direct_cross)
-            if i: tv['direct_plane_intersection_co'] = i
-        def get_mousedir_plane_intersection_co():
-            i = intersect_line_plane(init_co, init_co + edge_dir, co, init_mousedir_local)
-            if i: tv['mousedir_plane_intersection_co'] = i
-        def get_scale_plane_intersection_co():
-            i = intersect_line_plane(init_co, init_co + edge_dir, co, current_scale_local)
-            if i: tv['scale_plane_intersection_co'] = i
-
-        tdata = {}; self.slide_coords = []
-        origin_local = self.mx.inverted_safe() @ self.origin
-        origin_dir_local = self.mx.inverted_safe().to_quaternion() @ self.origin_dir
-        current_scale_local = self.mx.inverted_safe().to_quaternion() @ self.scale
-        init_mousedir_local = self.mx.to_quaternion() @ (self.origin - self.init_intersection)
-
-        for sidx, sel in self.data.items():
-            verts = sel['verts']; cyclic = sel['cyclic']
-            individual_origin_local = self.mx.inverted_safe() @ sel['origin']
-            tdata[sidx] = {'verts': verts, 'cyclic': cyclic}
-            for v in verts:
-                vdata = sel[v]
-                co = v.co.copy(); init_co = vdata['co']; init_no = vdata['no']
-                tdata[sidx][v] = {
-                    'co': co, 'init_co': init_co, 'dir': None,
-                    'no': None, 'init_no': init_no, 'cross': None,
-                    'prev_vert': vdata['prev_vert'], 'next_vert': vdata['next_vert'],
-                    'edge_dir': None,
-                    'projected_co': None, 'projected_dir': None,
-                    'direct_co': None, 'proximity_co': None, 'intersection_co': None,
-                    'plane_intersection_co': None, 'projected_plane_intersection_co': None,
-                    'direct_plane_intersection_co': None,
-                    'scale_plane_intersection_co': None, 'mousedir_plane_intersection_co': None,
-                }
-            is_flat = check_flat()
-            for v in verts:
-                vdata = self.data[sidx][v]; tv = tdata[sidx][v]
-                co = tv['co']; init_co = tv['init_co']; init_no = vdata['no']; cross = vdata['cross']
-                rvdir = get_rotated_dir(); get_rotated_no_cross(); edge_dir = pick_edge_dir()
-                if self.transform_mode=='SCALE' or self.is_zero_scaling:
-                    get_scale_plane_intersection_co()
-                else:
-                    get_projected_co(); get_direct_co(); get_proximity_co(); get_intersection_co(); get_plane_intersection_co();
-                    get_projected_plane_intersection_co(); get_direct_plane_intersection_co(); get_mousedir_plane_intersection_co()
-        return tdata
+                projected_cross = np.cross(rvdir, np.nan_to_num(projected - co))
+                projected_plane = _isect_line_plane(init_co, edge_dir, co, projected_cross)
+                projected_plane[np.isnan(projected[:, 0])] = np.nan
+                if cm == 'PROJECTED_PLANE_INTERSECTION':
+                    result = _first_valid(projected_plane, direct, proximity)
+                else:  # DIRECT_PLANE_INTERSECTION
+                    direct_cross = np.cross(rvdir, _normalize(co - origins))
+                    direct_plane = _isect_line_plane(init_co, edge_dir, co, direct_cross)
+                    direct_plane = np.where(self.vert_flat[:, None], projected_plane, direct_plane)
+                    result = _first_valid(direct_plane, projected_plane, direct, proximity)
+
+        keep = ~has_dir | np.isnan(result[:, 0])
+        return np.where(keep[:, None], co, result)
 
     @staticmethod
     def _step_enum(value, items, step):
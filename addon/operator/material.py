@@ -108,7 +108,7 @@ class TMC_OP_ClearMaterialSearch(bpy.types.Operator):
     bl_description = "Reset material search filter (show all materials)"
 
     def execute(self, context):
-        context.scene.material_search = ""
+        context.scene.hstool.ui.material_search = ""
         # Force a UI redraw so the filtered list refreshes immediately
         try:
             for area in context.screen.areas:
@@ -134,9 +134,9 @@ class TMC_OP_SelectMaterial(bpy.types.Operator):
 
     def execute(self, context):
         try:
-            context.scene.material_index = int(self.index)
+            context.scene.hstool.ui.material_index = int(self.index)
         except Exception:
-            context.scene.material_index = 0
+            context.scene.hstool.ui.material_index = 0
         return {'FINISHED'}
 
 
@@ -157,7 +157,7 @@ class TMC_OP_AddMaterial(bpy.types.Operator):
         mat = bpy.data.materials.new(name=name)
         # Apply scene color to the new material (try Principled BSDF if nodes are used)
         try:
-            col = tuple(getattr(context.scene, 'material_add_color', (0.8, 0.8, 0.8)))
+            col = tuple(getattr(context.scene.hstool.ui, 'material_add_color', (0.8, 0.8, 0.8)))
             # ensure nodes are enabled for the material so we can set principled color
             try:
                 if not getattr(mat, 'use_nodes', False):
@@ -229,9 +229,9 @@ class TMC_OP_AddMaterial(bpy.types.Operator):
             pass
         # Select the new material in the UI
         try:
-            context.scene.material_index = list(bpy.data.materials).index(mat)
+            context.scene.hstool.ui.material_index = list(bpy.data.materials).index(mat)
         except Exception:
-            context.scene.material_index = 0
+            context.scene.hstool.ui.material_index = 0
         # Add to stored rows if collection exists
         try:
             scene = context.scene
@@ -251,7 +251,7 @@ class TMC_OP_DuplicateMaterial(bpy.types.Operator):
     bl_description = "Duplicate the selected material"
 
     def execute(self, context):
-        idx = getattr(context.scene, 'material_index', 0)
+        idx = getattr(context.scene.hstool.ui, 'material_index', 0)
         mats = bpy.data.materials
         if idx < 0 or idx >= len(mats):
             return {'CANCELLED'}
@@ -266,7 +266,7 @@ class TMC_OP_DuplicateMaterial(bpy.types.Operator):
                 i += 1
                 name = f"{base}.{i}"
             new.name = name
-            context.scene.material_index = list(mats).index(new)
+            context.scene.hstool.ui.material_index = list(mats).index(new)
             # Add duplicated material to stored rows
             try:
                 scene = context.scene
@@ -288,7 +288,7 @@ class TMC_OP_RemoveMaterial(bpy.types.Operator):
     bl_description = "Remove the selected material from the file (user_clear first)"
 
     def execute(self, context):
-        idx = getattr(context.scene, 'material_index', 0)
+        idx = getattr(context.scene.hstool.ui, 'material_index', 0)
         mats = bpy.data.materials
         if idx < 0 or idx >= len(mats):
             return {'CANCELLED'}
@@ -309,7 +309,7 @@ class TMC_OP_RemoveMaterial(bpy.types.Operator):
             mat.user_clear()
             bpy.data.materials.remove(mat)
             # clamp index for data materials
-            context.scene.material_index = max(0, min(idx, max(0, len(bpy.data.materials)-1)))
+            context.scene.hstool.ui.material_index = max(0, min(idx, max(0, len(bpy.data.materials)-1)))
         except Exception:
             return {'CANCELLED'}
         return {'FINISHED'}
@@ -339,7 +339,7 @@ class TMC_OP_SelectObjectsByMaterial(bpy.types.Operator):
     bl_description = "Select all objects that use the active material"
 
     def execute(self, context):
-        idx = getattr(context.scene, 'material_index', 0)
+        idx = getattr(context.scene.hstool.ui, 'material_index', 0)
         mats = bpy.data.materials
         if idx < 0 or idx >= len(mats):
             return {'CANCELLED'}
@@ -460,7 +460,7 @@ class TMC_OP_SelectFacesOnActiveByMaterial(bpy.types.Operator):
     bl_description = "Select faces on the active object that use the active material"
 
     def execute(self, context):
-        idx = getattr(context.scene, 'material_index', 0)
+        idx = getattr(context.scene.hstool.ui, 'material_index', 0)
         mats = bpy.data.materials
         if idx < 0 or idx >= len(mats):
             return {'CANCELLED'}
@@ -556,7 +556,7 @@ class TMC_OP_AssignMaterialToSelection(bpy.types.Operator):
     bl_description = "Assign the selected material to current selected objects or faces"
 
     def execute(self, context):
-        idx = getattr(context.scene, 'material_index', 0)
+        idx = getattr(context.scene.hstool.ui, 'material_index', 0)
         mats = bpy.data.materials
         if idx < 0 or idx >= len(mats):
             return {'CANCELLED'}
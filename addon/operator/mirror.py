@@ -3,6 +3,7 @@ import bpy, traceback
 from ..utility.mouse import mouse_warp
 from ..utility.draw import draw_quad, draw_text, get_blf_text_dims
 from ..utility.addon import get_prefs
+from ..utility.modifier_index import find_modifier_users
 
 from ..ui import controller
 
@@ -12,29 +13,18 @@ class TMC_OP_SelectObjectFromCurrentMirror(bpy.types.Operator):
     bl_decription = "Select Object From Current Mirror"
 
     def execute(self, context):
-        current_object = bpy.context.scene.objects.get(context.scene.current_mirror_object_name)
+        current_object = bpy.context.scene.objects.get(context.scene.hstool.modifier.current_mirror_object_name)
         if current_object:
             is_exists = True
         else:
             is_exists = False
-        if is_exists or context.scene.current_mirror_object_name == '':
-            mirror_object_list = []
-            mesh_list = [obj for obj in bpy.context.scene.objects if obj.type=='MESH']
-            for obj in mesh_list:
-                bpy.context.view_layer.objects.active = obj
-                for mod in obj.modifiers:
-                    if mod.type == 'MIRROR':
-                        if mod.mirror_object == None:
-                            if context.scene.current_mirror_object_name == '':
-                                mirror_object_list.append(obj)
-                        else:
-                            if mod.mirror_object.name == context.scene.current_mirror_object_name:
-                                mirror_object_list.append(obj)
+        if is_exists or context.scene.hstool.modifier.current_mirror_object_name == '':
+            mirror_object_list = get_mirror_users(context, current_object)
             if mirror_object_list == []:
                 controller.show_message(context, "ERROR", "No object selected!")
             else:
                 bpy.ops.object.mode_set(mode = 'OBJECT')
-                for obj in mirror_object_list:
+                for obj, mod in mirror_object_list:
                     obj.select_set(True)
                 controller.show_message(context, "INFO", "Select: Done!")
         else:
@@ -47,33 +37,28 @@ class TMC_OP_SetCurrentMirrorToTargetMirror(bpy.types.Operator):
     bl_description = "Set Current Mirror To Target Mirror"
 
     def execute(self, context):
-        current_object = bpy.context.scene.objects.get(context.scene.current_mirror_object_name)
+        current_object = bpy.context.scene.objects.get(context.scene.hstool.modifier.current_mirror_object_name)
         if current_object:
             is_exists = True
         else:
             is_exists = False
-        if is_exists or context.scene.current_mirror_object_name == '':
-            mesh_list = [obj for obj in bpy.context.scene.objects if obj.type=='MESH']
-            for obj in mesh_list:
-                bpy.context.view_layer.objects.active = obj
-                for mod in obj.modifiers:
-                    if mod.type == 'MIRROR':
-                        if mod.mirror_object != None:
-                            if mod.mirror_object.name == context.scene.current_mirror_object_name:
-                                if context.scene.target_mirror_object_name == '':
-                                    mod.mirror_object = None
-                                else:
-                                    mod.mirror_object = bpy.data.objects[context.scene.target_mirror_object_name]
-                        elif context.scene.current_mirror_object_name == '':
-                            if context.scene.target_mirror_object_name == '':
-                                    mod.mirror_object = None
-                            else:
-                                mod.mirror_object = bpy.data.objects[context.scene.target_mirror_object_name]
-            empty_list = [obj for obj in bpy.context.scene.objects if obj.type=='EMPTY']
-            for em in empty_list:
-                if context.scene.current_mirror_object_name == em.name:
-                    bpy.data.objects.remove(em, do_unlink=True)
+        target_name = context.scene.hstool.modifier.target_mirror_object_name
+        target_object = bpy.data.objects.get(target_name) if target_name != '' else None
+        if target_name != '' and target_object is None:
+            controller.show_message(context, "ERROR", "Target Mirror isn't exists!")
+            return {'FINISHED'}
+        if is_exists or context.scene.hstool.modifier.current_mirror_object_name == '':
+            for obj, mod in get_mirror_users(context, current_object):
+                mod.mirror_object = target_object
+            if current_object and current_object.type == 'EMPTY' and current_object is not target_object:
+                bpy.data.objects.remove(current_object, do_unlink=True)
             controller.show_message(context, "INFO", "Change: Done!")
         else:
             controller.show_message(context, "ERROR", "Target Mirror isn't exists!")
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}
+
+def get_mirror_users(context, mirror_object):
+    '''Mirror modifiers on scene meshes that use mirror_object (None = no mirror object), from the modifier index'''
+    scene_objects = context.scene.objects
+    return [(obj, mod) for obj, mod in find_modifier_users(mirror_object, 'MIRROR')
+            if obj.type == 'MESH' and scene_objects.get(obj.name) == obj]
@@ -6,6 +6,8 @@ from math import *
 
 from ..ui import controller
 from ..utility import variable
+from ..utility.selection import has_selection
+from ..property import settings_snapshot
 
 #region MAIN FUNCTION
 
@@ -20,7 +22,7 @@ class TMC_OP_SetEdgeLength(bpy.types.Operator):
 		selected_edges = [e for e in current_object.edges if e.select]
 		lock_vertex_list = [v for v in current_object.verts if v.index in variable.LOCK_VERTEX_INDEX_LIST]
 		bmesh.update_edit_mesh(bpy.context.active_object.data)
-		new_length = context.scene.edge_length_value
+		new_length = context.scene.hstool.modeling.edge_length_value
 		for edge in selected_edges:
 			current_length = edge.calc_length()
 			bpy.ops.mesh.select_all(action = 'DESELECT')
@@ -79,7 +81,8 @@ class TMC_OP_CircleEdge(bpy.types.Operator):
 	bl_description = 'make selected edges become arc'
 
 	def execute(self, context):
-		CircleVertex_GO(context, 0, context.scene.circle_diameter_toggle, context.scene.circle_angle_toggle, context.scene.circle_diameter_value, context.scene.circle_angle_value)
+		settings = settings_snapshot(context.scene.hstool.modeling)
+		CircleVertex_GO(context, 0, settings.circle_diameter_toggle, settings.circle_angle_toggle, settings.circle_diameter_value, settings.circle_angle_value)
 		return {'FINISHED'}
 
 class TMC_OP_AddPriorityVertex(bpy.types.Operator):
@@ -106,7 +109,8 @@ class TMC_OP_GetCircleDiameter(bpy.types.Operator):
 	bl_description = 'get circle diameter of selected edges'
 
 	def execute(self, context):
-		CircleVertex_GO(context, 1, context.scene.circle_diameter_toggle, context.scene.circle_angle_toggle, context.scene.circle_diameter_value, context.scene.circle_angle_value)
+		settings = settings_snapshot(context.scene.hstool.modeling)
+		CircleVertex_GO(context, 1, settings.circle_diameter_toggle, settings.circle_angle_toggle, settings.circle_diameter_value, settings.circle_angle_value)
 		return {'FINISHED'}
 	
 class TMC_OP_GetCircleAngle(bpy.types.Operator):
@@ -115,7 +119,8 @@ class TMC_OP_GetCircleAngle(bpy.types.Operator):
 	bl_description = 'get circle angle of selected edges'
 
 	def execute(self, context):
-		CircleVertex_GO(context, 2, context.scene.circle_diameter_toggle, context.scene.circle_angle_toggle, context.scene.circle_diameter_value, context.scene.circle_angle_value)
+		settings = settings_snapshot(context.scene.hstool.modeling)
+		CircleVertex_GO(context, 2, settings.circle_diameter_toggle, settings.circle_angle_toggle, settings.circle_diameter_value, settings.circle_angle_value)
 		return {'FINISHED'}
 #endregion
 
@@ -126,8 +131,9 @@ class TMC_OP_StraightEdge(bpy.types.Operator):
 	bl_description = 'make the selected edges become straight'
 
 	def execute(self, context):
-		axis = context.scene.straight_axis_radiobox
-		even_mode = context.scene.even_straight_toggle
+		settings = settings_snapshot(context.scene.hstool.modeling)
+		axis = settings.straight_axis_radiobox
+		even_mode = settings.even_straight_toggle
 		result = StraightLine_GO(context, axis, even_mode)
 		if result == 'Loop':
 			controller.show_message(context, "ERROR", "Please don't select edge loop!")
@@ -144,30 +150,31 @@ class TMC_OP_RelaxEdge(bpy.types.Operator):
 
 	def execute(self, context):
 		# initialise
+		settings = settings_snapshot(context.scene.hstool.modeling)
 		object, bm = initialise()
 		# check cache to see if we can save time
-		cached, single_loops, loops, derived, mapping = cache_read("Relax",object, bm, context.scene.relax_input, False)
+		cached, single_loops, loops, derived, mapping = cache_read("Relax",object, bm, settings.relax_input, False)
 		if cached:
 			derived, bm_mod = get_derived_bmesh(object, bm, False)
 		else:
 			# find loops
-			derived, bm_mod, loops = get_connected_input(object, bm, False, context.scene.relax_input)
+			derived, bm_mod, loops = get_connected_input(object, bm, False, settings.relax_input)
 			mapping = get_mapping(derived, bm, bm_mod, False, False, loops)
 			loops = check_loops(loops, mapping, bm_mod)
 		knots, points = relax_calculate_knots(loops)
 
 		# saving cache for faster execution next time
 		if not cached:
-			cache_write("Relax", object, bm, context.scene.relax_input, False, False, loops, derived, mapping)
+			cache_write("Relax", object, bm, settings.relax_input, False, False, loops, derived, mapping)
 
-		for iteration in range(int(context.scene.relax_iterations)):
+		for iteration in range(int(settings.relax_iterations)):
 			# calculate splines and new positions
-			tknots, tpoints = relax_calculate_t(bm_mod, knots, points, context.scene.relax_regular)
+			tknots, tpoints = relax_calculate_t(bm_mod, knots, points, settings.relax_regular)
 			splines = []
 			for i in range(len(knots)):
-				splines.append(calculate_splines(context.scene.relax_interpolation, bm_mod, tknots[i], knots[i]))
-			move = [relax_calculate_verts(bm_mod, context.scene.relax_interpolation, tknots, knots, tpoints, points, splines)]
-			move_verts(object, bm, mapping, move, False, context.scene.relax_influence)
+				splines.append(calculate_splines(settings.relax_interpolation, bm_mod, tknots[i], knots[i]))
+			move = [relax_calculate_verts(bm_mod, settings.relax_interpolation, tknots, knots, tpoints, points, splines)]
+			move_verts(object, bm, mapping, move, False, settings.relax_influence)
 
 		# cleaning up
 		if derived:
@@ -184,21 +191,22 @@ class TMC_OP_SpaceEdge(bpy.types.Operator):
 
 	def execute(self, context):
 		# initialise
+		settings = settings_snapshot(context.scene.hstool.modeling)
 		object, bm = initialise()
 		# check cache to see if we can save time
 		cached, single_loops, loops, derived, mapping = cache_read("Space",
-			object, bm, context.scene.space_input, False)
+			object, bm, settings.space_input, False)
 		if cached:
 			derived, bm_mod = get_derived_bmesh(object, bm, True)
 		else:
 			# find loops
-			derived, bm_mod, loops = get_connected_input(object, bm, True, context.scene.space_input)
+			derived, bm_mod, loops = get_connected_input(object, bm, True, settings.space_input)
 			mapping = get_mapping(derived, bm, bm_mod, False, False, loops)
 			loops = check_loops(loops, mapping, bm_mod)
 
 		# saving cache for faster execution next time
 		if not cached:
-			cache_write("Space", object, bm, context.scene.space_input, False, False, loops, derived, mapping)
+			cache_write("Space", object, bm, settings.space_input, False, False, loops, derived, mapping)
 
 		move = []
 		for loop in loops:
@@ -206,14 +214,14 @@ class TMC_OP_SpaceEdge(bpy.types.Operator):
 			if loop[1]:  # circular
 				loop[0].append(loop[0][0])
 			tknots, tpoints = space_calculate_t(bm_mod, loop[0][:])
-			splines = calculate_splines(context.scene.space_interpolation, bm_mod, tknots, loop[0][:])
-			move.append(space_calculate_verts(bm_mod, context.scene.space_interpolation, tknots, tpoints, loop[0][:-1], splines))
+			splines = calculate_splines(settings.space_interpolation, bm_mod, tknots, loop[0][:])
+			move.append(space_calculate_verts(bm_mod, settings.space_interpolation, tknots, tpoints, loop[0][:-1], splines))
 		# move vertices to new locations
-		if context.scene.space_lock_x or context.scene.space_lock_y or context.scene.space_lock_z:
-			lock = [context.scene.space_lock_x, context.scene.space_lock_y, context.scene.space_lock_z]
+		if settings.space_lock_x or settings.space_lock_y or settings.space_lock_z:
+			lock = [settings.space_lock_x, settings.space_lock_y, settings.space_lock_z]
 		else:
 			lock = False
-		move_verts(object, bm, mapping, move, lock, context.scene.space_influence)
+		move_verts(object, bm, mapping, move, lock, settings.space_influence)
 
 		# cleaning up
 		if derived:
@@ -232,6 +240,7 @@ class TMC_OP_FlattenFace(bpy.types.Operator):
 
 	def execute(self, context):
 		# initialise
+		settings = settings_snapshot(context.scene.hstool.modeling)
 		object, bm = initialise()
 		# check cache to see if we can save time
 		cached, single_loops, loops, derived, mapping = cache_read("Flatten",
@@ -249,20 +258,20 @@ class TMC_OP_FlattenFace(bpy.types.Operator):
 		move = []
 		for loop in loops:
 			# calculate plane and position of vertices on them
-			com, normal = calculate_plane(bm, loop, method=context.scene.flatten_plane,
+			com, normal = calculate_plane(bm, loop, method=settings.flatten_plane,
 				object=object)
 			to_move = flatten_project(bm, loop, com, normal)
-			if context.scene.flatten_restriction == 'none':
+			if settings.flatten_restriction == 'none':
 				move.append(to_move)
 			else:
 				move.append(to_move)
 
 		# move vertices to new locations
-		if context.scene.flatten_lock_x or context.scene.flatten_lock_y or context.scene.flatten_lock_z:
-			lock = [context.scene.flatten_lock_x, context.scene.flatten_lock_y, context.scene.flatten_lock_z]
+		if settings.flatten_lock_x or settings.flatten_lock_y or settings.flatten_lock_z:
+			lock = [settings.flatten_lock_x, settings.flatten_lock_y, settings.flatten_lock_z]
 		else:
 			lock = False
-		move_verts(object, bm, False, move, lock, context.scene.flatten_influence)
+		move_verts(object, bm, False, move, lock, settings.flatten_influence)
 
 		# cleaning up
 		terminate()
@@ -277,15 +286,16 @@ class TMC_OP_CurveEdge(bpy.types.Operator):
 
 	def execute(self, context):
 		# initialise
+		settings = settings_snapshot(context.scene.hstool.modeling)
 		object, bm = initialise()
 		# check cache to see if we can save time
 		cached, single_loops, loops, derived, mapping = cache_read("Curve",
-			object, bm, False, context.scene.curve_boundaries)
+			object, bm, False, settings.curve_boundaries)
 		if cached:
 			derived, bm_mod = get_derived_bmesh(object, bm, False)
 		else:
 			# find loops
-			derived, bm_mod, loops = curve_get_input(object, bm, context.scene.curve_boundaries)
+			derived, bm_mod, loops = curve_get_input(object, bm, settings.curve_boundaries)
 			mapping = get_mapping(derived, bm, bm_mod, False, True, loops)
 			loops = check_loops(loops, mapping, bm_mod)
 		verts_selected = [
@@ -294,7 +304,7 @@ class TMC_OP_CurveEdge(bpy.types.Operator):
 
 		# saving cache for faster execution next time
 		if not cached:
-			cache_write("Curve", object, bm, False, context.scene.curve_boundaries, False,
+			cache_write("Curve", object, bm, False, settings.curve_boundaries, False,
 				loops, derived, mapping)
 
 		move = []
@@ -303,19 +313,19 @@ class TMC_OP_CurveEdge(bpy.types.Operator):
 			pknots = curve_project_knots(bm_mod, verts_selected, knots,
 				points, loop[1])
 			tknots, tpoints = curve_calculate_t(bm_mod, knots, points,
-				pknots, context.scene.curve_regular, loop[1])
-			splines = calculate_splines(context.scene.curve_interpolation, bm_mod,
+				pknots, settings.curve_regular, loop[1])
+			splines = calculate_splines(settings.curve_interpolation, bm_mod,
 				tknots, knots)
 			move.append(curve_calculate_vertices(bm_mod, knots, tknots,
-				points, tpoints, splines, context.scene.curve_interpolation,
-				context.scene.curve_restriction))
+				points, tpoints, splines, settings.curve_interpolation,
+				settings.curve_restriction))
 
 		# move vertices to new locations
-		if context.scene.curve_lock_x or context.scene.curve_lock_y or context.scene.curve_lock_z:
-			lock = [context.scene.curve_lock_x, context.scene.curve_lock_y, context.scene.curve_lock_z]
+		if settings.curve_lock_x or settings.curve_lock_y or settings.curve_lock_z:
+			lock = [settings.curve_lock_x, settings.curve_lock_y, settings.curve_lock_z]
 		else:
 			lock = False
-		move_verts(object, bm, mapping, move, lock, context.scene.curve_influence)
+		move_verts(object, bm, mapping, move, lock, settings.curve_influence)
 
 		# cleaning up
 		if derived:
@@ -334,15 +344,16 @@ class TMC_OP_SmoothEdge(bpy.types.Operator):
 
 	def execute(self, context):
 		# initialise
+		settings = settings_snapshot(context.scene.hstool.modeling)
 		object, bm = initialise()
 		# check cache to see if we can save time
 		curve_cached, single_loops, loops, derived, mapping = cache_read("Curve",
-			object, bm, False, context.scene.curve_boundaries)
+			object, bm, False, settings.curve_boundaries)
 		if curve_cached:
 			derived, bm_mod = get_derived_bmesh(object, bm, False)
 		else:
 			# find loops
-			derived, bm_mod, loops = curve_get_input(object, bm, context.scene.curve_boundaries)
+			derived, bm_mod, loops = curve_get_input(object, bm, settings.curve_boundaries)
 			mapping = get_mapping(derived, bm, bm_mod, False, True, loops)
 			loops = check_loops(loops, mapping, bm_mod)
 		verts_selected = [
@@ -351,7 +362,7 @@ class TMC_OP_SmoothEdge(bpy.types.Operator):
 
 		# saving cache for faster execution next time
 		if not curve_cached:
-			cache_write("Curve", object, bm, False, context.scene.curve_boundaries, False,
+			cache_write("Curve", object, bm, False, settings.curve_boundaries, False,
 				loops, derived, mapping)
 
 		# Curve Movement
@@ -361,19 +372,19 @@ class TMC_OP_SmoothEdge(bpy.types.Operator):
 			pknots = curve_project_knots(bm_mod, verts_selected, knots,
 				points, loop[1])
 			tknots, tpoints = curve_calculate_t(bm_mod, knots, points,
-				pknots, context.scene.curve_regular, loop[1])
-			splines = calculate_splines(context.scene.curve_interpolation, bm_mod,
+				pknots, settings.curve_regular, loop[1])
+			splines = calculate_splines(settings.curve_interpolation, bm_mod,
 				tknots, knots)
 			move.append(curve_calculate_vertices(bm_mod, knots, tknots,
-				points, tpoints, splines, context.scene.curve_interpolation,
-				context.scene.curve_restriction))
+				points, tpoints, splines, settings.curve_interpolation,
+				settings.curve_restriction))
 
 		# move vertices to new locations
-		if context.scene.curve_lock_x or context.scene.curve_lock_y or context.scene.curve_lock_z:
-			lock = [context.scene.curve_lock_x, context.scene.curve_lock_y, context.scene.curve_lock_z]
+		if settings.curve_lock_x or settings.curve_lock_y or settings.curve_lock_z:
+			lock = [settings.curve_lock_x, settings.curve_lock_y, settings.curve_lock_z]
 		else:
 			lock = False
-		move_verts(object, bm, mapping, move, lock, context.scene.curve_influence)
+		move_verts(object, bm, mapping, move, lock, settings.curve_influence)
 
 		# cleaning up
 		if derived:
@@ -399,26 +410,7 @@ class TMC_OP_DetachElement(bpy.types.Operator):
 		if getattr(context, 'mode', '') != 'EDIT_MESH':
 			return False
 		# Require any component selection (vert/edge/face)
-		try:
-			bm = bmesh.from_edit_mesh(obj.data)
-			if any(v.select for v in bm.verts):
-				return True
-			if any(e.select for e in bm.edges):
-				return True
-			if any(f.select for f in bm.faces):
-				return True
-		except Exception:
-			# Fallback to mesh data flags in rare cases
-			try:
-				if any(p.select for p in obj.data.polygons):
-					return True
-				if any(e.select for e in obj.data.edges):
-					return True
-				if any(v.select for v in obj.data.vertices):
-					return True
-			except Exception:
-				pass
-		return False
+		return has_selection(obj)
 
 	def execute(self, context):
 		bpy.ops.mesh.separate(type='SELECTED')
@@ -447,26 +439,7 @@ class TMC_OP_CloneElement(bpy.types.Operator):
 		if getattr(context, 'mode', '') != 'EDIT_MESH':
 			return False
 		# Require any component selection (vert/edge/face)
-		try:
-			bm = bmesh.from_edit_mesh(obj.data)
-			if any(v.select for v in bm.verts):
-				return True
-			if any(e.select for e in bm.edges):
-				return True
-			if any(f.select for f in bm.faces):
-				return True
-		except Exception:
-			# Fallback to mesh data flags in rare cases
-			try:
-				if any(p.select for p in obj.data.polygons):
-					return True
-				if any(e.select for e in obj.data.edges):
-					return True
-				if any(v.select for v in obj.data.vertices):
-					return True
-			except Exception:
-				pass
-		return False
+		return has_selection(obj)
 
 	def execute(self, context):
 		bpy.ops.mesh.duplicate()
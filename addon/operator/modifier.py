@@ -34,19 +34,85 @@ class TMC_OP_ApplyModifier(bpy.types.Operator):
     bl_description = "Apply Modifier"
 
     def execute(self, context):
-        object_list = bpy.context.selected_objects
+        object_list = [obj for obj in context.selected_objects if len(obj.modifiers) > 0]
         if len(object_list) == 0:
-            object_list = bpy.context.scene.objects
-        for obj in object_list:
-            try:
-                bpy.context.view_layer.objects.active = obj
-                for mod in obj.modifiers:
-                    name = mod.name
-                    try:
-                        bpy.ops.object.modifier_apply(modifier = name)
-                    except:
-                        obj.modifiers.remove(mod)
-            except:
-                pass
+            controller.show_message(context, "ERROR", "Apply Modifier: no selected object has modifiers")
+            return {'CANCELLED'}
+        applied, failed = apply_modifier_stacks(context, object_list)
+        if failed:
+            controller.show_message(context, "ERROR", "Apply Modifier: " + str(applied) + " applied, failed: "
+                                    + ", ".join(name + " (" + reason + ")" for name, reason in failed))
         return {'FINISHED'}
-    
\ No newline at end of file
+
+#region Apply engine
+def _modifier_signature(obj):
+    '''Hashable description of a modifier stack, so objects sharing a mesh and an identical stack bake once'''
+    signature = []
+    for mod in obj.modifiers:
+        values = []
+        for prop in mod.bl_rna.properties:
+            if prop.identifier in {'rna_type', 'name', 'is_active', 'show_expanded'}:
+                continue
+            try:
+                value = getattr(mod, prop.identifier)
+            except AttributeError:
+                continue
+            if hasattr(value, '__len__') and not isinstance(value, str):
+                try:
+                    value = tuple(value)
+                except TypeError:
+                    pass
+            values.append((prop.identifier, repr(value)))
+        signature.append((mod.type, tuple(values)))
+    return tuple(signature)
+
+def _apply_failure_reason(obj):
+    if obj.type != 'MESH':
+        return "not a mesh"
+    if obj.data.library is not None:
+        return "linked mesh"
+    if obj.data.shape_keys is not None:
+        return "has shape keys"
+    return None
+
+def apply_modifier_stacks(context, object_list):
+    '''Bake each object's evaluated mesh through the depsgraph, swap it in and clear the stack.
+    Objects sharing a mesh and an identical stack are evaluated once and share the result.
+    Returns (applied count, [(object name, reason)])'''
+    if context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    failed = []
+    groups = {}
+    for obj in object_list:
+        reason = _apply_failure_reason(obj)
+        if reason:
+            failed.append((obj.name, reason))
+            continue
+        groups.setdefault((obj.data, _modifier_signature(obj)), []).append(obj)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    wm = context.window_manager
+    wm.progress_begin(0, len(groups))
+    applied = 0
+    try:
+        for step, ((old_mesh, _), objects) in enumerate(groups.items()):
+            try:
+                ob_eval = objects[0].evaluated_get(depsgraph)
+                new_mesh = bpy.data.meshes.new_from_object(ob_eval, preserve_all_data_layers=True, depsgraph=depsgraph)
+            except RuntimeError as e:
+                failed += [(obj.name, str(e)) for obj in objects]
+                continue
+            for obj in objects:
+                obj.data = new_mesh
+                obj.modifiers.clear()
+            applied += len(objects)
+            if old_mesh.users == 0:
+                name = old_mesh.name
+                bpy.data.meshes.remove(old_mesh)
+                new_mesh.name = name
+            wm.progress_update(step + 1)
+    finally:
+        wm.progress_end()
+    return applied, failed
+#endregion
@@ -0,0 +1,37 @@
+import bpy
+
+from ..ui import controller
+from ..utility import profiler, frame_monitor
+from ..utility.addon import get_prefs
+from ..utility.system import open_folder
+
+class TMC_OP_ExportProfile(bpy.types.Operator):
+    bl_idname = "tmc.export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Write recorded timings as Chrome trace JSON, plus cProfile dumps if captured"
+
+    def execute(self, context):
+        if not profiler.RECORDS:
+            controller.show_message(context, "ERROR", "Nothing recorded yet!")
+            return {'CANCELLED'}
+        folder = bpy.path.abspath(get_prefs().profiling_export_path) or profiler.default_export_dir()
+        try:
+            trace_path, dumps = profiler.export(folder)
+        except OSError as e:
+            controller.show_message(context, "ERROR", "Export failed: %s" % e)
+            return {'CANCELLED'}
+        print("HS Tool profile:", trace_path, "(%d cProfile dumps)" % dumps)
+        controller.show_message(context, "INFO", "Profile exported: %s (%d cProfile dumps)" % (trace_path, dumps))
+        if not bpy.app.background:
+            open_folder(folder)
+        return {'FINISHED'}
+
+class TMC_OP_ClearProfile(bpy.types.Operator):
+    bl_idname = "tmc.clear_profile"
+    bl_label = "Clear Profile"
+    bl_description = "Forget recorded timings, including draw handler frame times"
+
+    def execute(self, context):
+        profiler.clear()
+        frame_monitor.reset()
+        return {'FINISHED'}
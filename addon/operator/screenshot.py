@@ -1,8 +1,17 @@
 import os
+import tempfile
+import zlib
+import struct
+from math import radians, atan, tan, sin
+from concurrent.futures import ThreadPoolExecutor
+
 import bpy
+import numpy as np
+from mathutils import Matrix, Vector, Euler
 
 from ..utility import variable
 from ..ui import controller
+from ..utility.system import open_folder
 
 class TMC_OP_AutoScreenshot(bpy.types.Operator):
     bl_idname = "tmc.auto_screenshot"
@@ -10,7 +19,11 @@ class TMC_OP_AutoScreenshot(bpy.types.Operator):
     bl_description = "Screenshot all cameras"
 
     def execute(self, context):
-        screenshot_function(context, 'auto')
+        try:
+            screenshot_function(context, 'auto')
+        except OSError as error:
+            self.report({'ERROR'}, "Screenshot failed: %s" % error)
+            return {'CANCELLED'}
         return {'FINISHED'}
 
 class TMC_OP_CustomScreenshot(bpy.types.Operator):
@@ -19,43 +32,274 @@ class TMC_OP_CustomScreenshot(bpy.types.Operator):
     bl_description = "Screenshot custom view"
 
     def execute(self, context):
-        screenshot_function(context, 'custom')
+        try:
+            screenshot_function(context, 'custom')
+        except OSError as error:
+            self.report({'ERROR'}, "Screenshot failed: %s" % error)
+            return {'CANCELLED'}
         return {'FINISHED'}
 
-def setting_auto_screenshot_function(context, camera_name, camera_zoom):
-    if 'persp' not in camera_name:
-        bpy.ops.view3d.view_axis(type=camera_name.upper(), align_active=False, relative=False)
-        if camera_name == 'top' or camera_name == 'bottom':
-            for i in range(6):
-                bpy.ops.view3d.view_orbit(type='ORBITLEFT')
-    else:
-        bpy.ops.view3d.view_axis(type='LEFT', align_active=False, relative=False)
-        bpy.context.space_data.region_3d.view_perspective = 'PERSP'
-        if camera_name == 'persp1':
-            for i in range(3):
-                bpy.ops.view3d.view_orbit(type='ORBITRIGHT')
-        elif camera_name == 'persp2':
-            for i in range(9):
-                bpy.ops.view3d.view_orbit(type='ORBITRIGHT')
-        elif camera_name == 'persp3':
-            for i in range(3):
-                bpy.ops.view3d.view_orbit(type='ORBITLEFT')
-        elif camera_name == 'persp4':
-            for i in range(9):
-                bpy.ops.view3d.view_orbit(type='ORBITLEFT')
-    if len(bpy.context.selected_objects) > 0:
-        bpy.ops.view3d.view_selected()
-        bpy.ops.object.select_all(action='DESELECT')
+#region Capture engine
+# Every auto view is computed analytically instead of driving the viewport with
+# view_axis/view_orbit/zoom: (view rotation as XYZ Euler degrees, perspective).
+# Persp views keep the old behaviour: the left view orbited around Z in 15 degree steps.
+VIEW_SPECS = {
+    'top': ((0, 0, 90), False),
+    'bottom': ((180, 0, 90), False),
+    'front': ((90, 0, 0), False),
+    'back': ((90, 0, 180), False),
+    'left': ((90, 0, -90), False),
+    'right': ((90, 0, 90), False),
+    'persp1': ((90, 0, -90 + 45), True),
+    'persp2': ((90, 0, -90 + 135), True),
+    'persp3': ((90, 0, -90 - 45), True),
+    'persp4': ((90, 0, -90 - 135), True),
+}
+LENS = 50.0
+SENSOR = 36.0
+FRAME_MARGIN = 1.1
+
+def get_capture_bounds(context):
+    '''World-space bounding box corners of the selection (or every visible mesh)'''
+    objects = [o for o in context.selected_objects if o.type in {'MESH', 'CURVE', 'EMPTY'}]
+    if not objects:
+        objects = [o for o in context.scene.objects if o.type == 'MESH' and o.visible_get()]
+    corners = [o.matrix_world @ Vector(c) for o in objects for c in o.bound_box]
+    if not corners:
+        corners = [Vector((-1, -1, -1)), Vector((1, 1, 1))]
+    return corners
+
+def compute_view(camera_name, corners, width, height, zoom=100):
+    '''Return (camera matrix_world, projection matrix, is_persp, fit) framing corners for a view.
+    fit is the ortho scale for orthographic views and the field of view for perspective ones.'''
+    euler, persp = VIEW_SPECS[camera_name]
+    rot = Euler([radians(a) for a in euler], 'XYZ').to_matrix()
+    center = sum(corners, Vector()) / len(corners)
+    radius = max((c - center).length for c in corners) or 1.0
+    scale = FRAME_MARGIN * 100.0 / max(zoom, 1)
+    aspect = width / height
+    rot_inv = rot.transposed()
+    local = [rot_inv @ (c - center) for c in corners]
+
+    if persp:
+        fov = 2 * atan(SENSOR / (2 * LENS))  # along the larger image dimension
+        half_small = atan(tan(fov / 2) * min(width, height) / max(width, height))
+        dist = radius * scale / sin(half_small)
+        near = max(dist - radius * 1.5, dist * 0.001)
+        far = dist + radius * 1.5
+        f_large = 1.0 / tan(fov / 2)
+        fx, fy = (f_large, f_large * aspect) if width >= height else (f_large / aspect, f_large)
+        proj = Matrix((
+            (fx, 0, 0, 0),
+            (0, fy, 0, 0),
+            (0, 0, (far + near) / (near - far), 2 * far * near / (near - far)),
+            (0, 0, -1, 0)))
+        fit = fov
     else:
-        bpy.ops.view3d.view_all(center=False)
-    if 'persp' not in camera_name:
-        bpy.ops.view3d.zoom(delta=1)
-    zoom_value = int((context.scene.camera_zoom_value - 100) / 10)
-    for _ in range(abs(zoom_value)):
-        if zoom_value > 0:
-            bpy.ops.view3d.zoom(delta=1)
+        half_h = max(max(abs(p.y) for p in local), max(abs(p.x) for p in local) / aspect) * scale
+        half_w = half_h * aspect
+        dist = radius * 2 + 1.0
+        near = max(dist - radius * 1.5, 0.001)
+        far = dist + radius * 1.5
+        proj = Matrix((
+            (1 / half_w, 0, 0, 0),
+            (0, 1 / half_h, 0, 0),
+            (0, 0, -2 / (far - near), -(far + near) / (far - near)),
+            (0, 0, 0, 1)))
+        fit = 2 * max(half_w, half_h)
+    cam_mx = Matrix.Translation(center + rot @ Vector((0, 0, dist))) @ rot.to_4x4()
+    return cam_mx, proj, persp, fit, (near, far)
+
+def write_png(path, rgba):
+    '''Encode an (h, w, 4) uint8 array (top row first) as PNG. Pure zlib, safe off the main thread.'''
+    h, w = rgba.shape[:2]
+    raw = np.zeros((h, w * 4 + 1), dtype=np.uint8)
+    raw[:, 1:] = rgba.reshape(h, w * 4)
+    def chunk(tag, data):
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xffffffff)
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, 6, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+    return path
+
+def _to_rgba8(pixels, width, height):
+    '''Float RGBA pixels (bottom row first, as GPU/Blender store them) -> top-down uint8'''
+    arr = np.asarray(pixels, dtype=np.float32).reshape(height, width, 4)[::-1]
+    return (np.clip(arr, 0.0, 1.0) * 255.0 + 0.5).astype(np.uint8)
+
+def _read_buffer(buffer, size):
+    try:
+        return np.frombuffer(buffer, dtype=np.float32, count=size)
+    except (TypeError, ValueError):
+        return np.array(buffer.to_list(), dtype=np.float32).reshape(-1)[:size]
+
+def _view3d_window_region(context):
+    area = context.area if context.area and context.area.type == 'VIEW_3D' else None
+    if area is None and context.screen:
+        area = next((a for a in context.screen.areas if a.type == 'VIEW_3D'), None)
+    if area is None:
+        return None, None
+    region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+    return area.spaces.active, region
+
+def view_resolution(context, name):
+    '''Resolution for a view: the CAMERA_RESOLUTION override or the scene setting'''
+    default = (context.scene.hstool.capture.screenshot_resolution_x, context.scene.hstool.capture.screenshot_resolution_y)
+    return tuple(variable.CAMERA_RESOLUTION.get(name, default))
+
+def render_views_offscreen(context, views, zoom, space, region):
+    '''Draw each view into a GPU offscreen buffer using the viewport's shading; the user's
+    view matrices, selection and render settings are left untouched. Yields (name, rgba8).'''
+    import gpu
+    corners = get_capture_bounds(context)
+    offscreens = {}
+    try:
+        for name in views:
+            width, height = view_resolution(context, name)
+            offscreen = offscreens.get((width, height))
+            if offscreen is None:
+                offscreen = offscreens[(width, height)] = gpu.types.GPUOffScreen(width, height)
+            cam_mx, proj, _, _, _ = compute_view(name, corners, width, height, zoom)
+            with offscreen.bind():
+                fb = gpu.state.active_framebuffer_get()
+                fb.clear(color=(0.0, 0.0, 0.0, 0.0))
+                offscreen.draw_view3d(context.scene, context.view_layer, space, region,
+                                      cam_mx.inverted(), proj, do_color_management=True)
+                buffer = fb.read_color(0, 0, width, height, 4, 0, 'FLOAT')
+            yield name, _to_rgba8(_read_buffer(buffer, width * height * 4), width, height)
+    finally:
+        for offscreen in offscreens.values():
+            offscreen.free()
+
+def render_views_headless(context, views, zoom, image_path):
+    '''blender -b path: render every view with Workbench through a temporary camera.
+    Blender's render result can only be saved on the main thread, so images are written here.'''
+    scene = context.scene
+    render = scene.render
+    saved = (render.engine, render.resolution_x, render.resolution_y, render.resolution_percentage,
+             render.filepath, scene.camera)
+    corners = get_capture_bounds(context)
+    cam_data = bpy.data.cameras.new("HS_ScreenshotCamera")
+    cam_obj = bpy.data.objects.new("HS_ScreenshotCamera", cam_data)
+    scene.collection.objects.link(cam_obj)
+    paths = []
+    try:
+        render.engine = 'BLENDER_WORKBENCH'
+        render.resolution_percentage = 100
+        scene.camera = cam_obj
+        for name in views:
+            width, height = view_resolution(context, name)
+            render.resolution_x = width
+            render.resolution_y = height
+            cam_mx, _, persp, fit, (near, far) = compute_view(name, corners, width, height, zoom)
+            cam_obj.matrix_world = cam_mx
+            cam_data.sensor_fit = 'AUTO'
+            cam_data.clip_start = near
+            cam_data.clip_end = far
+            if persp:
+                cam_data.type = 'PERSP'
+                cam_data.angle = fit
+            else:
+                cam_data.type = 'ORTHO'
+                cam_data.ortho_scale = fit
+            path = image_path + "_" + name + ".png"
+            render.filepath = path
+            bpy.ops.render.render(write_still=True)
+            paths.append(path)
+    finally:
+        (render.engine, render.resolution_x, render.resolution_y, render.resolution_percentage,
+         render.filepath, scene.camera) = saved
+        bpy.data.objects.remove(cam_obj, do_unlink=True)
+        bpy.data.cameras.remove(cam_data)
+    return paths
+
+def load_image_pixels(path):
+    '''Read an image written by Blender back into a top-down uint8 RGBA array'''
+    image = bpy.data.images.load(path, check_existing=False)
+    try:
+        width, height = image.size
+        pixels = np.empty(width * height * 4, dtype=np.float32)
+        image.pixels.foreach_get(pixels)
+        return _to_rgba8(pixels, width, height)
+    finally:
+        bpy.data.images.remove(image)
+
+def resize_image(rgba, max_size):
+    '''Area-average downscale so the longer side is max_size (never upscales)'''
+    h, w = rgba.shape[:2]
+    factor = max_size / max(w, h)
+    if factor >= 1.0:
+        return rgba
+    new_w, new_h = max(1, int(round(w * factor))), max(1, int(round(h * factor)))
+    ys = (np.arange(new_h) * h) // new_h
+    xs = (np.arange(new_w) * w) // new_w
+    sums = np.add.reduceat(np.add.reduceat(rgba.astype(np.uint32), ys, axis=0), xs, axis=1)
+    counts = np.outer(np.diff(np.append(ys, h)), np.diff(np.append(xs, w)))[:, :, None]
+    return (sums / counts + 0.5).astype(np.uint8)
+
+def build_contact_sheet(thumbs, padding=8):
+    '''Tile (name, rgba) thumbnails into a near-square grid, each centred in its cell'''
+    cols = int(np.ceil(np.sqrt(len(thumbs))))
+    rows = int(np.ceil(len(thumbs) / cols))
+    cell_w = max(t.shape[1] for _, t in thumbs)
+    cell_h = max(t.shape[0] for _, t in thumbs)
+    sheet = np.zeros((rows * cell_h + (rows + 1) * padding, cols * cell_w + (cols + 1) * padding, 4), dtype=np.uint8)
+    for i, (_, thumb) in enumerate(thumbs):
+        r, c = divmod(i, cols)
+        h, w = thumb.shape[:2]
+        y = padding + r * (cell_h + padding) + (cell_h - h) // 2
+        x = padding + c * (cell_w + padding) + (cell_w - w) // 2
+        sheet[y:y + h, x:x + w] = thumb
+    return sheet
+
+def _encode_view(path, rgba, thumb_size, write_full, write_thumb):
+    '''Worker: write the full image and/or its thumbnail, return the thumbnail for the sheet'''
+    if write_full:
+        write_png(path + ".png", rgba)
+    if not thumb_size:
+        return None
+    thumb = resize_image(rgba, thumb_size)
+    if write_thumb:
+        write_png(path + "_thumb.png", thumb)
+    return thumb
+
+def capture_views(context, views, folder_path, file_name):
+    '''Capture every view in views to <folder_path>/<file_name>_<view>.png, plus optional
+    "_<view>_thumb.png" thumbnails and an "_contact.png" sheet. folder_path must be the
+    resolved, existing folder from resolve_screenshot_folder().
+    Uses the offscreen engine when a 3D viewport is available (PNG encoding and downscaling
+    run on a thread pool while the next view draws), and the Workbench render otherwise.'''
+    scene = context.scene
+    image_path = os.path.join(folder_path, file_name)
+    zoom = scene.hstool.capture.camera_zoom_value
+    write_thumb = scene.hstool.capture.screenshot_thumbnails
+    write_sheet = scene.hstool.capture.screenshot_contact_sheet
+    thumb_size = scene.hstool.capture.screenshot_thumbnail_size if (write_thumb or write_sheet) else 0
+    space, region = (None, None) if bpy.app.background else _view3d_window_region(context)
+    paths = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=max(1, min(len(views), os.cpu_count() or 1))) as pool:
+        if space is None:
+            paths = render_views_headless(context, views, zoom, image_path)
+            if thumb_size:
+                for name, path in zip(views, paths):
+                    futures.append((name, pool.submit(_encode_view, image_path + "_" + name,
+                                                      load_image_pixels(path), thumb_size, False, write_thumb)))
         else:
-            bpy.ops.view3d.zoom(delta=-1)
+            for name, rgba in render_views_offscreen(context, views, zoom, space, region):
+                futures.append((name, pool.submit(_encode_view, image_path + "_" + name,
+                                                  rgba, thumb_size, True, write_thumb)))
+                paths.append(image_path + "_" + name + ".png")
+        thumbs = [(name, f.result()) for name, f in futures]
+    thumbs = [(name, t) for name, t in thumbs if t is not None]
+    if write_thumb:
+        paths += [image_path + "_" + name + "_thumb.png" for name, _ in thumbs]
+    if write_sheet and thumbs:
+        paths.append(write_png(image_path + "_contact.png", build_contact_sheet(thumbs)))
+    return paths
+#endregion
 
 def toggle_scene_elements(context, toggle):
     bpy.context.space_data.overlay.show_floor = toggle
@@ -65,44 +309,51 @@ def toggle_scene_elements(context, toggle):
     bpy.context.space_data.overlay.show_axis_y = toggle
     bpy.context.space_data.region_3d.view_perspective = 'PERSP'
 
-def screenshot_function(context, mode):
+DEFAULT_SCREENSHOT_FOLDER = "//screenshots/"
 
-    # Get file name
-    file_name = bpy.path.basename(bpy.context.blend_data.filepath).rsplit(".", 1)[0]
-    folder_path = context.scene.get("screenshot_path", "")
-    # Screenshot path
-    image_path = folder_path + file_name
+def resolve_screenshot_folder(context):
+    '''Absolute screenshot folder, created if missing. "//" is resolved against the .blend;
+    an empty path means DEFAULT_SCREENSHOT_FOLDER, and relative paths of an unsaved file go
+    to the temp dir. Raises OSError when the folder can't be created.'''
+    folder_path = context.scene.hstool.capture.screenshot_path.strip() or DEFAULT_SCREENSHOT_FOLDER
+    if folder_path.startswith("//") and not bpy.data.filepath:
+        folder_path = os.path.join(tempfile.gettempdir(), "hstool", folder_path[2:])
+    folder_path = os.path.normpath(bpy.path.abspath(folder_path))
+    os.makedirs(folder_path, exist_ok=True)
+    return folder_path
 
-    # Get selected objects
-    selected_objects = bpy.context.selected_objects
+def screenshot_function(context, mode):
 
-    # Get camera zoom
-    camera_zoom = context.scene.camera_zoom_value
+    # Get file name
+    file_name = bpy.path.basename(bpy.context.blend_data.filepath).rsplit(".", 1)[0] or "untitled"
+    folder_path = resolve_screenshot_folder(context)
 
     # Capture
     ## Auto
     if mode == 'auto':
-        # Loop Camera
-        for camera_name in variable.CAMERA_LIST:
-            setting_auto_screenshot_function(context, camera_name, camera_zoom)
-            capture_on_current_view(context, image_path, camera_name)
-            for o in selected_objects:
-                o.select_set(True)
+        capture_views(context, [name for name in variable.CAMERA_LIST if name in VIEW_SPECS], folder_path, file_name)
     ## Custom
     else:
-        tmp_image_path = folder_path + file_name + "_custom_1.png"
+        # Screenshot path
+        image_path = os.path.join(folder_path, file_name)
         i = 1
-        while os.path.exists(tmp_image_path):
+        while os.path.exists(image_path + "_custom_" + str(i) + ".png"):
             i += 1
-            tmp_image_path = folder_path + file_name + "_custom_" + str(i) + ".png" 
         capture_on_current_view(context, image_path, "custom_" + str(i))
-    
+
+    if bpy.app.background:
+        return
     # Open screenshot folder
-    controller.show_message(context, "INFO", "Screenshot: Done!")	
-    os.startfile(folder_path)
+    controller.show_message(context, "INFO", "Screenshot: Done!")
+    open_folder(folder_path)
 
 def capture_on_current_view(context, image_path, camera_name):
-    context.scene.render.filepath = image_path + "_" + camera_name + ".png"
-    context.scene.render.resolution_x = 3840
-    context.scene.render.resolution_y = 2160
-    bpy.ops.render.opengl(write_still=True, view_context=True)
\ No newline at end of file
+    render = context.scene.render
+    saved = (render.filepath, render.resolution_x, render.resolution_y)
+    render.filepath = image_path + "_" + camera_name + ".png"
+    render.resolution_x = context.scene.hstool.capture.screenshot_resolution_x
+    render.resolution_y = context.scene.hstool.capture.screenshot_resolution_y
+    try:
+        bpy.ops.render.opengl(write_still=True, view_context=True)
+    finally:
+        render.filepath, render.resolution_x, render.resolution_y = saved
@@ -1,5 +1,7 @@
 import bpy, traceback
 import bmesh
+import time
+import numpy as np
 from math import radians
 
 from ..utility.mouse import mouse_warp
@@ -14,25 +16,7 @@ class TMC_OP_UVBySharpEdge(bpy.types.Operator):
     bl_description = "Unwrap UV by Sharp Edge"
     
     def execute(self, context):
-        object_list = [obj for obj in bpy.context.selected_objects]
-        for o in bpy.context.selected_objects:
-            o.select_set(False)
-        for obj in object_list:
-            obj.select_set(True)
-            # Ensure Edit mode and get bmesh from edit mesh
-            bpy.ops.object.mode_set(mode='EDIT')
-            me = obj.data
-            bm = bmesh.from_edit_mesh(me)
-            # Mark seams on edges that are selected
-            for e in bm.edges:
-                if not e.smooth:
-                    e.seam = True
-            # push changes to mesh
-            bmesh.update_edit_mesh(me, loop_triangles=False, destructive=False)
-            # select all faces then unwrap
-            bpy.ops.mesh.select_all(action='SELECT')
-            bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
-            bpy.ops.object.mode_set(mode='OBJECT')
+        uv_by_sharp_edge_function(context)
         return {'FINISHED'}
 
 class TMC_OP_RenameUV1(bpy.types.Operator):
@@ -45,7 +29,7 @@ class TMC_OP_RenameUV1(bpy.types.Operator):
         for obj in mesh_list:
             uv_maps = obj.data.uv_layers
             try:
-                uv_maps[0].name = context.scene.uvset1_name
+                uv_maps[0].name = context.scene.hstool.modifier.uvset1_name
             except:
                 pass
         return {'FINISHED'}
@@ -61,4 +45,91 @@ class TMC_OP_DeleteRedundantUV(bpy.types.Operator):
             uv_maps = obj.data.uv_layers
             while len(uv_maps) > 1:
                 uv_maps.remove(uv_maps[len(uv_maps)-1])
-        return {'FINISHED'}
\ No newline at end of file
+        return {'FINISHED'}
+
+#region UV by sharp edge
+def mark_seams_from_sharp(me):
+    '''Data-level seam pass: use_seam |= use_edge_sharp, no Edit Mode or bmesh needed'''
+    count = len(me.edges)
+    sharp = np.empty(count, dtype=bool)
+    seam = np.empty(count, dtype=bool)
+    me.edges.foreach_get('use_edge_sharp', sharp)
+    me.edges.foreach_get('use_seam', seam)
+    seam |= sharp
+    me.edges.foreach_set('use_seam', seam)
+    return int(sharp.sum())
+
+def _get_element_selection(me):
+    selection = []
+    for elements in (me.vertices, me.edges, me.polygons):
+        data = np.empty(len(elements), dtype=bool)
+        elements.foreach_get('select', data)
+        selection.append(data)
+    return selection
+
+def _set_element_selection(me, selection):
+    for elements, data in zip((me.vertices, me.edges, me.polygons), selection):
+        if len(elements) == len(data):
+            elements.foreach_set('select', data)
+
+def uv_by_sharp_edge_function(context):
+    view_layer = context.view_layer
+    old_mode = context.mode
+    old_active = view_layer.objects.active
+    old_selected = list(context.selected_objects)
+    if context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    # One object per mesh datablock: instances share seams and UVs
+    meshes = {}
+    for obj in old_selected:
+        if obj.type == 'MESH' and obj.data not in meshes and obj.data.library is None:
+            meshes[obj.data] = obj
+    if not meshes:
+        controller.show_message(context, "ERROR", "UV by Sharp Edge: no editable mesh selected")
+        return
+
+    timings = {}
+    selections = {}
+    for me, obj in meshes.items():
+        start = time.perf_counter()
+        mark_seams_from_sharp(me)
+        selections[me] = _get_element_selection(me)
+        timings[obj.name] = time.perf_counter() - start
+
+    # Single multi-object Edit Mode session for the whole unwrap
+    unwrap_start = time.perf_counter()
+    try:
+        for obj in old_selected:
+            obj.select_set(False)
+        for obj in meshes.values():
+            obj.select_set(True)
+        view_layer.objects.active = next(iter(meshes.values()))
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.ops.mesh.select_all(action='SELECT')
+        bpy.ops.uv.unwrap(method='ANGLE_BASED', margin=0.001)
+        bpy.ops.object.mode_set(mode='OBJECT')
+    except RuntimeError:
+        traceback.print_exc()
+    unwrap_time = time.perf_counter() - unwrap_start
+
+    # Restore component and object selection, active object and mode
+    for me, selection in selections.items():
+        _set_element_selection(me, selection)
+    for obj in meshes.values():
+        obj.select_set(False)
+    for obj in old_selected:
+        obj.select_set(True)
+    view_layer.objects.active = old_active
+    if old_mode == 'EDIT_MESH' and old_active and old_active.type == 'MESH':
+        bpy.ops.object.mode_set(mode='EDIT')
+
+    # Unwrap time is shared by the batch, split by face count for the per-object report
+    total_faces = sum(len(me.polygons) for me in meshes) or 1
+    print("UV by Sharp Edge:")
+    for me, obj in meshes.items():
+        share = unwrap_time * len(me.polygons) / total_faces
+        print("  %s: seams %.2f ms, unwrap ~%.2f ms" % (obj.name, timings[obj.name] * 1000, share * 1000))
+    controller.show_message(context, "INFO", "UV by Sharp Edge: %d meshes, seams %.1f ms, unwrap %.1f ms"
+                            % (len(meshes), sum(timings.values()) * 1000, unwrap_time * 1000))
+#endregion
@@ -1,4 +1,6 @@
 import bpy
+import bmesh
+from ..utility.vertex_group_index import bmesh_group_membership, remove_from_groups
 
 class TMC_OP_CleanVertexGroup(bpy.types.Operator):# Operator class should have _OT_ in it
     bl_idname = "tmc.clean_vertex_group"
@@ -22,6 +24,12 @@ class TMC_OP_CleanVertexGroup(bpy.types.Operator):# Operator class should have _
                 for vg in vg_list:
                     if vg is not None:
                         o.vertex_groups.remove(vg)
+        elif mode == 'EDIT':
+            # Remove the selected vertices from all groups through the deform layer
+            obj = context.active_object
+            bm = bmesh.from_edit_mesh(obj.data)
+            if remove_from_groups(bm, bmesh_group_membership(bm, selected_only=True)):
+                bmesh.update_edit_mesh(obj.data, loop_triangles=False, destructive=False)
         else:
             bpy.ops.object.vertex_group_remove_from(use_all_groups=True)
 
@@ -1,22 +1,60 @@
 import bpy
+from bpy.app.handlers import persistent
 
-from .ui import TMC_UIProperty
+from .ui import (
+	TMC_UISettings,
+	TMC_BridgeSettings,
+	TMC_ModifierSettings,
+	TMC_CheckSettings,
+	TMC_BakeSetSettings,
+	TMC_ModelingSettings,
+	TMC_CaptureSettings,
+	TMC_SceneSettings,
+	settings_snapshot,
+	migrate_scene_settings,
+)
 
 classes = [
-	TMC_UIProperty
+	TMC_UISettings,
+	TMC_BridgeSettings,
+	TMC_ModifierSettings,
+	TMC_CheckSettings,
+	TMC_BakeSetSettings,
+	TMC_ModelingSettings,
+	TMC_CaptureSettings,
+	TMC_SceneSettings,
 ]
 
+@persistent
+def migrate_settings_on_load(dummy=None):
+	try:
+		for scene in bpy.data.scenes:
+			migrate_scene_settings(scene)
+	except Exception as e:
+		print('settings migration fail:\n', e)
+
+def _migrate_settings_timer():
+	# bpy.data is restricted while the add-on registers, so the open file is migrated on a timer
+	migrate_settings_on_load()
+	return None
+
 def register_properties():
 	from bpy.utils import register_class
 	for cls in classes:
 		register_class(cls)
+	bpy.types.Scene.hstool = bpy.props.PointerProperty(type=TMC_SceneSettings)
+	if migrate_settings_on_load not in bpy.app.handlers.load_post:
+		bpy.app.handlers.load_post.append(migrate_settings_on_load)
+	bpy.app.timers.register(_migrate_settings_timer, first_interval=0.1)
 	# material row types/collections removed for rework
 
 def unregister_properties():
 	from bpy.utils import unregister_class
-	# unregister material row and remove scene props
-	# material row types/collections removed for rework
+	if migrate_settings_on_load in bpy.app.handlers.load_post:
+		bpy.app.handlers.load_post.remove(migrate_settings_on_load)
+	if bpy.app.timers.is_registered(_migrate_settings_timer):
+		bpy.app.timers.unregister(_migrate_settings_timer)
+	del bpy.types.Scene.hstool
 	for cls in reversed(classes):
 		unregister_class(cls)
 	# TMC_MaterialRow removed during rework; nothing else to unregister here
-    
\ No newline at end of file
@@ -1,12 +1,13 @@
 import bpy
+from types import SimpleNamespace
 from ..ui.controller import *
 
 
 # Material UI helpers and properties removed for rework
 
-class TMC_UIProperty(bpy.types.PropertyGroup):
+class TMC_UISettings(bpy.types.PropertyGroup):
 
-	bpy.types.Scene.menu_tab = bpy.props.EnumProperty(
+	menu_tab: bpy.props.EnumProperty(
 		name="Tool Tab",
 		description="menu tab for specific function",
 		items=(("MODEL", "Model", "Model Function", "MESH_CUBE", 0),
@@ -17,98 +18,98 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 				("MATERIAL", "Material", "Material Function", "MATERIAL", 5)))
 
 	## Modifier
-	bpy.types.Scene.toggle_apply_modifier_ui = bpy.props.BoolProperty(
+	toggle_apply_modifier_ui: bpy.props.BoolProperty(
 		name="Enable Toggle & Apply Modifier UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_subdivision_modifier_ui = bpy.props.BoolProperty(
+	toggle_subdivision_modifier_ui: bpy.props.BoolProperty(
 		name="Enable Subdivision Modifier UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_bevel_modifier_ui = bpy.props.BoolProperty(
+	toggle_bevel_modifier_ui: bpy.props.BoolProperty(
 		name="Enable Bevel Modifier UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_boolean_modifier_ui = bpy.props.BoolProperty(
+	toggle_boolean_modifier_ui: bpy.props.BoolProperty(
 		name="Enable Boolean Modifier UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_mirror_modifier_ui = bpy.props.BoolProperty(
+	toggle_mirror_modifier_ui: bpy.props.BoolProperty(
 		name="Enable Mirror Modifier UI",
 		default=False
 	)
 
 
 	## Model
-	bpy.types.Scene.toggle_edge_length_ui = bpy.props.BoolProperty(
+	toggle_edge_length_ui: bpy.props.BoolProperty(
 		name="Enable Edge Length UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_circle_edge_ui = bpy.props.BoolProperty(
+	toggle_circle_edge_ui: bpy.props.BoolProperty(
 		name="Enable Circle Edge UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_straight_edge_ui = bpy.props.BoolProperty(
+	toggle_straight_edge_ui: bpy.props.BoolProperty(
 		name="Enable Circle Edge UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_relax_edge_ui = bpy.props.BoolProperty(
+	toggle_relax_edge_ui: bpy.props.BoolProperty(
 		name="Enable Relax Edge UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_space_edge_ui = bpy.props.BoolProperty(
+	toggle_space_edge_ui: bpy.props.BoolProperty(
 		name="Enable Space Edge UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_flatten_face_ui = bpy.props.BoolProperty(
+	toggle_flatten_face_ui: bpy.props.BoolProperty(
 		name="Enable Flatten Face UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_smooth_edge_ui = bpy.props.BoolProperty(
+	toggle_smooth_edge_ui: bpy.props.BoolProperty(
 		name="Enable Smooth Edge UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_collection_area_ui = bpy.props.BoolProperty(
+	toggle_collection_area_ui: bpy.props.BoolProperty(
 		name="Enable Collection UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_normal_area_ui = bpy.props.BoolProperty(
+	toggle_normal_area_ui: bpy.props.BoolProperty(
 		name="Enable Normal UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_vertex_group_area_ui = bpy.props.BoolProperty(
+	toggle_vertex_group_area_ui: bpy.props.BoolProperty(
 		name="Enable Vertex Group UI",
 		default=False
 	)
 
 	# Material UI properties
 	# Index of the selected material in the UI list (used by template_list)
-	bpy.types.Scene.material_index = bpy.props.IntProperty(
+	material_index: bpy.props.IntProperty(
 		name="Material Index",
 		default=0
 	)
 
 	# Index of the material row currently being edited (-1 = none)
-	bpy.types.Scene.material_edit_index = bpy.props.IntProperty(
+	material_edit_index: bpy.props.IntProperty(
 		name="Material Edit Index",
 		default=-1
 	)
 
 	# Optional simple search string (not yet wired to a filter UIList)
-	bpy.types.Scene.material_search = bpy.props.StringProperty(
+	material_search: bpy.props.StringProperty(
 		name="Material Search",
 		default=""
 	)
@@ -116,12 +117,11 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	# Color used when creating a new material and for editing selected material
 	def _tmc_update_material_color(self, context):
 		try:
-			scene = context.scene
-			idx = getattr(scene, 'material_index', 0)
+			idx = getattr(self, 'material_index', 0)
 			mats = bpy.data.materials
 			if 0 <= idx < len(mats):
 				mat = mats[idx]
-				col = tuple(getattr(scene, 'material_add_color', (0.8, 0.8, 0.8)))
+				col = tuple(getattr(self, 'material_add_color', (0.8, 0.8, 0.8)))
 				# If material uses nodes, try to set Principled BSDF Base Color
 				try:
 					if getattr(mat, 'use_nodes', False) and mat.node_tree:
@@ -160,7 +160,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		except Exception:
 			pass
 
-	bpy.types.Scene.material_add_color = bpy.props.FloatVectorProperty(
+	material_add_color: bpy.props.FloatVectorProperty(
 	name="Add Material Color",
 	subtype='COLOR',
 	default=(0.8, 0.8, 0.8),
@@ -171,31 +171,33 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	update=_tmc_update_material_color
 )
 
-	bpy.types.Scene.toggle_uv_area_ui = bpy.props.BoolProperty(
+	toggle_uv_area_ui: bpy.props.BoolProperty(
 		name="Enable UV UI",
 		default=False
 	)
 
-	bpy.types.Scene.toggle_capture_area_ui = bpy.props.BoolProperty(
+	toggle_capture_area_ui: bpy.props.BoolProperty(
 			name="Enable Capture UI",
 			default=False
 		)
 
-	bpy.types.Scene.toggle_bakeset_area_ui = bpy.props.BoolProperty(
+	toggle_bakeset_area_ui: bpy.props.BoolProperty(
 		name="Enable Bake Set UI",
 		default=False
 	)
 
 	# --- UI Element Props --- #
 
+class TMC_BridgeSettings(bpy.types.PropertyGroup):
+
 	#region File
-	bpy.types.Scene.blender_maya_normal_radiobox = bpy.props.EnumProperty(
+	blender_maya_normal_radiobox: bpy.props.EnumProperty(
 	name="Normal",
 	items=(("Lock", "Lock", "Lock", "", 0),
 	("Unlock", "Unlock", "Unlock", "", 1))
 )
 
-	bpy.types.Scene.blender_maya_axis_forward_combobox = bpy.props.EnumProperty(
+	blender_maya_axis_forward_combobox: bpy.props.EnumProperty(
 	name="",
 	items=(("X", "X", "X", "", 0),
 	("Y", "Y", "Y", "", 1),
@@ -206,7 +208,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	default="Y"
 	)
 
-	bpy.types.Scene.blender_maya_axis_up_combobox = bpy.props.EnumProperty(
+	blender_maya_axis_up_combobox: bpy.props.EnumProperty(
 	name="",
 	items=(("X", "X", "X", "", 0),
 	("Y", "Y", "Y", "", 1),
@@ -217,13 +219,21 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	default="Z"
 	)
 
+	bridge_cache_path: bpy.props.StringProperty(
+		name="",
+		description="Folder shared with Maya/Max. Empty uses C:/Blender_ImportExport on Windows, ~/Blender_ImportExport elsewhere",
+		default="",
+		subtype='DIR_PATH')
+
 	#endregion
 
 
 # Material row PropertyGroup removed for rework
 
+class TMC_ModifierSettings(bpy.types.PropertyGroup):
+
 	#region Bevel
-	bpy.types.Scene.bevel_unit_value = bpy.props.FloatProperty(
+	bevel_unit_value: bpy.props.FloatProperty(
 		name="Bevel Unit Value",
 		description=":",
 		precision=3,
@@ -232,7 +242,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default=0.001,
 		update=bevel_value_ui_change)
 	
-	bpy.types.Scene.bevel_segment_value = bpy.props.IntProperty(
+	bevel_segment_value: bpy.props.IntProperty(
 		name="Bevel Segment Value",
 		description=":",
 		min=1,
@@ -240,7 +250,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default=1,
 		update=bevel_segment_ui_change)
 
-	bpy.types.Scene.bevel_type = bpy.props.EnumProperty(name="Type",
+	bevel_type: bpy.props.EnumProperty(name="Type",
 		items=(("VGROUP", "Vertex Group", "Use bevel weights to determine how much bevel is applied in edge mode."),
 				("WEIGHT", "Weight", "Use vertex group weights to select whether vertex or edge is beveled."),
 				("ANGLE", "Angle", "Only bevel edges with sharp enough angles between faces.")),
@@ -250,7 +260,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 
 	#region UVset
-	bpy.types.Scene.uvset1_name = bpy.props.StringProperty(
+	uvset1_name: bpy.props.StringProperty(
 		name="UVSet1 Name",
 		description=":",
 		default="map1",
@@ -258,13 +268,13 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 	
 	#region Mirror
-	bpy.types.Scene.current_mirror_object_name = bpy.props.StringProperty(
+	current_mirror_object_name: bpy.props.StringProperty(
 		name="Current Mirror Object Name",
 		description=":",
 		default="",
 		maxlen=1024)
 	
-	bpy.types.Scene.target_mirror_object_name = bpy.props.StringProperty(
+	target_mirror_object_name: bpy.props.StringProperty(
 		name="Target Mirror Object Name",
 		description=":",
 		default="",
@@ -272,76 +282,94 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 
 	#region Vertex group
-	bpy.types.Scene.bevel_modifier_name = bpy.props.StringProperty(
+	bevel_modifier_name: bpy.props.StringProperty(
 		name="Bevel Modifier Name",
 		description=":",
 		default="BevelV",
 		maxlen=1024)
 	#endregion
 
+class TMC_CheckSettings(bpy.types.PropertyGroup):
+
 	#region Check
-	bpy.types.Scene.check_mesh_no_tris = bpy.props.BoolProperty(
+	check_mesh_no_tris: bpy.props.BoolProperty(
 		name="Check Mesh No Tris Result",
 		description="Show no tris checking result",
 		default=True
 		)
 
-	bpy.types.Scene.check_ngons_face = bpy.props.BoolProperty(
+	check_ngons_face: bpy.props.BoolProperty(
 		name="Check N-gons Face Result",
 		description="Show n-gons face checking result",
 		default = True
 		)
 
-	bpy.types.Scene.check_intersect_face = bpy.props.BoolProperty(
+	check_intersect_face: bpy.props.BoolProperty(
 		name="Check Intersect Face Result",
 		description="Show intersect face checking result",
 		default = True
 		)
 
-	bpy.types.Scene.check_non_manifold = bpy.props.BoolProperty(
+	check_non_manifold: bpy.props.BoolProperty(
 		name="Check Non-Manifold Result",
 		description="Show non-manifold checking result",
 		default = True
 		)
 
-	bpy.types.Scene.check_zero_edge_length = bpy.props.BoolProperty(
+	check_zero_edge_length: bpy.props.BoolProperty(
 		name="Check Zero Edge Length Result",
 		description="Show zero edge length checking result",
 		default = True
 		)
 
-	bpy.types.Scene.check_zero_face_area = bpy.props.BoolProperty(
+	check_zero_face_area: bpy.props.BoolProperty(
 		name="Check Tiny Edge Leg Result",
 		description="Show zero face area checking result",
 		default = True
 		)
 
-	bpy.types.Scene.check_isolated_vertex = bpy.props.BoolProperty(
+	check_isolated_vertex: bpy.props.BoolProperty(
 		name="Check Isolated Vertex Result",
 		description="Show isolated vertex checking result",
 		default = True
 		)
 
-	bpy.types.Scene.check_zero_uvset = bpy.props.BoolProperty(
+	check_zero_uvset: bpy.props.BoolProperty(
 		name="Check Zero UVSet Result",
 		description="Show zero UVSet checking result",
 		default = True
 		)
 
-	bpy.types.Scene.viewport_background_color = bpy.props.FloatVectorProperty(
+	viewport_background_color: bpy.props.FloatVectorProperty(
 		name="Colour",
 		subtype='COLOR',
 		default=(0.188, 0.188, 0.188))
 	#endregion
 
+	#region check properties
+	min_edge_length_value: bpy.props.FloatProperty(
+		name="Min Edge Length Value",
+		description=":",
+		precision=4,
+		default=0.001)
+
+	min_face_area_value: bpy.props.FloatProperty(
+		name="Min Face Area Value",
+		description=":",
+		precision=7,
+		default=0.00001)
+	#endregion
+
+class TMC_BakeSetSettings(bpy.types.PropertyGroup):
+
 	#region Bake set
-	bpy.types.Scene.export_bakeset_unlock_normal = bpy.props.BoolProperty(
+	export_bakeset_unlock_normal: bpy.props.BoolProperty(
 		name="Unlock Normal Checkbox",
 		description="On/Off Unlock Normal",
 		default = False
 		)
 
-	bpy.types.Scene.export_bakeset_mode = bpy.props.EnumProperty(
+	export_bakeset_mode: bpy.props.EnumProperty(
 		name="Export Mode",
 		items=[
 		('Single', 'Single File', 'Single', '', 0),
@@ -350,18 +378,18 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default='Multiple')
 
 
-	bpy.types.Scene.bakeset_name = bpy.props.StringProperty(
+	bakeset_name: bpy.props.StringProperty(
 		name="BakeSet Name",
 		description=":",
 		default="BakeSet",
 		maxlen=1024)
 	
-	bpy.types.Scene.threshold_value = bpy.props.FloatProperty(
+	threshold_value: bpy.props.FloatProperty(
 		name="High/Low Threshold Value",
 		description=":",
 		default=0.01)
 	
-	bpy.types.Scene.bakeset_export_path = bpy.props.StringProperty(
+	bakeset_export_path: bpy.props.StringProperty(
 		name="Path",
 		description="Export FBX Path",
 		default="D:/",
@@ -369,22 +397,11 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 
 
-	#region check properties
-	bpy.types.Scene.min_edge_length_value = bpy.props.FloatProperty(
-		name="Min Edge Length Value",
-		description=":",
-		precision=4,
-		default=0.001)
 
-	bpy.types.Scene.min_face_area_value = bpy.props.FloatProperty(
-		name="Min Face Area Value",
-		description=":",
-		precision=7,
-		default=0.00001)
-	#endregion
+class TMC_ModelingSettings(bpy.types.PropertyGroup):
 
 	#region edge length properties
-	bpy.types.Scene.edge_length_value = bpy.props.FloatProperty(
+	edge_length_value: bpy.props.FloatProperty(
 		name="Edge Length Value",
 		description=":",
 		default=0.0)
@@ -392,25 +409,25 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 
 	#region circle properties
 
-	bpy.types.Scene.circle_diameter_toggle = bpy.props.BoolProperty(
+	circle_diameter_toggle: bpy.props.BoolProperty(
 		name="Diameter Checkbox",
 		description="On/Off Diameter Input",
 		default = False
 		)
 
-	bpy.types.Scene.circle_angle_toggle = bpy.props.BoolProperty(
+	circle_angle_toggle: bpy.props.BoolProperty(
 		name="Angle Checkbox",
 		description="On/Off Angle Input",
 		default = False
 		)
 
-	bpy.types.Scene.circle_diameter_value = bpy.props.FloatProperty(
+	circle_diameter_value: bpy.props.FloatProperty(
 		name="Diameter Value",
 		description="Diameter Value",
 		default=1
 		)
 		
-	bpy.types.Scene.circle_angle_value = bpy.props.FloatProperty(
+	circle_angle_value: bpy.props.FloatProperty(
 		name="Angle Value",
 		description="Angle Value",
 		default=180)
@@ -418,13 +435,13 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 
 	#region straight properties
 
-	bpy.types.Scene.even_straight_toggle = bpy.props.BoolProperty(
+	even_straight_toggle: bpy.props.BoolProperty(
 		name="Even Straight Checkbox",
 		description="On/Off Even Straight",
 		default = False
 		)
 
-	bpy.types.Scene.straight_axis_radiobox = bpy.props.EnumProperty(
+	straight_axis_radiobox: bpy.props.EnumProperty(
 		name="Axis",
 		items=[
 		('X', 'X', 'X', '', 0),
@@ -437,7 +454,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	
 	#region relax properties
 
-	bpy.types.Scene.relax_input = bpy.props.EnumProperty(name="Input",
+	relax_input: bpy.props.EnumProperty(name="Input",
 		items=(("all", "Parallel (all)", "Also use non-selected "
 										"parallel loops as input"),
 				("selected", "Selection", "Only use selected vertices as input")),
@@ -445,7 +462,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default='selected'
 	)
 
-	bpy.types.Scene.relax_interpolation = bpy.props.EnumProperty(
+	relax_interpolation: bpy.props.EnumProperty(
 		name="Interpolation",
 		items=(("cubic", "Cubic", "Natural cubic spline, smooth results"),
 				("linear", "Linear", "Simple and fast linear algorithm")),
@@ -453,7 +470,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default='cubic'
 	)
 
-	bpy.types.Scene.relax_iterations = bpy.props.EnumProperty(name="Iterations",
+	relax_iterations: bpy.props.EnumProperty(name="Iterations",
 		items=(("1", "1", "One"),
 				("3", "3", "Three"),
 				("5", "5", "Five"),
@@ -463,13 +480,13 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default="1"
 	)
 
-	bpy.types.Scene.relax_regular = bpy.props.BoolProperty(
+	relax_regular: bpy.props.BoolProperty(
 		name="Regular",
 		description="Distribute vertices at constant distances along the loop",
 		default=True
 	)
 
-	bpy.types.Scene.relax_influence = bpy.props.FloatProperty(
+	relax_influence: bpy.props.FloatProperty(
 		name="Influence",
 		description="Force of the tool",
 		default=100.0,
@@ -483,7 +500,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 
 	#region space properties
 
-	bpy.types.Scene.space_influence = bpy.props.FloatProperty(
+	space_influence: bpy.props.FloatProperty(
 		name="Influence",
 		description="Force of the tool",
 		default=100.0,
@@ -493,7 +510,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		subtype='PERCENTAGE'
 	)
 
-	bpy.types.Scene.space_input = bpy.props.EnumProperty(
+	space_input: bpy.props.EnumProperty(
 		name="Input",
 		items=(("all", "Parallel (all)", "Also use non-selected "
 				"parallel loops as input"),
@@ -502,7 +519,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default='selected'
 	)
 
-	bpy.types.Scene.space_interpolation = bpy.props.EnumProperty(
+	space_interpolation: bpy.props.EnumProperty(
 		name="Interpolation",
 		items=(("cubic", "Cubic", "Natural cubic spline, smooth results"),
 			("linear", "Linear", "Vertices are projected on existing edges")),
@@ -510,19 +527,19 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default='cubic'
 		)
 
-	bpy.types.Scene.space_lock_x = bpy.props.BoolProperty(
+	space_lock_x: bpy.props.BoolProperty(
 		name="Lock X",
 		description="Lock editing of the x-coordinate",
 		default=False
 		)
 
-	bpy.types.Scene.space_lock_y = bpy.props.BoolProperty(
+	space_lock_y: bpy.props.BoolProperty(
 		name="Lock Y",
 		description="Lock editing of the y-coordinate",
 		default=False
 		)
 
-	bpy.types.Scene.space_lock_z = bpy.props.BoolProperty(
+	space_lock_z: bpy.props.BoolProperty(
 		name="Lock Z",
 		description="Lock editing of the z-coordinate",
 		default=False
@@ -531,7 +548,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 
 	#region flatten properties
 
-	bpy.types.Scene.flatten_influence = bpy.props.FloatProperty(
+	flatten_influence: bpy.props.FloatProperty(
 		name="Influence",
 		description="Force of the tool",
 		default=100.0,
@@ -541,23 +558,23 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		subtype='PERCENTAGE'
 		)
 
-	bpy.types.Scene.flatten_lock_x = bpy.props.BoolProperty(
+	flatten_lock_x: bpy.props.BoolProperty(
 		name="Lock X",
 		description="Lock editing of the x-coordinate",
 		default=False
 		)
-	bpy.types.Scene.flatten_lock_y = bpy.props.BoolProperty(
+	flatten_lock_y: bpy.props.BoolProperty(
 		name="Lock Y",
 		description="Lock editing of the y-coordinate",
 		default=False
 		)
 	
-	bpy.types.Scene.flatten_lock_z = bpy.props.BoolProperty(name="Lock Z",
+	flatten_lock_z: bpy.props.BoolProperty(name="Lock Z",
 		description="Lock editing of the z-coordinate",
 		default=False
 		)
 	
-	bpy.types.Scene.flatten_plane = bpy.props.EnumProperty(
+	flatten_plane: bpy.props.EnumProperty(
 		name="Plane",
 		items=(("best_fit", "Best fit", "Calculate a best fitting plane"),
 			  ("normal", "Normal", "Derive plane from averaging vertex normals"),
@@ -566,7 +583,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		default='best_fit'
 		)
 	
-	bpy.types.Scene.flatten_restriction = bpy.props.EnumProperty(
+	flatten_restriction: bpy.props.EnumProperty(
 		name="Restriction",
 		items=(("none", "None", "No restrictions on vertex movement"),
 			   ("bounding_box", "Bounding box", "Vertices are restricted to "
@@ -577,12 +594,12 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 
 	#region curve properties
-	bpy.types.Scene.curve_boundaries = bpy.props.BoolProperty(
+	curve_boundaries: bpy.props.BoolProperty(
 		name="Boundaries",
 		description="Limit the tool to work within the boundaries of the selected vertices",
 		default=False
 		)
-	bpy.types.Scene.curve_influence = bpy.props.FloatProperty(
+	curve_influence: bpy.props.FloatProperty(
 		name="Influence",
 		description="Force of the tool",
 		default=100.0,
@@ -591,35 +608,35 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		precision=1,
 		subtype='PERCENTAGE'
 		)
-	bpy.types.Scene.curve_interpolation = bpy.props.EnumProperty(
+	curve_interpolation: bpy.props.EnumProperty(
 		name="Interpolation",
 		items=(("cubic", "Cubic", "Natural cubic spline, smooth results"),
 			  ("linear", "Linear", "Simple and fast linear algorithm")),
 		description="Algorithm used for interpolation",
 		default='cubic'
 		)
-	bpy.types.Scene.curve_lock_x = bpy.props.BoolProperty(
+	curve_lock_x: bpy.props.BoolProperty(
 		name="Lock X",
 		description="Lock editing of the x-coordinate",
 		default=False
 		)
-	bpy.types.Scene.curve_lock_y = bpy.props.BoolProperty(
+	curve_lock_y: bpy.props.BoolProperty(
 		name="Lock Y",
 		description="Lock editing of the y-coordinate",
 		default=False
 		)
-	bpy.types.Scene.curve_lock_z = bpy.props.BoolProperty(
+	curve_lock_z: bpy.props.BoolProperty(
 		name="Lock Z",
 		description="Lock editing of the z-coordinate",
 		default=False
 		)
-	bpy.types.Scene.curve_regular = bpy.props.BoolProperty(
+	curve_regular: bpy.props.BoolProperty(
 		name="Regular",
 		description="Distribute vertices at constant distances along the curve",
 		default=True
 		)
 	
-	bpy.types.Scene.curve_restriction = bpy.props.EnumProperty(
+	curve_restriction: bpy.props.EnumProperty(
 		name="Restriction",
 		items=(("none", "None", "No restrictions on vertex movement"),
 			  ("extrude", "Extrude only", "Only allow extrusions (no indentations)"),
@@ -630,7 +647,7 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 
 	#region smooth properties
-	bpy.types.Scene.smooth_input = bpy.props.EnumProperty(
+	smooth_input: bpy.props.EnumProperty(
 		name="Input",
 		items=(("all", "Parallel (all)", "Also use non-selected "
 				"parallel loops as input"),
@@ -641,8 +658,10 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 	#endregion
 
 
+class TMC_CaptureSettings(bpy.types.PropertyGroup):
+
 	#region screenshot properties
-	bpy.types.Scene.camera_zoom_value = bpy.props.IntProperty(
+	camera_zoom_value: bpy.props.IntProperty(
 		name="Zoom (%)",
 		description="Camera zoom value",
 		default=100,
@@ -652,10 +671,102 @@ class TMC_UIProperty(bpy.types.PropertyGroup):
 		update=camera_zoom_value_ui_change)
 
 
-	bpy.types.Scene.screenshot_path = bpy.props.StringProperty(
+	screenshot_path: bpy.props.StringProperty(
 		name="",
-		description="Screenshot path",
-		default="D:/",
+		description="Screenshot folder, \"//\" is relative to the .blend file",
+		default="//screenshots/",
 		subtype='DIR_PATH')
 
+	screenshot_resolution_x: bpy.props.IntProperty(
+		name="Width",
+		description="Screenshot width in pixels",
+		default=3840,
+		min=16,
+		max=16384)
+
+	screenshot_resolution_y: bpy.props.IntProperty(
+		name="Height",
+		description="Screenshot height in pixels",
+		default=2160,
+		min=16,
+		max=16384)
+
+	screenshot_thumbnails: bpy.props.BoolProperty(
+		name="Thumbnails",
+		description="Also write a downscaled thumbnail for every view",
+		default=False)
+
+	screenshot_contact_sheet: bpy.props.BoolProperty(
+		name="Contact Sheet",
+		description="Also write one image tiling every view",
+		default=False)
+
+	screenshot_thumbnail_size: bpy.props.IntProperty(
+		name="Thumbnail Size",
+		description="Longest side of thumbnails and contact sheet cells in pixels",
+		default=512,
+		min=32,
+		max=4096)
+
 	#endregion
+
+
+# Every tool setting lives under scene.hstool.<group> instead of ~100 separate Scene properties
+SETTINGS_GROUPS = (
+	("ui", TMC_UISettings),
+	("bridge", TMC_BridgeSettings),
+	("modifier", TMC_ModifierSettings),
+	("check", TMC_CheckSettings),
+	("bakeset", TMC_BakeSetSettings),
+	("modeling", TMC_ModelingSettings),
+	("capture", TMC_CaptureSettings),
+)
+# 1: settings moved from bpy.types.Scene into scene.hstool
+SETTINGS_VERSION = 1
+
+class TMC_SceneSettings(bpy.types.PropertyGroup):
+	ui: bpy.props.PointerProperty(type=TMC_UISettings)
+	bridge: bpy.props.PointerProperty(type=TMC_BridgeSettings)
+	modifier: bpy.props.PointerProperty(type=TMC_ModifierSettings)
+	check: bpy.props.PointerProperty(type=TMC_CheckSettings)
+	bakeset: bpy.props.PointerProperty(type=TMC_BakeSetSettings)
+	modeling: bpy.props.PointerProperty(type=TMC_ModelingSettings)
+	capture: bpy.props.PointerProperty(type=TMC_CaptureSettings)
+	version: bpy.props.IntProperty(default=0, options={'HIDDEN'})
+
+
+def settings_snapshot(group):
+	'''Plain-Python copy of a settings group, read once per execute instead of per-access RNA lookups'''
+	values = {}
+	for prop in group.bl_rna.properties:
+		name = prop.identifier
+		if name == "rna_type":
+			continue
+		value = getattr(group, name)
+		if getattr(prop, "is_array", False):
+			value = tuple(value)
+		values[name] = value
+	return SimpleNamespace(**values)
+
+
+def migrate_scene_settings(scene):
+	'''Move values saved by older versions as Scene ID properties into scene.hstool'''
+	settings = scene.hstool
+	if settings.version >= SETTINGS_VERSION:
+		return False
+	for group_name, cls in SETTINGS_GROUPS:
+		group = getattr(settings, group_name)
+		for name in cls.__annotations__:
+			if name not in scene.keys():
+				continue
+			value = scene[name]
+			if hasattr(value, "to_list"):
+				value = value.to_list()
+			try:
+				# raw ID property write: same storage the RNA property used, no update callbacks
+				group[name] = value
+			except (TypeError, ValueError):
+				pass
+			del scene[name]
+	settings.version = SETTINGS_VERSION
+	return True
@@ -1,22 +1,36 @@
 
 
 def register_addon():
+    from .lazy import timed, print_startup_report
 
     # Properties
-    from ..property import register_properties
-    register_properties()
+    with timed("properties", 'import_ms'):
+        from ..property import register_properties
+    with timed("properties"):
+        register_properties()
 
     # Menus
-    from ..ui import register_menus
-    register_menus()
+    with timed("ui", 'import_ms'):
+        from ..ui import register_menus
+    with timed("ui"):
+        register_menus()
 
     # Operators
     from ..operator import register_operators
     register_operators()
 
+    # Operator class registry used by the HUD pie for poll lookups
+    from ..operator import classes as operator_classes
+    from ..ui import classes as ui_classes
+    from ..ui.menu import build_operator_registry
+    build_operator_registry(operator_classes + ui_classes)
+
     # Keymaps
-    from .keymap import register_keymaps
-    register_keymaps()
+    with timed("keymaps"):
+        from .keymap import register_keymaps
+        register_keymaps()
+
+    print_startup_report()
 
 def unregister_addon():
 
@@ -32,6 +46,9 @@ def unregister_addon():
     from ..operator import unregister_operators
     unregister_operators()
 
+    from ..ui.menu import clear_operator_registry
+    clear_operator_registry()
+
     # Keymaps
     from .keymap import unregister_keymaps
     unregister_keymaps()
@@ -0,0 +1,316 @@
+import os
+import ast
+import json
+import math
+import time
+import importlib
+from contextlib import contextmanager
+
+import bpy
+
+# Lazy operator registration.
+# Operator modules are not imported at startup: a stub with the same bl_idname/bl_label/
+# bl_description/bl_options and the same operator properties is registered instead, and the
+# implementation module is imported on the first call of any callback, poll included (so the
+# first redraw of a button or pie item that polls it, or its first execute/invoke).
+# Stub metadata comes from the module source (ast, no execution) and is cached as JSON keyed
+# on file mtime and size, so unchanged modules cost a dict lookup on later startups.
+# Properties are rebuilt from their annotations, which works as long as every argument is a
+# literal or a module-level literal constant (enum item lists); a property with an update
+# callback, a dynamic enum or a PointerProperty keeps its module eager.
+# PropertyGroups with literal properties and no methods are stubbed the same way.
+
+STUB_CALLBACKS = ('execute', 'invoke', 'modal', 'draw', 'cancel', 'check')
+STUB_CLASS_CALLBACKS = ('poll', 'description')
+STUB_BASES = ('Operator', 'PropertyGroup')
+STUB_CACHE_NAME = "hs_lazy_stubs.json"
+STUB_CACHE_VERSION = 3
+
+STARTUP_REPORT = []  # [{'name', 'import_ms', 'register_ms', 'mode'}] in registration order
+_LAZY_MODULES = {}   # module name -> {'package', 'loaded', 'stubs': [stub classes]}
+LOAD_CALLBACKS = []  # f(module name, module) after a deferred module is imported
+
+
+#region Startup report
+def _report_row(name, mode):
+    for row in STARTUP_REPORT:
+        if row['name'] == name:
+            return row
+    row = {'name': name, 'import_ms': 0.0, 'register_ms': 0.0, 'mode': mode}
+    STARTUP_REPORT.append(row)
+    return row
+
+@contextmanager
+def timed(name, field='register_ms', mode='step'):
+    '''Add the block's wall time to the report row called name'''
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _report_row(name, mode)[field] += (time.perf_counter() - start) * 1000.0
+
+def format_startup_report():
+    lines = ["HS Tool startup (ms):", "  %-28s %9s %9s  %s" % ("module/step", "import", "register", "mode")]
+    total_import = total_register = 0.0
+    for row in STARTUP_REPORT:
+        lines.append("  %-28s %9.2f %9.2f  %s" % (row['name'], row['import_ms'], row['register_ms'], row['mode']))
+        if row['mode'] != 'deferred':
+            total_import += row['import_ms']
+            total_register += row['register_ms']
+    lines.append("  %-28s %9.2f %9.2f" % ("total (startup)", total_import, total_register))
+    return "\n".join(lines)
+
+def print_startup_report():
+    if bpy.app.debug or os.environ.get("HSTOOL_STARTUP_REPORT"):
+        print(format_startup_report())
+#endregion
+
+
+#region Stub metadata
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return None
+
+def _is_literal(node):
+    try:
+        ast.literal_eval(node)
+    except (ValueError, TypeError, SyntaxError):
+        return False
+    return True
+
+def _imported_names(tree, module):
+    '''Names bound by "from <module> import ..." at the top of the module'''
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.ImportFrom) and node.module == module:
+            names.update(alias.asname or alias.name for alias in node.names)
+    return names
+
+def _module_constants(tree):
+    '''{name: value node} of the top-level NAME = <literal> assignments'''
+    constants = {}
+    for node in tree.body:
+        if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                and isinstance(node.targets[0], ast.Name) and _is_literal(node.value)):
+            constants[node.targets[0].id] = node.value
+    return constants
+
+FOLDED_MATH = ('radians', 'degrees')  # math.radians(<number>) etc. in property defaults and limits
+
+def _literal_source(node, constants, math_names):
+    '''Source of a literal value, module constants and math.radians/degrees(<number>) folded'''
+    if isinstance(node, ast.Name) and node.id in constants:
+        node = constants[node.id]
+    if isinstance(node, ast.Call) and len(node.args) == 1 and not node.keywords:
+        func = ast.unparse(node.func)
+        func = func[len('math.'):] if func.startswith('math.') else func if func in math_names else None
+        if func in FOLDED_MATH:
+            value = _literal(node.args[0])
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                return repr(getattr(math, func)(value))
+        return None
+    return ast.unparse(node) if _is_literal(node) else None
+
+def _property_spec(node, props_names, constants, math_names):
+    '''[bpy.props function, {keyword: literal source}] for a property annotation, or None
+    when it can't be rebuilt without running the module'''
+    if not isinstance(node, ast.Call) or node.args:
+        return None
+    func = ast.unparse(node.func)
+    if func.startswith('bpy.props.'):
+        func = func[len('bpy.props.'):]
+    elif func not in props_names:
+        return None
+    keywords = {}
+    for keyword in node.keywords:
+        source = _literal_source(keyword.value, constants, math_names) if keyword.arg else None
+        if source is None:
+            return None
+        keywords[keyword.arg] = source
+    return [func, keywords]
+
+def scan_module(path):
+    '''{class name: metadata} for the top-level classes of an operator module'''
+    with open(path, 'r', encoding='utf-8') as f:
+        tree = ast.parse(f.read(), filename=path)
+    types_names = _imported_names(tree, 'bpy.types')
+    props_names = _imported_names(tree, 'bpy.props')
+    math_names = _imported_names(tree, 'math')
+    constants = _module_constants(tree)
+    result = {}
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        meta = {'methods': [], 'properties': [], 'stubbable': True}
+        base = None
+        if len(node.bases) == 1 and not node.keywords:
+            base = ast.unparse(node.bases[0])
+            if base.startswith('bpy.types.'):
+                base = base[len('bpy.types.'):]
+            elif base not in types_names:
+                base = None
+        if base not in STUB_BASES:
+            meta['stubbable'] = False
+        meta['base'] = base
+        for item in node.body:
+            if isinstance(item, ast.FunctionDef):
+                meta['methods'].append(item.name)
+            elif isinstance(item, ast.AnnAssign):
+                spec = _property_spec(item.annotation, props_names, constants, math_names)
+                if spec is None or item.value is not None or not isinstance(item.target, ast.Name):
+                    meta['stubbable'] = False
+                else:
+                    meta['properties'].append([item.target.id] + spec)
+            elif isinstance(item, ast.Assign):
+                for target in item.targets:
+                    if isinstance(target, ast.Name) and target.id.startswith('bl_'):
+                        value = _literal(item.value)
+                        if value is None:
+                            meta['stubbable'] = False
+                        elif isinstance(value, set):
+                            value = sorted(value)
+                        meta[target.id] = value
+        if any(isinstance(n, ast.Name) and n.id == 'super' for n in ast.walk(node)):
+            meta['stubbable'] = False
+        if base == 'PropertyGroup':
+            # nothing to forward to: the stub is the whole class
+            if meta['methods']:
+                meta['stubbable'] = False
+        elif not isinstance(meta.get('bl_idname'), str):
+            meta['stubbable'] = False
+        result[node.name] = meta
+    return result
+
+def load_stub_metadata(package_dir, module_names):
+    cache_path = os.path.join(package_dir, "__pycache__", STUB_CACHE_NAME)
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+        if cache.get('version') != STUB_CACHE_VERSION:
+            cache = {}
+    except (OSError, ValueError):
+        cache = {}
+    modules = cache.get('modules', {})
+    changed = False
+    for module_name in module_names:
+        path = os.path.join(package_dir, module_name + ".py")
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        key = [stat.st_mtime_ns, stat.st_size]
+        entry = modules.get(module_name)
+        if entry is None or entry.get('key') != key:
+            modules[module_name] = {'key': key, 'classes': scan_module(path)}
+            changed = True
+    if changed:
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'version': STUB_CACHE_VERSION, 'modules': modules}, f)
+        except OSError:
+            # read-only install: metadata is rebuilt from source next startup
+            pass
+    return {name: modules[name]['classes'] for name in module_names if name in modules}
+#endregion
+
+
+#region Stubs
+def _load_module(module_name):
+    state = _LAZY_MODULES[module_name]
+    if state['loaded']:
+        return
+    with timed(module_name, 'import_ms', 'deferred'):
+        module = importlib.import_module("." + module_name, state['package'])
+    for stub in state['stubs']:
+        impl = getattr(module, stub._hs_impl_name)
+        # helpers and class constants, so self.<helper>() inside the implementation resolves
+        for key, value in impl.__dict__.items():
+            if key.startswith('__') or key.startswith('bl_') or key in STUB_CALLBACKS or key in STUB_CLASS_CALLBACKS:
+                continue
+            setattr(stub, key, value)
+        stub._hs_impl = impl
+    state['loaded'] = True
+    for callback in LOAD_CALLBACKS:
+        callback(module_name, module)
+
+def _impl(cls):
+    if cls._hs_impl is None:
+        _load_module(cls._hs_module)
+    return cls._hs_impl
+
+def _make_forwarder(name):
+    def forward(self, context, *args):
+        return getattr(_impl(type(self)), name)(self, context, *args)
+    forward.__name__ = name
+    return forward
+
+def _make_class_forwarder(name):
+    def forward(cls, *args):
+        return getattr(_impl(cls), name)(*args)
+    forward.__name__ = name
+    return classmethod(forward)
+
+def _make_property(func, keywords):
+    return getattr(bpy.props, func)(**{key: ast.literal_eval(value) for key, value in keywords.items()})
+
+def make_stub(package, module_name, class_name, meta):
+    namespace = {
+        '__module__': package + "." + module_name,
+        '__annotations__': {name: _make_property(func, keywords)
+                            for name, func, keywords in meta['properties']},
+        '_hs_module': module_name,
+        '_hs_impl_name': class_name,
+        '_hs_impl': None,
+    }
+    if meta['base'] == 'PropertyGroup':
+        return type(class_name, (bpy.types.PropertyGroup,), namespace)
+    namespace['bl_idname'] = meta['bl_idname']
+    namespace['bl_label'] = meta.get('bl_label', class_name)
+    for key in ('bl_description', 'bl_options', 'bl_undo_group', 'bl_translation_context', 'bl_property'):
+        if key in meta:
+            namespace[key] = set(meta[key]) if key == 'bl_options' else meta[key]
+    for name in STUB_CALLBACKS:
+        if name in meta['methods']:
+            namespace[name] = _make_forwarder(name)
+    for name in STUB_CLASS_CALLBACKS:
+        if name in meta['methods']:
+            namespace[name] = _make_class_forwarder(name)
+    return type(class_name, (bpy.types.Operator,), namespace)
+
+def resolve_classes(package, package_dir, class_specs):
+    '''class_specs: [(module name, class name)] in registration order.
+    Returns the classes to register: stubs for modules where every listed class is stubbable,
+    the real classes (module imported now) otherwise.'''
+    module_names = list(dict.fromkeys(module for module, _ in class_specs))
+    with timed("operator stub metadata", mode='step'):
+        metadata = load_stub_metadata(package_dir, module_names)
+    lazy = set()
+    for module_name in module_names:
+        names = [cls for module, cls in class_specs if module == module_name]
+        classes_meta = metadata.get(module_name, {})
+        if all(classes_meta.get(name, {}).get('stubbable') for name in names):
+            lazy.add(module_name)
+            _LAZY_MODULES[module_name] = {'package': package, 'loaded': False, 'stubs': []}
+
+    result = []
+    for module_name, class_name in class_specs:
+        if module_name in lazy:
+            stub = make_stub(package, module_name, class_name, metadata[module_name][class_name])
+            _LAZY_MODULES[module_name]['stubs'].append(stub)
+            _report_row(module_name, 'lazy')
+            result.append(stub)
+        else:
+            with timed(module_name, 'import_ms', 'eager'):
+                module = importlib.import_module("." + module_name, package)
+            result.append(getattr(module, class_name))
+    return result
+
+def is_stub(cls):
+    return getattr(cls, '_hs_module', None) in _LAZY_MODULES
+
+def clear_lazy_modules():
+    _LAZY_MODULES.clear()
+#endregion
@@ -2,6 +2,8 @@ import os
 import bpy
 from bpy.utils import previews
 from ..utility import variable
+from ..utility.draw import clear_draw_cache
+from ..utility import modifier_index
 from .menu import *
 from .panel import *
 from . import handlers
@@ -9,6 +11,7 @@ from . import handlers
 classes = [
 	TMC_OT_HUDPieMenu,
 	TMC_MT_Main_Panel,
+	TMC_PT_Profiler,
 	TMC_UL_MaterialList,
 ]
 
@@ -23,12 +26,21 @@ def register_menus():
 	pcoll.load("false_icon", os.path.join(my_icons_dir, "false.png"), 'IMAGE')
 	pcoll.load("true_icon", os.path.join(my_icons_dir, "true.png"), 'IMAGE')
 	variable.PREVIEW_COLLECTIONS["main"] = pcoll
+	# Pie icons: filled lazily by name and preloaded on a timer (bpy.data is restricted during register)
+	variable.PREVIEW_COLLECTIONS["pie"] = previews.new()
+	if not bpy.app.timers.is_registered(preload_icons):
+		bpy.app.timers.register(preload_icons, first_interval=0.5)
 
 	# register handlers to sync selection -> material index
 	try:
 		handlers.register()
 	except Exception:
 		pass
+	# keep the modifier target index fresh from depsgraph updates
+	try:
+		modifier_index.register()
+	except Exception:
+		pass
 
 def unregister_menus():
 	from bpy.utils import unregister_class
@@ -36,12 +48,19 @@ def unregister_menus():
 		unregister_class(cls)
 
 	# Unregister Icons
+	if bpy.app.timers.is_registered(preload_icons):
+		bpy.app.timers.unregister(preload_icons)
 	for pcoll in variable.PREVIEW_COLLECTIONS.values():
 		bpy.utils.previews.remove(pcoll)
 	variable.PREVIEW_COLLECTIONS.clear()
+	clear_draw_cache()
 
 	# unregister handlers
 	try:
 		handlers.unregister()
+	except Exception:
+		pass
+	try:
+		modifier_index.unregister()
 	except Exception:
 		pass
\ No newline at end of file
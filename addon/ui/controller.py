@@ -9,6 +9,10 @@ def draw_message(self, context):
 def show_message(context, icon, content):
     global message_content
     message_content = content
+    if bpy.app.background:
+        # no window to show a popup in (headless runs, benchmarks)
+        print("HS Tool %s: %s" % (icon, content))
+        return
     context.window_manager.popup_menu(draw_message, icon=icon)
 
 def camera_zoom_value_ui_change(self, context):
@@ -27,7 +31,7 @@ def camera_zoom_value_ui_change(self, context):
                             else:
                                 bpy.ops.view3d.view_all(center=False)
                             # Calculating
-                            zoom_value = int((context.scene.camera_zoom_value - 100) / 10)
+                            zoom_value = int((context.scene.hstool.capture.camera_zoom_value - 100) / 10)
                             for _ in range(abs(zoom_value)):
                                 if zoom_value > 0:
                                     bpy.ops.view3d.zoom(delta=1)
@@ -42,7 +46,7 @@ def bevel_value_ui_change(self, context):
     max_segment = 16
     segment_list = [(0.001, 1), (0.003, 2), (0.006, 4), (0.012, 5)]
     # unit: meter
-    bevel_value = context.scene.bevel_unit_value
+    bevel_value = context.scene.hstool.modifier.bevel_unit_value
 
     for i in range(0, len(segment_list)):
         if bevel_value < segment_list[0][0]:
@@ -61,15 +65,15 @@ def bevel_value_ui_change(self, context):
                 segment = segment_list[i][1] if (bevel_value - segment_list[i][0] < ((segment_list[i+1][0] - segment_list[i][0]) / 2)) else segment_list[i+1][1]
                 break
     
-    context.scene.bevel_segment_value = segment
+    context.scene.hstool.modifier.bevel_segment_value = segment
 
     # If bevel modifier exists
     obj = context.active_object
     for mod in obj.modifiers:
         if mod.type == "BEVEL":
-            if mod.name == context.scene.bevel_modifier_name:
-                mod.width = context.scene.bevel_unit_value
-                mod.segments = context.scene.bevel_segment_value
+            if mod.name == context.scene.hstool.modifier.bevel_modifier_name:
+                mod.width = context.scene.hstool.modifier.bevel_unit_value
+                mod.segments = context.scene.hstool.modifier.bevel_segment_value
                 break
 
 def bevel_segment_ui_change(self, context):
@@ -77,26 +81,26 @@ def bevel_segment_ui_change(self, context):
     obj = context.active_object
     for mod in obj.modifiers:
         if mod.type == "BEVEL":
-            if mod.name == context.scene.bevel_modifier_name:
-                mod.segments = context.scene.bevel_segment_value
+            if mod.name == context.scene.hstool.modifier.bevel_modifier_name:
+                mod.segments = context.scene.hstool.modifier.bevel_segment_value
                 break
 
 def update_bevel_modifier_name_ui(self, context):
-    if context.scene.bevel_type == "VGROUP":
-        context.scene.bevel_modifier_name = "BevelV"
-    elif context.scene.bevel_type == "WEIGHT":
-        context.scene.bevel_modifier_name = "BevelW"
-    elif context.scene.bevel_type == "ANGLE":
-        context.scene.bevel_modifier_name = "BevelA"
+    if context.scene.hstool.modifier.bevel_type == "VGROUP":
+        context.scene.hstool.modifier.bevel_modifier_name = "BevelV"
+    elif context.scene.hstool.modifier.bevel_type == "WEIGHT":
+        context.scene.hstool.modifier.bevel_modifier_name = "BevelW"
+    elif context.scene.hstool.modifier.bevel_type == "ANGLE":
+        context.scene.hstool.modifier.bevel_modifier_name = "BevelA"
 
 def update_edge_length_value_ui(context, value):
-    context.scene.edge_length_value = value
+    context.scene.hstool.modeling.edge_length_value = value
     return True
 
 def update_circle_diameter_value_ui(context, value):
-    context.scene.circle_diameter_value = value
+    context.scene.hstool.modeling.circle_diameter_value = value
     return True
 
 def update_circle_angle_value_ui(context, value):
-    context.scene.circle_angle_value = value
+    context.scene.hstool.modeling.circle_angle_value = value
     return True
\ No newline at end of file
@@ -1,5 +1,6 @@
 import bpy
 import bmesh
+from ..utility.selection import has_face_selection
 
 
 def _get_selected_material_from_active_mesh(context):
@@ -10,6 +11,8 @@ def _get_selected_material_from_active_mesh(context):
         active_obj = context.active_object
         if not active_obj or active_obj.type != 'MESH':
             return None
+        if not has_face_selection(active_obj):
+            return None
         try:
             bm = bmesh.from_edit_mesh(active_obj.data)
             for f in bm.faces:
@@ -44,9 +47,9 @@ def depsgraph_handler(depsgraph):
             last = getattr(ctx.scene, '_tmc_last_material_idx', None)
             if last == new_idx:
                 return
-            if getattr(ctx.scene, 'material_index', None) != new_idx:
+            if getattr(ctx.scene.hstool.ui, 'material_index', None) != new_idx:
                 try:
-                    ctx.scene.material_index = new_idx
+                    ctx.scene.hstool.ui.material_index = new_idx
                     try:
                         ctx.scene['_tmc_last_material_idx'] = new_idx
                     except Exception:
@@ -3,15 +3,23 @@ import bmesh
 import weakref
 import math
 from math import pi
-from ..utility.draw import draw_tris, draw_line, draw_circle, draw_label
+from mathutils import Matrix
+from ..utility.draw import draw_label, draw_batch, register_batch
 import os
 from ..utility.draw import draw_image_2d
+from ..utility import variable
+from ..utility import frame_monitor
+from ..utility.selection import edit_mesh_has_selection
 import types
 import traceback
+import tracemalloc
 
 ICONS_DIR = os.path.join(os.path.dirname(__file__), 'icons')
-_ICON_CACHE = {}
-_OP_CLASS_CACHE = None  # lazy-built mapping of bl_idname -> operator class
+_ICON_CACHE = {}  # icon file name -> bpy.types.Image
+_ICON_FILES = {}  # icon file name -> absolute path (see _icon_index)
+_ICON_DIR_MTIME = None
+_OP_CLASS_CACHE = None  # bl_idname -> operator class, built at register (see build_operator_registry)
+_OP_CLASS_MISSES = set()  # idnames that didn't resolve since the pie was last opened
 
 # -----------------------------
 # Easy theme / tuning parameters (user-adjustable at top of file)
@@ -35,40 +43,77 @@ PIE_CONFIG = {
     'SIDE_LABEL_COLOR': (1,1,1,0.9),
     'CANCEL_HINT': False,          # we keep cancel by center hover but hide visuals
     'HOVER_GUIDE': False,
+    'PROFILE_ALLOC': False,         # print per-frame Python allocation of the pie draw (tracemalloc)
 }
 
-def _load_icon_image(name):
-    """Load an image from addon/ui/icons by file name. Cached by absolute path."""
-    path = os.path.join(ICONS_DIR, name)
-    if not os.path.exists(path):
-        return None
-    abspath = os.path.abspath(path)
-    # If we have a cached image object, ensure it's still valid in bpy.data.images
-    if abspath in _ICON_CACHE:
-        cached = _ICON_CACHE[abspath]
+def _icon_index():
+    """Map icon file name -> absolute path for the icons folder.
+    Rebuilt (and image/preview caches dropped) only when the folder's mtime changes."""
+    global _ICON_DIR_MTIME
+    try:
+        mtime = os.stat(ICONS_DIR).st_mtime
+    except OSError:
+        return {}
+    if mtime != _ICON_DIR_MTIME:
+        _ICON_FILES.clear()
+        _ICON_CACHE.clear()
         try:
-            if cached and cached in bpy.data.images:
-                return cached
-        except Exception:
+            for entry in os.scandir(ICONS_DIR):
+                if entry.is_file() and entry.name.lower().endswith('.png'):
+                    _ICON_FILES[entry.name] = os.path.abspath(entry.path)
+        except OSError:
             pass
-        # stale cache entry, remove and attempt to reload
-        _ICON_CACHE.pop(abspath, None)
-    # try find an already loaded image with same filepath
-    for im in bpy.data.images:
+        _ICON_DIR_MTIME = mtime
+        pcoll = variable.PREVIEW_COLLECTIONS.get('pie')
+        if pcoll is not None:
+            pcoll.clear()
+    return _ICON_FILES
+
+
+def _load_icon_image(name):
+    """Load an image from addon/ui/icons by file name. Cached by file name."""
+    path = _icon_index().get(name)
+    if not path:
+        return None
+    cached = _ICON_CACHE.get(name)
+    if cached is not None:
         try:
-            if im.filepath and os.path.abspath(bpy.path.abspath(im.filepath)) == abspath:
-                _ICON_CACHE[abspath] = im
-                return im
-        except Exception:
-            pass
+            # accessing a removed ID raises ReferenceError; otherwise the cache is still valid
+            cached.name
+            return cached
+        except ReferenceError:
+            _ICON_CACHE.pop(name, None)
     try:
-        im = bpy.data.images.load(abspath, check_existing=True)
-        _ICON_CACHE[abspath] = im
+        im = bpy.data.images.load(path, check_existing=True)
+        _ICON_CACHE[name] = im
         return im
     except Exception:
         return None
 
 
+def get_icon_id(name):
+    """Return the preview icon_id for an icon file (0 when missing), for use in UI layouts."""
+    path = _icon_index().get(name)
+    pcoll = variable.PREVIEW_COLLECTIONS.get('pie')
+    if not path or pcoll is None:
+        return 0
+    if name not in pcoll:
+        pcoll.load(name, path, 'IMAGE')
+    return pcoll[name].icon_id
+
+
+def preload_icons():
+    """Timer callback: load every pie icon once so the first pie open doesn't stall.
+    bpy.data is restricted while the add-on registers, so this runs on a timer instead."""
+    for name in list(_icon_index()):
+        _load_icon_image(name)
+        try:
+            get_icon_id(name)
+        except Exception:
+            pass
+    return None
+
+
 def _hud_draw(op_id):
     """Module-level draw handler. Looks up the weakref for the operator and calls its _draw.
     This prevents the draw handler from keeping the operator RNA alive and avoids
@@ -97,12 +142,32 @@ def _hud_draw(op_id):
             return
         # call operator draw
         try:
-            op._draw(bpy.context)
+            if PIE_CONFIG.get('PROFILE_ALLOC'):
+                _profile_alloc(op._draw, bpy.context)
+            else:
+                op._draw(bpy.context)
         except Exception:
             pass
     except Exception:
         pass
 
+def _profile_alloc(fn, context):
+    """Run one pie frame under tracemalloc and report the Python memory it allocated."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        fn(context)
+        after = tracemalloc.take_snapshot()
+        stats = after.compare_to(before, 'filename')
+        allocated = sum(st.size_diff for st in stats if st.size_diff > 0)
+        blocks = sum(st.count_diff for st in stats if st.count_diff > 0)
+        print(f"HUDPie frame: {allocated} bytes in {blocks} blocks")
+    finally:
+        if started:
+            tracemalloc.stop()
+
 # Preferences helper -----------------------------------------------------------
 def _get_addon_prefs():
     try:
@@ -167,25 +232,7 @@ def get_pie_items(context=None):
 # --------------------------------------
 # Enable/Disable conditions for pie items (optional overrides)
 def _cond_mesh_edit_component_selected(context):
-    obj = context.active_object
-    if not obj or obj.type != 'MESH' or context.mode != 'EDIT_MESH':
-        return False
-    try:
-        bm = bmesh.from_edit_mesh(obj.data)
-        if any(v.select for v in bm.verts):
-            return True
-        if any(e.select for e in bm.edges):
-            return True
-        if any(f.select for f in bm.faces):
-            return True
-    except Exception:
-        # fallback to mesh data if bmesh not available
-        try:
-            if any(p.select for p in obj.data.polygons):
-                return True
-        except Exception:
-            pass
-    return False
+    return edit_mesh_has_selection(context)
 
 # Map operator idnames to default enable conditions (rarely needed if poll is correct)
 OP_ENABLE_RULES = {
@@ -196,53 +243,62 @@ CONDITIONS = {
     'mesh_edit_component_selected': _cond_mesh_edit_component_selected,
 }
 
-def _find_operator_class(op_idname):
+def build_operator_registry(classes):
+    """Populate the bl_idname -> class registry from the add-on's own class lists.
+    Called once from register_addon(); avoids scanning dir(bpy.types)."""
+    global _OP_CLASS_CACHE
+    _OP_CLASS_CACHE = {}
+    _OP_CLASS_MISSES.clear()
+    for cls in classes:
+        bid = getattr(cls, 'bl_idname', None)
+        if bid and issubclass(cls, bpy.types.Operator):
+            _OP_CLASS_CACHE[bid] = cls
+
+def clear_operator_registry():
     global _OP_CLASS_CACHE
-    # Build cache once to avoid scanning bpy.types every draw
+    _OP_CLASS_CACHE = None
+    _OP_CLASS_MISSES.clear()
+
+def forget_operator_misses():
+    """Called when the pie opens: add-ons enabled since the last open may now provide
+    operators that missed before, so their polls get one fresh lookup per open."""
+    _OP_CLASS_MISSES.clear()
+
+def _find_operator_class(op_idname):
     if _OP_CLASS_CACHE is None:
-        mapping = {}
-        try:
-            for name in dir(bpy.types):
-                cls = getattr(bpy.types, name, None)
-                if not isinstance(cls, type):
-                    continue
-                try:
-                    if issubclass(cls, bpy.types.Operator):
-                        bid = getattr(cls, 'bl_idname', None)
-                        if bid:
-                            mapping[bid] = cls
-                except Exception:
-                    continue
-        except Exception:
-            mapping = {}
-        _OP_CLASS_CACHE = mapping
-    # Return from cache; if not present, best-effort fallback
+        return None
     cls = _OP_CLASS_CACHE.get(op_idname)
-    if cls:
+    if cls or op_idname in _OP_CLASS_MISSES:
         return cls
-    # One-off slow path to find and cache
+    # Operators from other add-ons: Blender exposes them as bpy.types.MOD_OT_name,
+    # so one direct lookup replaces the old dir(bpy.types) scan. Misses are remembered
+    # until the pie is opened again (see forget_operator_misses).
+    cls = None
     try:
-        for name in dir(bpy.types):
-            cls2 = getattr(bpy.types, name, None)
-            if not isinstance(cls2, type):
-                continue
-            try:
-                if issubclass(cls2, bpy.types.Operator):
-                    if getattr(cls2, 'bl_idname', None) == op_idname:
-                        _OP_CLASS_CACHE[op_idname] = cls2
-                        return cls2
-            except Exception:
-                continue
+        mod, fn = op_idname.split('.', 1)
+        cand = getattr(bpy.types, f"{mod.upper()}_OT_{fn}", None)
+        if isinstance(cand, type) and issubclass(cand, bpy.types.Operator):
+            cls = cand
     except Exception:
-        pass
-    return None
+        cls = None
+    if cls:
+        _OP_CLASS_CACHE[op_idname] = cls
+    else:
+        _OP_CLASS_MISSES.add(op_idname)
+    return cls
 
-def _is_item_enabled(context, entry):
+def _is_item_enabled(context, entry, memo=None):
+    """memo: optional dict shared across one draw so each operator is polled only once per frame."""
     try:
         op = entry[1] if len(entry) >= 2 else None
         # If no operator, disabled
         if not op:
             return False
+        if memo is not None:
+            key = (op, entry[2].get('enable_if') if len(entry) >= 3 and isinstance(entry[2], dict) else None)
+            if key not in memo:
+                memo[key] = _is_item_enabled(context, entry)
+            return memo[key]
         # Explicit per-item condition via props.enable_if
         cond_key = None
         if len(entry) >= 3 and isinstance(entry[2], dict):
@@ -331,6 +387,88 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
             pass
         return idx
 
+    def _arc_points(self, cx, cy, r, a0, a1, steps):
+        return [(cx + r * math.cos(a0 + (a1 - a0) * k / steps), cy + r * math.sin(a0 + (a1 - a0) * k / steps), 0)
+                for k in range(steps + 1)]
+
+    def _build_geometry(self):
+        """Tessellate every pie element once on invoke and register it as retained batches.
+        Ring variants (one per hover state) and hover wedges are stored as handles; their GPU
+        batches are only created the first time that state is drawn."""
+        cx, cy = self.center
+        R_inner = self._R_inner
+        R_outer = self._R_outer
+        n = max(1, len(self._slice_items))
+        step = 2*pi / n
+        extrude = PIE_CONFIG.get('HOVER_OUTER_EXTRUDE', 0.0)
+        pad_r = 2.0
+        pad_ang = 0.006
+        inner_ring = self._arc_points(cx, cy, R_inner, 0.0, 2*pi, 48)
+
+        # Border (inner ring + outer arcs) and spokes for each hover state (-1 = nothing hovered)
+        self._ring_handles = {}
+        for hover in range(-1, n):
+            coords = []
+            indices = []
+            for pts in [inner_ring] + [self._arc_points(cx, cy, R_outer + (extrude if hover == i else 0.0),
+                                                          -pi/2 + i * step, -pi/2 + (i + 1) * step, 48)
+                                       for i in range(n)]:
+                base = len(coords)
+                coords.extend(pts)
+                indices.extend((base + k, base + k + 1) for k in range(len(pts) - 1))
+            spokes = []
+            for j, a in enumerate(self._angles):
+                # Skip spokes that coincide with hovered slice edges to hide the white seam
+                if hover != -1 and (j == hover or j == (hover + 1) % n):
+                    continue
+                spokes.append((cx + R_inner * math.cos(a), cy + R_inner * math.sin(a), 0))
+                spokes.append((cx + R_outer * math.cos(a), cy + R_outer * math.sin(a), 0))
+            spoke_indices = [(k, k + 1) for k in range(0, len(spokes), 2)]
+            self._ring_handles[hover] = (register_batch(coords, indices=indices),
+                                         register_batch(spokes, indices=spoke_indices))
+
+        # Hover wedge fill + bold outline per slice, padded so outlines meet the fill exactly
+        self._hover_handles = []
+        r_in_edge = R_inner - pad_r
+        r_out_edge = R_outer + pad_r + extrude
+        for i in range(n):
+            a0 = -pi/2 + i * step
+            a1 = a0 + step
+            fill = self._sector_tris(cx, cy, r_in_edge, r_out_edge, a0 - pad_ang, a1 + pad_ang, steps=64)
+            outline = [
+                (cx + r_in_edge * math.cos(a0), cy + r_in_edge * math.sin(a0), 0),
+                (cx + r_out_edge * math.cos(a0), cy + r_out_edge * math.sin(a0), 0),
+                (cx + r_in_edge * math.cos(a1), cy + r_in_edge * math.sin(a1), 0),
+                (cx + r_out_edge * math.cos(a1), cy + r_out_edge * math.sin(a1), 0),
+            ]
+            outline_indices = [(0, 1), (2, 3)]
+            for pts in (self._arc_points(cx, cy, r_out_edge, a0, a1, 72), self._arc_points(cx, cy, r_in_edge, a0, a1, 72)):
+                base = len(outline)
+                outline.extend(pts)
+                outline_indices.extend((base + k, base + k + 1) for k in range(len(pts) - 1))
+            self._hover_handles.append((register_batch([(x, y, 0) for (x, y) in fill], batch_type='TRIS'),
+                                        register_batch(outline, indices=outline_indices)))
+
+        # Dim overlay for disabled slices; rebuilt only when the enabled flags change
+        self._slice_sector_tris = [
+            [(x, y, 0) for (x, y) in self._sector_tris(cx, cy, R_inner + 1.0, R_outer - 1.0,
+                                                       -pi/2 + i * step + 0.01, -pi/2 + (i + 1) * step - 0.01, steps=36)]
+            for i in range(n)
+        ]
+        self._dim_handle = register_batch([], batch_type='TRIS')
+        self._dim_flags = None
+
+    def _get_dim_handle(self, enabled_flags):
+        flags = tuple(enabled_flags)
+        if flags != self._dim_flags:
+            coords = []
+            for i, enabled in enumerate(flags):
+                if not enabled and i < len(self._slice_sector_tris):
+                    coords.extend(self._slice_sector_tris[i])
+            self._dim_handle.update(coords)
+            self._dim_flags = flags
+        return self._dim_handle
+
     def _draw(self, context):
         # Hovering color & config
         cfg = PIE_CONFIG
@@ -340,78 +478,30 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
         R_outer = getattr(self, '_R_outer', self.radius)
         R_inner = getattr(self, '_R_inner', int(self.radius * PIE_CONFIG['INNER_RADIUS_FACTOR']))
         R_center = getattr(self, '_R_center', int(R_inner * PIE_CONFIG['CENTER_RADIUS_FACTOR']))
+        if not hasattr(self, '_ring_handles'):
+            return
 
-        # Determine hover state early to decide ring drawing
         items = getattr(self, '_slice_items', None) or (self._items(context) or self._fallback_items())
         n = max(1, len(items))
-        hovering_center_early = False
+        # Determine if cursor is in center and which slice index is hovered
+        hovering_center = False
         if hasattr(self, 'mouse'):
             mx, my = self.mouse
             dx, dy = mx - cx, my - cy
-            hovering_center_early = dx*dx + dy*dy <= (R_center * R_center)
+            hovering_center = dx*dx + dy*dy <= (R_center * R_center)
         # compute enabled flags once and reuse
-        enabled_flags_early = []
         try:
-            for entry in items:
-                enabled_flags_early.append(_is_item_enabled(context, entry))
+            poll_memo = {}
+            enabled_flags = [_is_item_enabled(context, entry, poll_memo) for entry in items]
         except Exception:
-            enabled_flags_early = [True] * n
+            enabled_flags = [True] * n
         # only treat a slice as hovered for visuals if it's enabled
-        idx_current = getattr(self, 'index', -1)
-        hover_index_early = idx_current if (0 <= idx_current < n and not hovering_center_early and enabled_flags_early[idx_current]) else -1
-
-        # base ring and spokes
-        # Draw inner ring globally; outer border will be drawn per-slice (allows only hovered slice to expand)
-        draw_circle(loc=(cx, cy, 0), radius=R_inner, segments=48, color=cfg['BORDER_COLOR'], width=2.0)
-        # Precompute hover state so we can skip spokes at hovered edges (only for enabled slice)
-        angles = getattr(self, '_angles', None)
-        if not angles or len(angles) != n:
-            angles = [-pi/2 + i * (2*pi / n) for i in range(n)]
-        # Determine if cursor is in center and which slice index is hovered
-        hovering_center = False
-        if hasattr(self, 'mouse'):
-            mx, my = self.mouse
-            dx, dy = mx - cx, my - cy
-            hovering_center = dx*dx + dy*dy <= (R_center * R_center)
-        idx_current = getattr(self, 'index', -1)
-        hover_index_for_spokes = idx_current if (0 <= idx_current < n and not hovering_center and enabled_flags_early[idx_current]) else -1
-        for j, a in enumerate(angles):
-            # Skip spokes that coincide with hovered slice edges to hide the white seam
-            if hover_index_for_spokes != -1 and (j == hover_index_for_spokes or j == ((hover_index_for_spokes + 1) % n)):
-                continue
-            x0 = cx + R_inner * math.cos(a)
-            y0 = cy + R_inner * math.sin(a)
-            x1 = cx + R_outer * math.cos(a)
-            y1 = cy + R_outer * math.sin(a)
-            draw_line([(x0, y0, 0), (x1, y1, 0)], color=cfg['SPOKE_COLOR'], width=1.5)
-
-        # Draw outer arc border per slice; hovered and enabled slice uses extruded radius
-        for i in range(n):
-            a0_i = -pi/2 + i * (2*pi / n)
-            a1_i = a0_i + (2*pi / n)
-            r_out_line = R_outer + (PIE_CONFIG.get('HOVER_OUTER_EXTRUDE', 0.0) if (hover_index_early == i) else 0.0)
-            arc_steps = 48
-            arc_pts = []
-            for k in range(arc_steps+1):
-                t = k/arc_steps
-                ang_k = a0_i*(1-t) + a1_i*t
-                arc_pts.append((cx + r_out_line * math.cos(ang_k), cy + r_out_line * math.sin(ang_k), 0))
-            draw_line(arc_pts, color=cfg['BORDER_COLOR'], width=2.0)
-
-        # draw slice icons (use cached slice items/images if available)
-        items = getattr(self, '_slice_items', None) or (self._items(context) or self._fallback_items())
-        n = max(1, len(items))
-        # reuse enabled flags from early computation
-        enabled_flags = enabled_flags_early if len(enabled_flags_early) == n else [True] * n
-        # determine hover center before deciding slice visuals
-        hovering_center = False
-        if hasattr(self, 'mouse'):
-            mx, my = self.mouse
-            dx, dy = mx - cx, my - cy
-            hovering_center = dx*dx + dy*dy <= (R_center * R_center)
+        hover_index = self.index if (0 <= self.index < n and not hovering_center and enabled_flags[self.index]) else -1
 
-        # only treat hover as active when the hovered slice is enabled
-        hover_index = (self.index if (0 <= self.index < n and not hovering_center and enabled_flags[self.index]) else -1)
+        # base ring and spokes: hovered and enabled slice uses extruded outer arc
+        border, spokes = self._ring_handles.get(hover_index, self._ring_handles[-1])
+        draw_batch(border, color=cfg['BORDER_COLOR'], width=2.0)
+        draw_batch(spokes, color=cfg['SPOKE_COLOR'], width=1.5)
 
         # Apply global pie growth when hovering a slice
         scale_pie = PIE_CONFIG.get('PIE_RADIUS_HOVER_SCALE', 1.0) if hover_index != -1 else 1.0
@@ -419,95 +509,39 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
             R_outer *= scale_pie
             R_inner *= scale_pie
             R_center = int(R_inner * PIE_CONFIG['CENTER_RADIUS_FACTOR'])
-        for i in range(n):
-            # Use precomputed slice images/labels when available (computed in invoke)
+
+        # draw slice icons (use cached slice images computed in invoke)
+        slice_images = getattr(self, '_slice_images', [])
+        for i in range(min(n, len(slice_images))):
+            picked = slice_images[i]
+            if not picked:
+                continue
             # apply slice scale on hover
             slice_scale = (cfg['SLICE_SCALE_HOVER'] if i == hover_index else 1.0)
             am = -pi/2 + (i + 0.5) * (2*pi / n)
             r_mid = R_inner + 0.55 * (R_outer - R_inner) * slice_scale
             x = cx + r_mid * math.cos(am)
             y = cy + r_mid * math.sin(am)
-            picked = None
             try:
-                if hasattr(self, '_slice_images') and i < len(self._slice_images):
-                    picked = self._slice_images[i]
+                size = cfg['ICON_SIZE'] * (cfg['HOVER_ICON_SCALE'] if i == hover_index else 1.0)
+                draw_image_2d(picked, x - size/2, y - size/2, size, size)
             except Exception:
-                picked = None
-
-            if picked:
-                try:
-                    size = cfg['ICON_SIZE'] * (cfg['HOVER_ICON_SCALE'] if i == hover_index else 1.0)
-                    draw_image_2d(picked, x - size/2, y - size/2, size, size)
-                except Exception:
-                    pass
-
-            # Dim overlay if this slice is disabled
-            if not enabled_flags[i]:
-                try:
-                    # use precomputed overlay tris when available
-                    tris_i = None
-                    if hasattr(self, '_slice_sector_tris') and i < len(self._slice_sector_tris):
-                        tris_i = self._slice_sector_tris[i]
-                    if not tris_i:
-                        a0_i = -pi/2 + i * (2*pi / n)
-                        a1_i = a0_i + (2*pi / n)
-                        tris_i = self._sector_tris(cx, cy, R_inner + 1.0, R_outer - 1.0, a0_i + 0.01, a1_i - 0.01, steps=40)
-                    draw_tris([(xx, yy, 0) for (xx, yy) in tris_i], color=(0.0, 0.0, 0.0, 0.4))
-                except Exception:
-                    pass
+                pass
 
-        # highlight selected sector with overdraw (or center if hovering center)
+        # Dim overlay over every disabled slice in a single batch
+        if not all(enabled_flags):
+            draw_batch(self._get_dim_handle(enabled_flags), color=(0.0, 0.0, 0.0, 0.4))
 
-        # sector angular extents depend on current slice count
-        n = getattr(self, '_slice_count', None)
-        if not n:
-            n = max(1, len(getattr(self, '_slice_items', []) or self._items(context) or []))
-        try:
-            n = int(n) if n and n > 0 else 8
-        except Exception:
-            n = 8
-        a0 = -pi/2 + self.index * (2*pi / n)
-        a1 = a0 + (2*pi / n)
-        pad_r_inner = 2.0
-        pad_r_outer = 2.0
-        pad_ang = 0.006
-        if not hovering_center and hover_index != -1:
-            tris = self._sector_tris(cx, cy,
-                                     R_inner - pad_r_inner,
-                                     R_outer + pad_r_outer + PIE_CONFIG.get('HOVER_OUTER_EXTRUDE', 0.0),
-                                     a0 - pad_ang,
-                                     a1 + pad_ang,
-                                     steps=64)
-            draw_tris([(x, y, 0) for (x, y) in tris], color=cfg['HOVER_SLICE_FILL'])
-
-        # bold outlines — align radial edges and arcs to the same padded radii so seams disappear
-        if not hovering_center and hover_index != -1:
-        # use the same padding as the filled sector so the outlines meet exactly
-            r_in_edge = R_inner - pad_r_inner
-            r_out_edge = R_outer + pad_r_outer + PIE_CONFIG.get('HOVER_OUTER_EXTRUDE', 0.0)
-            rx0_in, ry0_in = cx + r_in_edge * math.cos(a0), cy + r_in_edge * math.sin(a0)
-            rx0_out, ry0_out = cx + r_out_edge * math.cos(a0), cy + r_out_edge * math.sin(a0)
-            rx1_in, ry1_in = cx + r_in_edge * math.cos(a1), cy + r_in_edge * math.sin(a1)
-            rx1_out, ry1_out = cx + r_out_edge * math.cos(a1), cy + r_out_edge * math.sin(a1)
-            draw_line([(rx0_in, ry0_in, 0), (rx0_out, ry0_out, 0)], color=hi, width=3.8)
-            draw_line([(rx1_in, ry1_in, 0), (rx1_out, ry1_out, 0)], color=hi, width=3.8)
-
-        # increase tessellation for smoother arc outlines (balanced)
-        if not hovering_center and hover_index != -1:
-            arc_steps = 72
-            arc_pts = []
-            for i in range(arc_steps+1):
-                t = i/arc_steps
-                a = a0*(1-t) + a1*t
-                arc_pts.append((cx + r_out_edge * math.cos(a), cy + r_out_edge * math.sin(a), 0))
-            draw_line(arc_pts, color=hi, width=3.8)
-
-            inner_arc_pts = []
-            for i in range(arc_steps+1):
-                t = i/arc_steps
-                a = a0*(1-t) + a1*t
-                inner_arc_pts.append((cx + r_in_edge * math.cos(a), cy + r_in_edge * math.sin(a), 0))
-            draw_line(inner_arc_pts, color=hi, width=3.8)
+        # highlight selected sector with overdraw and bold outlines
+        if hover_index != -1 and hover_index < len(self._hover_handles):
+            fill, outline = self._hover_handles[hover_index]
+            if scale_pie != 1.0:
+                mx_scale = (Matrix.Translation((cx, cy, 0)) @ Matrix.Scale(scale_pie, 4)
+                            @ Matrix.Translation((-cx, -cy, 0)))
+            else:
+                mx_scale = Matrix()
+            draw_batch(fill, mx=mx_scale, color=cfg['HOVER_SLICE_FILL'])
+            draw_batch(outline, mx=mx_scale, color=hi, width=3.8)
 
         # Hover guideline removed per request
 
@@ -535,14 +569,14 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
         try:
             icon_img = None
             if hovering_center:
-                # Prefer cancel.png; fallback to false.png or blender.png
-                icon_img = _load_icon_image('cancel.png') or _load_icon_image('false.png') or _load_icon_image('blender.png')
+                # Prefer cancel.png; fallback to false.png or blender.png (resolved in invoke)
+                icon_img = getattr(self, '_cancel_image', None)
                 # Override label to make intent obvious
                 center_label = "Cancel"
             elif items and hasattr(self, '_slice_images') and self.index < len(self._slice_images):
                 icon_img = self._slice_images[self.index]
             else:
-                icon_img = _load_icon_image('blender.png')
+                icon_img = getattr(self, '_default_image', None)
             if icon_img:
                 icon_size = int(PIE_CONFIG['ICON_SIZE'] * 1.05)
                 draw_image_2d(icon_img, cx - icon_size/2, cy - icon_size/2 + 8, icon_size, icon_size)
@@ -559,6 +593,7 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
         area = context.area
         if not area or area.type != 'VIEW_3D':
             return {'CANCELLED'}
+        forget_operator_misses()
         self.center = (event.mouse_region_x, event.mouse_region_y)
         self.mouse = (event.mouse_region_x, event.mouse_region_y)
         # Base radius from config
@@ -578,7 +613,7 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
             _menu_mod._HUD_HANDLERS = {}
 
         _menu_mod._HUD_OPS[op_id] = weakref.ref(self)
-        handler = bpy.types.SpaceView3D.draw_handler_add(_menu_mod._hud_draw, (op_id,), 'WINDOW', 'POST_PIXEL')
+        handler = frame_monitor.add_handler('hud_pie', _menu_mod._hud_draw, (op_id,), 'POST_PIXEL')
         _menu_mod._HUD_HANDLERS[op_id] = handler
         self._hud_id = op_id
         self._handle = handler
@@ -595,6 +630,8 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
             # store up to 8 items
             self._slice_items = list(items[:8])
             self._slice_images = []
+            self._default_image = _load_icon_image('blender.png')
+            self._cancel_image = _load_icon_image('cancel.png') or _load_icon_image('false.png') or self._default_image
             self._slice_labels = []
             # precompute radii and angles
             self._R_outer = self.radius
@@ -651,7 +688,7 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
                         picked = img
                         break
                 if not picked:
-                    picked = _load_icon_image('blender.png')
+                    picked = self._default_image
                 self._slice_images.append(picked)
                 self._slice_labels.append(label)
                 # update slice_count so _angle_to_index and drawing use the same value
@@ -660,21 +697,8 @@ class TMC_OT_HUDPieMenu(bpy.types.Operator):
                 except Exception:
                     self._slice_count = None
 
-            # Precompute dim-overlay tris for each slice to avoid recomputation during draw
-            try:
-                cx, cy = self.center
-                R_inner = self._R_inner
-                R_outer = self._R_outer
-                n = max(1, len(self._slice_items))
-                tris_list = []
-                for i in range(n):
-                    a0_i = -pi/2 + i * (2*pi / n)
-                    a1_i = a0_i + (2*pi / n)
-                    tris_i = self._sector_tris(cx, cy, R_inner + 1.0, R_outer - 1.0, a0_i + 0.01, a1_i - 0.01, steps=36)
-                    tris_list.append(tris_i)
-                self._slice_sector_tris = tris_list
-            except Exception:
-                self._slice_sector_tris = []
+            # Precompute every static pie element and the per-slice hover wedges
+            self._build_geometry()
         except Exception:
             try:
                 self._slice_images = []
@@ -2,6 +2,8 @@ import bpy
 import bmesh
 from .controller import *
 from ..utility import variable
+from ..utility import profiler, frame_monitor
+from ..utility.selection import has_face_selection
 
 
 # Material UI and UIList classes removed for rework per user request
@@ -22,7 +24,7 @@ class TMC_UL_MaterialList(bpy.types.UIList):
 				if mode and str(mode).upper().startswith('EDIT'):
 					# In Edit Mode: check active object's selected faces
 					active_obj = context.active_object
-					if active_obj and active_obj.type == 'MESH':
+					if active_obj and active_obj.type == 'MESH' and has_face_selection(active_obj):
 						try:
 							bm = bmesh.from_edit_mesh(active_obj.data)
 							for f in bm.faces:
@@ -77,7 +79,7 @@ class TMC_UL_MaterialList(bpy.types.UIList):
 				col.label(text="")
 			# Name column (wide). Draw editable input with no emboss when active so it blends with the row highlight
 			col = row.split(factor=0.87, align=True)
-			if index == getattr(context.scene, 'material_index', 0):
+			if index == getattr(context.scene.hstool.ui, 'material_index', 0):
 				col.prop(mat, "name", text="", emboss=False)
 			else:
 				col.label(text=mat.name)
@@ -105,26 +107,26 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 		box = layout.box()
 		row = box.row(align=True)
 		row.scale_y = 1.5
-		for index, item in enumerate(context.scene.bl_rna.properties["menu_tab"].enum_items):   
-				row.prop_enum(context.scene, "menu_tab", item.identifier)
+		for index, item in enumerate(context.scene.hstool.ui.bl_rna.properties["menu_tab"].enum_items):   
+				row.prop_enum(context.scene.hstool.ui, "menu_tab", item.identifier)
 				if index == 2: # new line after third item
 					row = box.row(align=True) 
 					row.scale_y = 1.5
 		
 		# Modifier Tab UI
-		if scene.menu_tab == "MODIFIER":
+		if scene.hstool.ui.menu_tab == "MODIFIER":
 						
 			## Toggle & Apply
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_apply_modifier_ui:
-				split.prop(scene, "toggle_apply_modifier_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_apply_modifier_ui:
+				split.prop(scene.hstool.ui, "toggle_apply_modifier_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_apply_modifier_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_apply_modifier_ui", text="", icon="RIGHTARROW")
 			split.label(text="Toggle & Apply")
-			if scene.toggle_apply_modifier_ui:
+			if scene.hstool.ui.toggle_apply_modifier_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				row.operator("tmc.toggle_modifier", text = "Toggle Modifiers")
@@ -137,21 +139,21 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_bevel_modifier_ui:
-				split.prop(scene, "toggle_bevel_modifier_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_bevel_modifier_ui:
+				split.prop(scene.hstool.ui, "toggle_bevel_modifier_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_bevel_modifier_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_bevel_modifier_ui", text="", icon="RIGHTARROW")
 			split.label(text="Bevel")
-			if scene.toggle_bevel_modifier_ui:
+			if scene.hstool.ui.toggle_bevel_modifier_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
-				row.prop(scene, "bevel_modifier_name", text="")
-				row.prop(scene, "bevel_type", text="")
+				row.prop(scene.hstool.modifier, "bevel_modifier_name", text="")
+				row.prop(scene.hstool.modifier, "bevel_type", text="")
 				row = child_box.row(align=True)
-				row.prop(scene, "bevel_unit_value", text="Value")
+				row.prop(scene.hstool.modifier, "bevel_unit_value", text="Value")
 				row = child_box.row(align=True)
-				row.prop(scene, "bevel_segment_value", text="Segment")
+				row.prop(scene.hstool.modifier, "bevel_segment_value", text="Segment")
 				row = child_box.row(align=True)
 				row.operator("tmc.bevel_with_custom_setting", text = "Create Bevel")
 				row.scale_y = 2.0
@@ -163,35 +165,39 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_boolean_modifier_ui:
-				split.prop(scene, "toggle_boolean_modifier_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_boolean_modifier_ui:
+				split.prop(scene.hstool.ui, "toggle_boolean_modifier_ui", text="", icon="DOWNARROW_HLT")
 
 			else:
-				split.prop(scene, "toggle_boolean_modifier_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_boolean_modifier_ui", text="", icon="RIGHTARROW")
 			split.label(text="Boolean")
-			if scene.toggle_boolean_modifier_ui:
+			if scene.hstool.ui.toggle_boolean_modifier_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				row.operator("tmc.boolean", text = "Simple Boolean")
 				row.scale_y = 2.0
+				row = child_box.row(align=True)
+				row.operator("tmc.select_cutter_users", text = "Select Cutter Users")
+				row.operator("tmc.consolidate_boolean", text = "Consolidate")
+				row.scale_y = 1.5
 
 			## Mirror
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_mirror_modifier_ui:
-				split.prop(scene, "toggle_mirror_modifier_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_mirror_modifier_ui:
+				split.prop(scene.hstool.ui, "toggle_mirror_modifier_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_mirror_modifier_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_mirror_modifier_ui", text="", icon="RIGHTARROW")
 			split.label(text="Mirror")
-			if scene.toggle_mirror_modifier_ui:
+			if scene.hstool.ui.toggle_mirror_modifier_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
-				row.prop(scene, "current_mirror_object_name", text="Source")
+				row.prop(scene.hstool.modifier, "current_mirror_object_name", text="Source")
 
 				row = child_box.row(align=True)
-				row.prop(scene, "target_mirror_object_name", text="Target")
+				row.prop(scene.hstool.modifier, "target_mirror_object_name", text="Target")
 
 				row = child_box.row(align=True)
 				row.operator("tmc.select_object_from_current_mirror", text = "Select Object From Source")
@@ -202,21 +208,21 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 				row.scale_y = 1.5
 
 		# Model Tab UI
-		if scene.menu_tab == "MODEL":
+		if scene.hstool.ui.menu_tab == "MODEL":
 
 			## Edge Length
 			main_box = layout.box()
 			row = main_box.row(align=True)
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_edge_length_ui:
-				split.prop(scene, "toggle_edge_length_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_edge_length_ui:
+				split.prop(scene.hstool.ui, "toggle_edge_length_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_edge_length_ui", text="", icon="RIGHTARROW")
-			split.prop(scene, "edge_length_value", text="")
+				split.prop(scene.hstool.ui, "toggle_edge_length_ui", text="", icon="RIGHTARROW")
+			split.prop(scene.hstool.modeling, "edge_length_value", text="")
 			split.operator("tmc.set_edge_length", text = "Set Edge")
 			row.scale_y = 2.0
-			if scene.toggle_edge_length_ui:
+			if scene.hstool.ui.toggle_edge_length_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				col = row.column(align=True)
@@ -234,23 +240,23 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_circle_edge_ui:
-				split.prop(scene, "toggle_circle_edge_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_circle_edge_ui:
+				split.prop(scene.hstool.ui, "toggle_circle_edge_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_circle_edge_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_circle_edge_ui", text="", icon="RIGHTARROW")
 			split.operator("tmc.circle_edge", text = "Circle Edge")
 			row.scale_y = 2.0
-			if scene.toggle_circle_edge_ui:
+			if scene.hstool.ui.toggle_circle_edge_ui:
 				# Line 1
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				row.scale_y = 1.2
 				col = row.column(align=True)
-				col.prop(scene, "circle_diameter_toggle", text="Diameter")
+				col.prop(scene.hstool.modeling, "circle_diameter_toggle", text="Diameter")
 				col = row.column(align=True)
-				col.prop(scene, "circle_diameter_value", text="")
-				if context.scene.circle_diameter_toggle == False:
+				col.prop(scene.hstool.modeling, "circle_diameter_value", text="")
+				if context.scene.hstool.modeling.circle_diameter_toggle == False:
 					col.enabled = False 
 				col = row.column(align=True)
 				col.operator("tmc.get_circle_diameter", text = "Get")
@@ -258,10 +264,10 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 				row = child_box.row(align=True)
 				row.scale_y = 1.2
 				col = row.column(align=True)
-				col.prop(scene, "circle_angle_toggle", text="Angle")
+				col.prop(scene.hstool.modeling, "circle_angle_toggle", text="Angle")
 				col = row.column(align=True)
-				col.prop(scene, "circle_angle_value", text="")
-				if context.scene.circle_angle_toggle == False:
+				col.prop(scene.hstool.modeling, "circle_angle_value", text="")
+				if context.scene.hstool.modeling.circle_angle_toggle == False:
 					col.enabled = False 
 				col = row.column(align=True)
 				col.operator("tmc.get_circle_angle", text = "Get")
@@ -279,134 +285,134 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_straight_edge_ui:
-				split.prop(scene, "toggle_straight_edge_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_straight_edge_ui:
+				split.prop(scene.hstool.ui, "toggle_straight_edge_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_straight_edge_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_straight_edge_ui", text="", icon="RIGHTARROW")
 			split.operator("tmc.straight_edge", text = "Straight Edge")
 			row.scale_y = 2.0
-			if scene.toggle_straight_edge_ui:
+			if scene.hstool.ui.toggle_straight_edge_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
-				row.prop(scene, "straight_axis_radiobox", expand = True)
+				row.prop(scene.hstool.modeling, "straight_axis_radiobox", expand = True)
 				row = child_box.row(align=True)
-				row.prop(scene, "even_straight_toggle", text="Even")
-				if context.scene.straight_axis_radiobox != "All":
+				row.prop(scene.hstool.modeling, "even_straight_toggle", text="Even")
+				if context.scene.hstool.modeling.straight_axis_radiobox != "All":
 					row.enabled = False
 
 			## Relax Edge
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_relax_edge_ui:
-				split.prop(scene, "toggle_relax_edge_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_relax_edge_ui:
+				split.prop(scene.hstool.ui, "toggle_relax_edge_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_relax_edge_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_relax_edge_ui", text="", icon="RIGHTARROW")
 			split.operator("tmc.relax_edge", text = "Relax Edge")
 			row.scale_y = 2.0
-			if scene.toggle_relax_edge_ui:
+			if scene.hstool.ui.toggle_relax_edge_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
-				row.prop(scene, "relax_interpolation")
+				row.prop(scene.hstool.modeling, "relax_interpolation")
 				row = child_box.row(align=True)
-				row.prop(scene, "relax_input")
+				row.prop(scene.hstool.modeling, "relax_input")
 				row = child_box.row(align=True)
-				row.prop(scene, "relax_iterations")
+				row.prop(scene.hstool.modeling, "relax_iterations")
 				row = child_box.row(align=True)
-				row.prop(scene, "relax_regular")
+				row.prop(scene.hstool.modeling, "relax_regular")
 
 
 			## Space Edge
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_space_edge_ui:
-				split.prop(scene, "toggle_space_edge_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_space_edge_ui:
+				split.prop(scene.hstool.ui, "toggle_space_edge_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_space_edge_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_space_edge_ui", text="", icon="RIGHTARROW")
 			split.operator("tmc.space_edge", text = "Space Edge")
 			row.scale_y = 2.0
-			if scene.toggle_space_edge_ui:
+			if scene.hstool.ui.toggle_space_edge_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
-				row.prop(scene, "space_interpolation")
+				row.prop(scene.hstool.modeling, "space_interpolation")
 				row = child_box.row(align=True)
-				row.prop(scene, "space_input")
+				row.prop(scene.hstool.modeling, "space_input")
 				row = child_box.row(align=True)
-				if scene.space_lock_x:
-					row.prop(scene, "space_lock_x", text="X", icon="LOCKED")
+				if scene.hstool.modeling.space_lock_x:
+					row.prop(scene.hstool.modeling, "space_lock_x", text="X", icon="LOCKED")
 				else:
-					row.prop(scene, "space_lock_x", text="X", icon="UNLOCKED")
-				if scene.space_lock_y:
-					row.prop(scene, "space_lock_y", text="Y", icon="LOCKED")
+					row.prop(scene.hstool.modeling, "space_lock_x", text="X", icon="UNLOCKED")
+				if scene.hstool.modeling.space_lock_y:
+					row.prop(scene.hstool.modeling, "space_lock_y", text="Y", icon="LOCKED")
 				else:
-					row.prop(scene, "space_lock_y", text="Y", icon="UNLOCKED")
-				if scene.space_lock_z:
-					row.prop(scene, "space_lock_z", text="Z", icon="LOCKED")
+					row.prop(scene.hstool.modeling, "space_lock_y", text="Y", icon="UNLOCKED")
+				if scene.hstool.modeling.space_lock_z:
+					row.prop(scene.hstool.modeling, "space_lock_z", text="Z", icon="LOCKED")
 				else:
-					row.prop(scene, "space_lock_z", text="Z", icon="UNLOCKED")
+					row.prop(scene.hstool.modeling, "space_lock_z", text="Z", icon="UNLOCKED")
 				row = child_box.row(align=True)
-				row.prop(scene, "space_influence")
+				row.prop(scene.hstool.modeling, "space_influence")
 
 			## Flatten Face
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_flatten_face_ui:
-				split.prop(scene, "toggle_flatten_face_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_flatten_face_ui:
+				split.prop(scene.hstool.ui, "toggle_flatten_face_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_flatten_face_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_flatten_face_ui", text="", icon="RIGHTARROW")
 			split.operator("tmc.flatten_face", text = "Flatten Face")
 			row.scale_y = 2.0
-			if scene.toggle_flatten_face_ui:
+			if scene.hstool.ui.toggle_flatten_face_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
-				row.prop(scene, "flatten_plane")
+				row.prop(scene.hstool.modeling, "flatten_plane")
 				row = child_box.row(align=True)
-				row.prop(scene, "flatten_restriction")
+				row.prop(scene.hstool.modeling, "flatten_restriction")
 				row = child_box.row(align=True)
-				if scene.flatten_lock_x:
-					row.prop(scene, "flatten_lock_x", text="X", icon='LOCKED')
+				if scene.hstool.modeling.flatten_lock_x:
+					row.prop(scene.hstool.modeling, "flatten_lock_x", text="X", icon='LOCKED')
 				else:
-					row.prop(scene, "flatten_lock_x", text="X", icon='UNLOCKED')
-				if scene.flatten_lock_y:
-					row.prop(scene, "flatten_lock_y", text="Y", icon='LOCKED')
+					row.prop(scene.hstool.modeling, "flatten_lock_x", text="X", icon='UNLOCKED')
+				if scene.hstool.modeling.flatten_lock_y:
+					row.prop(scene.hstool.modeling, "flatten_lock_y", text="Y", icon='LOCKED')
 				else:
-					row.prop(scene, "flatten_lock_y", text="Y", icon='UNLOCKED')
-				if scene.flatten_lock_z:
-					row.prop(scene, "flatten_lock_z", text="Z", icon='LOCKED')
+					row.prop(scene.hstool.modeling, "flatten_lock_y", text="Y", icon='UNLOCKED')
+				if scene.hstool.modeling.flatten_lock_z:
+					row.prop(scene.hstool.modeling, "flatten_lock_z", text="Z", icon='LOCKED')
 				else:
-					row.prop(scene, "flatten_lock_z", text="Z", icon='UNLOCKED')
+					row.prop(scene.hstool.modeling, "flatten_lock_z", text="Z", icon='UNLOCKED')
 				row = child_box.row(align=True)
-				row.prop(scene, "flatten_influence")
+				row.prop(scene.hstool.modeling, "flatten_influence")
 
 			## Smooth Edge
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_smooth_edge_ui:
-				split.prop(scene, "toggle_smooth_edge_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_smooth_edge_ui:
+				split.prop(scene.hstool.ui, "toggle_smooth_edge_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_smooth_edge_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_smooth_edge_ui", text="", icon="RIGHTARROW")
 			split.operator("tmc.smooth_edge", text = "Smooth Edge")
 			row.scale_y = 2.0
-			if scene.toggle_smooth_edge_ui:
+			if scene.hstool.ui.toggle_smooth_edge_ui:
 				child_box = layout.box()
 				row = child_box.row()
-				row.prop(scene, "curve_influence", text="Curve")
+				row.prop(scene.hstool.modeling, "curve_influence", text="Curve")
 				row = child_box.row()
-				row.prop(scene, "space_influence", text="Space")
+				row.prop(scene.hstool.modeling, "space_influence", text="Space")
 				row = child_box.row()
-				row.prop(scene, "relax_influence",  text="Relax")
+				row.prop(scene.hstool.modeling, "relax_influence",  text="Relax")
 				row = child_box.row()
 				split = row.split(factor=0.4, align=True)
 				split.label(text="Loop Input:")
-				split.prop(scene, "smooth_input", text="")
+				split.prop(scene.hstool.modeling, "smooth_input", text="")
 				
 				### Curve Settings
 				row = child_box.row()
@@ -416,15 +422,15 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 				row = curve_box.row()
 				split = row.split(factor=0.4, align=True)
 				split.label(text="Interpolation:")
-				split.prop(scene, "curve_interpolation", text="")
+				split.prop(scene.hstool.modeling, "curve_interpolation", text="")
 				row = curve_box.row()
-				row.prop(scene, "curve_boundaries", text="Boundaries")
+				row.prop(scene.hstool.modeling, "curve_boundaries", text="Boundaries")
 				row = curve_box.row()
-				row.prop(scene, "curve_regular", text="Regular Distribution")
+				row.prop(scene.hstool.modeling, "curve_regular", text="Regular Distribution")
 				row = curve_box.row()
 				split = row.split(factor=0.4, align=True)
 				split.label(text="Restriction:")
-				split.prop(scene, "curve_restriction", text="")
+				split.prop(scene.hstool.modeling, "curve_restriction", text="")
 
 				### Relax Settings
 				row = child_box.row()
@@ -434,9 +440,9 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 				row = relax_box.row()
 				split = row.split(factor=0.4, align=True)
 				split.label(text="Restriction:")
-				split.prop(scene, "relax_iterations", text="")
+				split.prop(scene.hstool.modeling, "relax_iterations", text="")
 				row = relax_box.row()
-				row.prop(scene, "relax_regular", text="Regular Distribution")
+				row.prop(scene.hstool.modeling, "relax_regular", text="Regular Distribution")
 
 
 			## Clone element
@@ -447,18 +453,18 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 
 
 		# Misc Tab UI
-		if scene.menu_tab == "MISC":
+		if scene.hstool.ui.menu_tab == "MISC":
 			## Collection
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_collection_area_ui:
-				split.prop(scene, "toggle_collection_area_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_collection_area_ui:
+				split.prop(scene.hstool.ui, "toggle_collection_area_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_collection_area_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_collection_area_ui", text="", icon="RIGHTARROW")
 			split.label(text="Collection")
-			if scene.toggle_collection_area_ui:
+			if scene.hstool.ui.toggle_collection_area_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				row.operator("tmc.collapse_all_collections", text = "Collapse All Collections")
@@ -472,13 +478,13 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_normal_area_ui:
-				split.prop(scene, "toggle_normal_area_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_normal_area_ui:
+				split.prop(scene.hstool.ui, "toggle_normal_area_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_normal_area_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_normal_area_ui", text="", icon="RIGHTARROW")
 			split.label(text="Normal")
-			if scene.toggle_normal_area_ui:
+			if scene.hstool.ui.toggle_normal_area_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				row.operator("tmc.set_normal_with_active_face", text = "Set Normal From Last Face")
@@ -492,13 +498,13 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_vertex_group_area_ui:
-				split.prop(scene, "toggle_vertex_group_area_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_vertex_group_area_ui:
+				split.prop(scene.hstool.ui, "toggle_vertex_group_area_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_vertex_group_area_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_vertex_group_area_ui", text="", icon="RIGHTARROW")
 			split.label(text="Vertex Group")
-			if scene.toggle_vertex_group_area_ui:
+			if scene.hstool.ui.toggle_vertex_group_area_ui:
 				child_box = main_box.box()
 				row = child_box.row(align=True)
 				row.operator("tmc.clean_vertex_group", text = "Clean Vertex Group")
@@ -509,20 +515,20 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_uv_area_ui:
-				split.prop(scene, "toggle_uv_area_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_uv_area_ui:
+				split.prop(scene.hstool.ui, "toggle_uv_area_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_uv_area_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_uv_area_ui", text="", icon="RIGHTARROW")
 			split.label(text="UV")
-			if scene.toggle_uv_area_ui:
+			if scene.hstool.ui.toggle_uv_area_ui:
 				child_box = main_box.box()
 				row = child_box.row()
 				row.operator("tmc.uv_by_sharp_edge", text = "UV by Sharp Edge")
 				row.scale_y = 1.5
 				child_box = main_box.box()
 				row = child_box.row()
-				row.prop(scene, "uvset1_name", text="UV1")
+				row.prop(scene.hstool.modifier, "uvset1_name", text="UV1")
 				row.operator("tmc.rename_uv1", text = "Rename")
 				row.scale_y = 1.5
 				row = child_box.row(align=True)
@@ -533,22 +539,29 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_capture_area_ui:
-				split.prop(scene, "toggle_capture_area_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_capture_area_ui:
+				split.prop(scene.hstool.ui, "toggle_capture_area_ui", text="", icon="DOWNARROW_HLT")
 
 			else:
-				split.prop(scene, "toggle_capture_area_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_capture_area_ui", text="", icon="RIGHTARROW")
 			split.label(text="Capture")
-			if scene.toggle_capture_area_ui:
+			if scene.hstool.ui.toggle_capture_area_ui:
 				child_box = main_box.box()
 				# Line 1
 				row = child_box.row()
-				row.prop(scene, "screenshot_path")
+				row.prop(scene.hstool.capture, "screenshot_path")
 				row.scale_y = 1.5
 				# Line 2
 				row = child_box.row(align=True)
-				row.prop(scene, "camera_zoom_value", text = "Zoom ")
+				row.prop(scene.hstool.capture, "camera_zoom_value", text = "Zoom ")
 				row.scale_y = 1.5
+				row = child_box.row(align=True)
+				row.prop(scene.hstool.capture, "screenshot_resolution_x", text = "X ")
+				row.prop(scene.hstool.capture, "screenshot_resolution_y", text = "Y ")
+				row = child_box.row(align=True)
+				row.prop(scene.hstool.capture, "screenshot_thumbnails", toggle=True)
+				row.prop(scene.hstool.capture, "screenshot_contact_sheet", toggle=True)
+				row.prop(scene.hstool.capture, "screenshot_thumbnail_size", text = "Size ")
 				# Line 3
 				row = child_box.row()
 				row.scale_y = 2.0
@@ -560,20 +573,20 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			main_box = layout.box()
 			row = main_box.row()
 			split = row.split(factor=0.15, align=True)
-			if context.scene.toggle_bakeset_area_ui:
-				split.prop(scene, "toggle_bakeset_area_ui", text="", icon="DOWNARROW_HLT")
+			if context.scene.hstool.ui.toggle_bakeset_area_ui:
+				split.prop(scene.hstool.ui, "toggle_bakeset_area_ui", text="", icon="DOWNARROW_HLT")
 				
 			else:
-				split.prop(scene, "toggle_bakeset_area_ui", text="", icon="RIGHTARROW")
+				split.prop(scene.hstool.ui, "toggle_bakeset_area_ui", text="", icon="RIGHTARROW")
 			split.label(text="Bake Set")
-			if scene.toggle_bakeset_area_ui:
+			if scene.hstool.ui.toggle_bakeset_area_ui:
 				child_box = main_box.box()
 				row = child_box.row()
-				row.prop(scene, "bakeset_name", text="Name")
+				row.prop(scene.hstool.bakeset, "bakeset_name", text="Name")
 				row.scale_y = 1.5
 				
 				row = child_box.row()
-				row.prop(scene, "threshold_value", text="Threshold")
+				row.prop(scene.hstool.bakeset, "threshold_value", text="Threshold")
 				row.scale_y = 1.5
 
 				row = child_box.row()
@@ -587,15 +600,15 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 				row.scale_y = 1.5
 
 				row = child_box.row()
-				row.prop(scene, "bakeset_export_path", text="Path")
+				row.prop(scene.hstool.bakeset, "bakeset_export_path", text="Path")
 				row.scale_y = 1.5
 
 				row = child_box.row()
-				row.prop(scene, "export_bakeset_mode", text="Mode")
+				row.prop(scene.hstool.bakeset, "export_bakeset_mode", text="Mode")
 				row.scale_y = 1.5
 
 				row = child_box.row()
-				row.prop(scene, "export_bakeset_unlock_normal", text="Unlock Normal")
+				row.prop(scene.hstool.bakeset, "export_bakeset_unlock_normal", text="Unlock Normal")
 				row.scale_y = 1.5
 
 				row = child_box.row()
@@ -607,7 +620,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 				row.scale_y = 1.5
 
 		# Check Tab UI
-		if scene.menu_tab == "CHECK":
+		if scene.hstool.ui.menu_tab == "CHECK":
 			## Check Model
 			pcoll = variable.PREVIEW_COLLECTIONS['main']
 			true_icon = pcoll['true_icon']
@@ -624,7 +637,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row(align=True)
 			split = row.split(factor=0.85, align=True)
 			split.operator("tmc.check_mesh_no_tris", text = "Mesh Zero Tris")
-			if scene.check_mesh_no_tris:
+			if scene.hstool.check.check_mesh_no_tris:
 				split.operator("tmc.check_mesh_no_tris", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_mesh_no_tris", text = "", icon_value = false_icon.icon_id)
@@ -633,7 +646,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row(align=True)
 			split = row.split(factor=0.85, align=True)
 			split.operator("tmc.check_ngons_face", text = "N-gons Face")
-			if scene.check_ngons_face:
+			if scene.hstool.check.check_ngons_face:
 				split.operator("tmc.check_ngons_face", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_ngons_face", text = "", icon_value = false_icon.icon_id)
@@ -642,7 +655,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row(align=True)
 			split = row.split(factor=0.85, align=True)
 			split.operator("tmc.check_non_manifold", text = "Non-manifold")
-			if scene.check_non_manifold:
+			if scene.hstool.check.check_non_manifold:
 				split.operator("tmc.check_non_manifold", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_non_manifold", text = "", icon_value = false_icon.icon_id)
@@ -651,7 +664,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row(align=True)
 			split = row.split(factor=0.85, align=True)
 			split.operator("tmc.check_isolated_vertex", text = "Isolated Vertex")
-			if scene.check_isolated_vertex:
+			if scene.hstool.check.check_isolated_vertex:
 				split.operator("tmc.check_isolated_vertex", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_isolated_vertex", text = "", icon_value = false_icon.icon_id)
@@ -660,7 +673,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row(align=True)
 			split = row.split(factor=0.85, align=True)
 			split.operator("tmc.check_intersect_face", text = "Intersect Face")
-			if scene.check_intersect_face:
+			if scene.hstool.check.check_intersect_face:
 				split.operator("tmc.check_intersect_face", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_intersect_face", text = "", icon_value = false_icon.icon_id)
@@ -670,8 +683,8 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			split = row.split(factor=0.85, align=True)
 			small_split = split.split(factor=0.65, align=True)
 			small_split.operator("tmc.check_zero_edge_length", text = "Zero Edge Length")
-			small_split.prop(scene, "min_edge_length_value", text="")
-			if scene.check_zero_edge_length:
+			small_split.prop(scene.hstool.check, "min_edge_length_value", text="")
+			if scene.hstool.check.check_zero_edge_length:
 				split.operator("tmc.check_zero_edge_length", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_zero_edge_length", text = "", icon_value = false_icon.icon_id)
@@ -681,8 +694,8 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			split = row.split(factor=0.85, align=True)
 			small_split = split.split(factor=0.65, align=True)
 			small_split.operator("tmc.check_zero_face_area", text = "Zero Face Area")
-			small_split.prop(scene, "min_face_area_value", text="")
-			if scene.check_zero_face_area:
+			small_split.prop(scene.hstool.check, "min_face_area_value", text="")
+			if scene.hstool.check.check_zero_face_area:
 				split.operator("tmc.check_zero_face_area", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_zero_face_area", text = "", icon_value = false_icon.icon_id)
@@ -692,7 +705,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row()
 			split = row.split(factor=0.7)
 			split.operator("tmc.check_silhouette", text = "Check Silhouette")
-			split.prop(scene, "viewport_background_color", text="")
+			split.prop(scene.hstool.check, "viewport_background_color", text="")
 			split.scale_y = 1.5
 
 
@@ -704,14 +717,14 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row = child_box.row(align=True)
 			split = row.split(factor=0.85, align=True)
 			split.operator("tmc.check_zero_uvset", text = "Zero UVSet")
-			if scene.check_zero_uvset:
+			if scene.hstool.check.check_zero_uvset:
 				split.operator("tmc.check_zero_uvset", text = "", icon_value = true_icon.icon_id)
 			else:
 				split.operator("tmc.check_zero_uvset", text = "", icon_value = false_icon.icon_id)
 			row.scale_y = 1.5
 
 		# Bridge Tab UI
-		if scene.menu_tab == "BRIDGE":
+		if scene.hstool.ui.menu_tab == "BRIDGE":
 			## Maya - Blender
 			main_box = layout.box()
 			row = main_box.row(align=True)
@@ -721,24 +734,27 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			# row = child_box.row(align=True)
 			# split = row.split(factor=0.2, align=True)
 			# row.label(text = "Forward:", icon="AXIS_FRONT")
-			# row.prop(scene, "blender_maya_axis_forward_combobox")
+			# row.prop(scene.hstool.bridge, "blender_maya_axis_forward_combobox")
 	
 			# row = child_box.row(align=True)
 			# split = row.split(factor=0.2, align=True)
 			# row.label(text = "Up:", icon="AXIS_TOP")
-			# row.prop(scene, "blender_maya_axis_up_combobox")
+			# row.prop(scene.hstool.bridge, "blender_maya_axis_up_combobox")
 
+			row = child_box.row(align=True)
+			row.label(text = "Cache:", icon="FILE_FOLDER")
+			row.prop(scene.hstool.bridge, "bridge_cache_path")
 			row = child_box.row(align=True)
 			split = row.split(factor=0.2, align=True)
 			row.label(text = "Normal:", icon="NORMALS_VERTEX_FACE")
-			row.prop(scene, "blender_maya_normal_radiobox", expand = True)
+			row.prop(scene.hstool.bridge, "blender_maya_normal_radiobox", expand = True)
 			row = child_box.row(align=True)
 			row.operator("tmc.import_from_maya", text = "Import", icon="IMPORT")
 			row.operator("tmc.export_to_maya", text = "Export", icon="EXPORT")
 			row.scale_y = 1.5
 
 		# Material Tab UI
-		if scene.menu_tab == "MATERIAL":
+		if scene.hstool.ui.menu_tab == "MATERIAL":
 			# Material list: show all materials in the file (scene-wide)
 			main_box = layout.box()
 			child_box = main_box.box()
@@ -755,13 +771,13 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			row.scale_y = 1.5
 			# Left: material list (wide)
 			col = row.split(factor=0.65)
-			# If in Edit Mode and there is a selected face, update scene.material_index
+			# If in Edit Mode and there is a selected face, update scene.hstool.ui.material_index
 			# so the material list selects that material.
 			try:
 				mode = getattr(context, 'mode', None)
 				if mode and str(mode).upper().startswith('EDIT'):
 					active_obj = context.active_object
-					if active_obj and active_obj.type == 'MESH':
+					if active_obj and active_obj.type == 'MESH' and has_face_selection(active_obj):
 						selected_mat = None
 						try:
 							bm = bmesh.from_edit_mesh(active_obj.data)
@@ -787,8 +803,8 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 							mats_list = list(bpy.data.materials)
 							if selected_mat in mats_list:
 								new_idx = mats_list.index(selected_mat)
-								if getattr(context.scene, 'material_index', None) != new_idx:
-									context.scene.material_index = new_idx
+								if getattr(context.scene.hstool.ui, 'material_index', None) != new_idx:
+									context.scene.hstool.ui.material_index = new_idx
 									# Force UI redraw so template_list updates immediately
 									try:
 										for area in context.screen.areas:
@@ -800,7 +816,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 										pass
 			except Exception:
 				pass
-			col.template_list("TMC_UL_MaterialList", "", bpy.data, "materials", context.scene, "material_index", rows=7)
+			col.template_list("TMC_UL_MaterialList", "", bpy.data, "materials", context.scene.hstool.ui, "material_index", rows=7)
 			# Right: small column for action buttons (stacked)
 			col_buttons = col.column(align=True)
 			col_buttons.operator("tmc.select_faces_on_active_by_material", text="Select On Active")
@@ -813,7 +829,7 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			col_buttons.operator("tmc.add_material", text="Add Material")
 			# Color picker for new material base color (also edits selected material)
 			try:
-				col_buttons.prop(scene, "material_add_color", text="")
+				col_buttons.prop(scene.hstool.ui, "material_add_color", text="")
 			except Exception:
 				pass
 			
@@ -821,3 +837,82 @@ class TMC_MT_Main_Panel(bpy.types.Panel):
 			col_buttons.operator("tmc.clean_material_slots", text="Clean Slots")
 			col_buttons.operator("tmc.delete_duplicate_materials", text="Delete Duplicates")
 			col_buttons.operator("tmc.delete_all_materials", text="Delete All")
+
+
+class TMC_PT_Profiler(bpy.types.Panel):
+	bl_idname = "TMC_PT_Profiler"
+	bl_label = "Profiler"
+	bl_space_type = "VIEW_3D"
+	bl_region_type = "UI"
+	bl_category = "HS Tool"
+	bl_parent_id = "TMC_MT_Main_Panel"
+	bl_options = {'DEFAULT_CLOSED'}
+
+	@classmethod
+	def poll(cls, context):
+		return profiler.is_enabled() or frame_monitor.is_enabled()
+
+	def draw(self, context):
+		layout = self.layout
+		if frame_monitor.is_enabled():
+			self.draw_frame_times(layout)
+		if not profiler.is_enabled():
+			return
+		row = layout.row(align=True)
+		row.label(text="%d calls recorded" % len(profiler.RECORDS))
+		row.operator("tmc.export_profile", text="", icon="EXPORT")
+		row.operator("tmc.clear_profile", text="", icon="TRASH")
+
+		top = profiler.top_stats(10)
+		if not top:
+			layout.label(text="Run a tool to record timings")
+			return
+		col = layout.column(align=True)
+		row = col.row()
+		split = row.split(factor=0.5)
+		split.label(text="Call")
+		split = split.split(factor=0.3)
+		split.label(text="Count")
+		split = split.split(factor=0.5)
+		split.label(text="Total ms")
+		split.label(text="Max ms")
+		for name, stats in top:
+			row = col.row()
+			split = row.split(factor=0.5)
+			split.label(text=name)
+			split = split.split(factor=0.3)
+			split.label(text=str(stats['calls']))
+			split = split.split(factor=0.5)
+			split.label(text="%.1f" % stats['total_ms'])
+			split.label(text="%.1f" % stats['max_ms'])
+			counts = stats['counts']
+			if counts and counts.get('verts'):
+				sub = col.row()
+				sub.scale_y = 0.7
+				sub.label(text="    last: %d obj, %d verts, %d faces" % (counts['objects'], counts['verts'], counts['faces']))
+
+	def draw_frame_times(self, layout):
+		handlers = frame_monitor.stats()
+		if not handlers:
+			layout.label(text="No viewport overlay drawn yet")
+			return
+		col = layout.column(align=True)
+		row = col.row()
+		split = row.split(factor=0.4)
+		split.label(text="Draw Handler")
+		split = split.split(factor=0.33)
+		split.label(text="Mean ms")
+		split = split.split(factor=0.5)
+		split.label(text="p95 ms")
+		split.label(text="Batches")
+		for name, stats in sorted(handlers.items()):
+			row = col.row()
+			row.alert = stats['p95_ms'] > stats['budget_ms']
+			split = row.split(factor=0.4)
+			split.label(text=name)
+			split = split.split(factor=0.33)
+			split.label(text="%.2f" % stats['mean_ms'])
+			split = split.split(factor=0.5)
+			split.label(text="%.2f" % stats['p95_ms'])
+			split.label(text="%.1f" % stats['batches_mean'])
+		layout.separator()
@@ -8,20 +8,125 @@ import os
 
 # NOTE: These helpers are Blender 4.x safe and avoid deprecated bgl state.
 # They provide commonly needed draw operations in both 3D (POST_VIEW) and 2D (POST_PIXEL).
+#
+# Shaders are fetched once per session and cached in _SHADERS. Object matrices are pushed
+# onto the gpu matrix stack (applied as the shader's ModelViewProjection uniform) instead of
+# transforming every vertex in Python. Callers that draw the same geometry every frame can
+# register it once with register_batch() and draw the returned handle with draw_batch();
+# the GPU batch is only rebuilt when the handle's version changes.
+# Every batch built here is counted in BATCH_STATS ('retained' counts BatchHandle rebuilds);
+# frame_monitor reads the counters around each draw handler call.
+
+_IDENTITY = Matrix()
+_SHADERS = {}
+BATCH_STATS = {'built': 0, 'retained': 0}
+
+
+def get_shader(name):
+    '''Return a builtin shader, fetching it from the gpu module only once per session'''
+    shader = _SHADERS.get(name)
+    if shader is None:
+        shader = gpu.shader.from_builtin(name)
+        _SHADERS[name] = shader
+    return shader
+
+
+def _build_batch(shader, batch_type, content, indices=None):
+    BATCH_STATS['built'] += 1
+    return batch_for_shader(shader, batch_type, content, indices=indices)
+
+
+class BatchHandle:
+    '''Retained geometry for draw_batch(). Call update() to replace the geometry;
+    the GPU batch is rebuilt lazily on the next draw when the version changed.'''
+
+    __slots__ = ('batch_type', 'coords', 'indices', 'colors', 'version', '_batch', '_built_version')
+
+    def __init__(self, coords, batch_type='LINES', indices=None, colors=None):
+        self.batch_type = batch_type
+        self.coords = coords
+        self.indices = indices
+        self.colors = colors
+        self.version = 0
+        self._batch = None
+        self._built_version = -1
+
+    def update(self, coords, indices=None, colors=None):
+        self.coords = coords
+        self.indices = indices
+        self.colors = colors
+        self.version += 1
+
+    @property
+    def shader_name(self):
+        if self.batch_type == 'LINES':
+            return 'POLYLINE_SMOOTH_COLOR' if self.colors else 'POLYLINE_UNIFORM_COLOR'
+        return 'SMOOTH_COLOR' if self.colors else 'UNIFORM_COLOR'
+
+    def get_batch(self):
+        if self._batch is None or self._built_version != self.version:
+            content = {"pos": self.coords}
+            if self.colors:
+                content["color"] = self.colors
+            self._batch = _build_batch(get_shader(self.shader_name), self.batch_type, content, indices=self.indices)
+            self._built_version = self.version
+            BATCH_STATS['retained'] += 1
+        return self._batch
+
+
+def register_batch(coords, batch_type='LINES', indices=None, colors=None):
+    '''Register geometry once and return a handle to pass to draw_batch()'''
+    if batch_type == 'LINES' and indices is None and coords:
+        indices = _strip_indices(len(coords))
+    return BatchHandle(coords, batch_type=batch_type, indices=indices, colors=colors)
+
+
+def draw_batch(handle, mx=_IDENTITY, color=(1,1,1,1), width=1.0, size=4, xray=True):
+    '''Draw a registered handle, applying mx as a uniform through the gpu matrix stack'''
+    if handle is None or not handle.coords:
+        return
+    shader = get_shader(handle.shader_name)
+    gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
+    gpu.state.blend_set('ALPHA')
+    shader.bind()
+    if not handle.colors:
+        shader.uniform_float('color', color)
+    if handle.batch_type == 'LINES':
+        shader.uniform_float('lineWidth', float(width))
+        shader.uniform_float('viewportSize', gpu.state.scissor_get()[2:])
+    elif handle.batch_type == 'POINTS':
+        gpu.state.point_size_set(size)
+    _draw_with_matrix(handle.get_batch(), shader, mx)
+
+
+def _strip_indices(count):
+    return [(i, i+1) for i in range(count-1)]
+
+
+def _draw_with_matrix(batch, shader, mx):
+    if mx is _IDENTITY or mx == _IDENTITY:
+        batch.draw(shader)
+        return
+    with gpu.matrix.push_pop():
+        gpu.matrix.multiply_matrix(mx)
+        batch.draw(shader)
+
+
+def clear_draw_cache():
+    '''Drop cached shaders (called on unregister so a reload fetches fresh ones)'''
+    _SHADERS.clear()
+
 
 def draw_quad(vertices=[], color=(1,1,1,1)):
     '''Vertices = Top Left, Bottom Left, Top Right, Bottom Right'''
     indices = [(0, 1, 2), (1, 2, 3)]
-    shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    batch = batch_for_shader(shader, 'TRIS', {"pos": vertices}, indices=indices)
+    shader = get_shader('UNIFORM_COLOR')
+    batch = _build_batch(shader, 'TRIS', {"pos": vertices}, indices=indices)
     shader.bind()
     shader.uniform_float("color", color)
     gpu.state.blend_set("ALPHA")
     batch.draw(shader)
     gpu.state.blend_set("NONE")
-    
-    del shader
-    del batch
 
 def draw_text(text, x, y, size=12, color=(1,1,1,1)):
 
@@ -43,40 +148,39 @@ def get_blf_text_dims(text, size):
 
 def _polyline_shader():
     # In 4.x, polyline shaders are 'POLYLINE_UNIFORM_COLOR' and 'POLYLINE_SMOOTH_COLOR'
-    return gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+    return get_shader('POLYLINE_UNIFORM_COLOR')
 
 def _polyline_smooth_shader():
-    return gpu.shader.from_builtin('POLYLINE_SMOOTH_COLOR')
+    return get_shader('POLYLINE_SMOOTH_COLOR')
 
 def _uniform_shader(mode='3D'):
     # mode is ignored in Blender 4.x, kept for compatibility
-    return gpu.shader.from_builtin('UNIFORM_COLOR')
+    return get_shader('UNIFORM_COLOR')
 
-def draw_point(co, mx=Matrix(), color=(1,1,1,1), size=6, xray=True):
+def draw_point(co, mx=_IDENTITY, color=(1,1,1,1), size=6, xray=True):
     shader = _uniform_shader()
     shader.bind()
     shader.uniform_float('color', color)
     gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
     gpu.state.blend_set('ALPHA' if color[-1] < 1 else 'NONE')
     gpu.state.point_size_set(size)
-    batch = batch_for_shader(shader, 'POINTS', {"pos": [mx @ co]})
-    batch.draw(shader)
+    batch = _build_batch(shader, 'POINTS', {"pos": [co]})
+    _draw_with_matrix(batch, shader, mx)
 
-def draw_points(coords, mx=Matrix(), color=(1,1,1,1), size=4, xray=True, indices=None):
+def draw_points(coords, mx=_IDENTITY, color=(1,1,1,1), size=4, xray=True, indices=None):
     shader = _uniform_shader()
     shader.bind()
     shader.uniform_float('color', color)
     gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
     gpu.state.blend_set('ALPHA' if color[-1] < 1 else 'NONE')
     gpu.state.point_size_set(size)
-    pos = [mx @ c for c in coords] if mx != Matrix() else coords
-    batch = batch_for_shader(shader, 'POINTS', {"pos": pos}, indices=indices)
-    batch.draw(shader)
+    batch = _build_batch(shader, 'POINTS', {"pos": coords}, indices=indices)
+    _draw_with_matrix(batch, shader, mx)
 
-def draw_line(coords, mx=Matrix(), color=(1,1,1,1), width=1.0, xray=True, indices=None):
+def draw_line(coords, mx=_IDENTITY, color=(1,1,1,1), width=1.0, xray=True, indices=None):
     # Connect consecutive points if indices not provided
     if indices is None and coords:
-        indices = [(i, i+1) for i in range(len(coords)-1)]
+        indices = _strip_indices(len(coords))
     gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
     gpu.state.blend_set('ALPHA')
     shader = _polyline_shader()
@@ -84,11 +188,10 @@ def draw_line(coords, mx=Matrix(), color=(1,1,1,1), width=1.0, xray=True, indice
     shader.uniform_float('color', color)
     shader.uniform_float('lineWidth', float(width))
     shader.uniform_float('viewportSize', gpu.state.scissor_get()[2:])
-    pos = [mx @ c for c in coords] if mx != Matrix() else coords
-    batch = batch_for_shader(shader, 'LINES', {"pos": pos}, indices=indices)
-    batch.draw(shader)
+    batch = _build_batch(shader, 'LINES', {"pos": coords}, indices=indices)
+    _draw_with_matrix(batch, shader, mx)
 
-def draw_lines(coords, mx=Matrix(), color=(1,1,1,1), width=1.0, xray=True, indices=None):
+def draw_lines(coords, mx=_IDENTITY, color=(1,1,1,1), width=1.0, xray=True, indices=None):
     # Treat coords as pairs; generate indices if not provided
     if indices is None:
         indices = [(i, i+1) for i in range(0, len(coords), 2) if i+1 < len(coords)]
@@ -99,34 +202,31 @@ def draw_lines(coords, mx=Matrix(), color=(1,1,1,1), width=1.0, xray=True, indic
     shader.uniform_float('color', color)
     shader.uniform_float('lineWidth', float(width))
     shader.uniform_float('viewportSize', gpu.state.scissor_get()[2:])
-    pos = [mx @ c for c in coords] if mx != Matrix() else coords
-    batch = batch_for_shader(shader, 'LINES', {"pos": pos}, indices=indices)
-    batch.draw(shader)
+    batch = _build_batch(shader, 'LINES', {"pos": coords}, indices=indices)
+    _draw_with_matrix(batch, shader, mx)
 
-def draw_vector(vector, origin=Vector((0,0,0)), mx=Matrix(), color=(1,1,1,1), width=1.0, fade=False, xray=True):
+def draw_vector(vector, origin=Vector((0,0,0)), mx=_IDENTITY, color=(1,1,1,1), width=1.0, fade=False, xray=True):
     # Optionally fade the vector tail
     gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
     gpu.state.blend_set('ALPHA')
     if fade:
         shader = _polyline_smooth_shader()
-        coords = [mx @ origin, mx @ origin + (mx.to_3x3() @ vector)]
+        coords = [origin, origin + vector]
         cols = (color, (*color[:3], color[3] * 0.1))
         shader.bind()
         shader.uniform_float('lineWidth', float(width))
         shader.uniform_float('viewportSize', gpu.state.scissor_get()[2:])
-        batch = batch_for_shader(shader, 'LINES', {"pos": coords, "color": cols})
-        batch.draw(shader)
+        batch = _build_batch(shader, 'LINES', {"pos": coords, "color": cols})
+        _draw_with_matrix(batch, shader, mx)
     else:
         draw_line([origin, origin + vector], mx=mx, color=color, width=width, xray=xray)
 
-def draw_vectors(vectors, origins, mx=Matrix(), color=(1,1,1,1), width=1.0, fade=False, xray=True):
+def draw_vectors(vectors, origins, mx=_IDENTITY, color=(1,1,1,1), width=1.0, fade=False, xray=True):
     coords = []
     if fade:
         cols = []
     for v, o in zip(vectors, origins):
-        a = mx @ o
-        b = a + (mx.to_3x3() @ v)
-        coords.extend([a, b])
+        coords.extend([o, o + v])
         if fade:
             cols.extend([color, (*color[:3], color[3]*0.1)])
     gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
@@ -137,20 +237,19 @@ def draw_vectors(vectors, origins, mx=Matrix(), color=(1,1,1,1), width=1.0, fade
         shader.uniform_float('lineWidth', float(width))
         shader.uniform_float('viewportSize', gpu.state.scissor_get()[2:])
         indices = [(i, i+1) for i in range(0, len(coords), 2)]
-        batch = batch_for_shader(shader, 'LINES', {"pos": coords, "color": cols}, indices=indices)
-        batch.draw(shader)
+        batch = _build_batch(shader, 'LINES', {"pos": coords, "color": cols}, indices=indices)
+        _draw_with_matrix(batch, shader, mx)
     else:
-        draw_lines(coords, color=color, width=width, xray=xray)
+        draw_lines(coords, mx=mx, color=color, width=width, xray=xray)
 
-def draw_tris(coords, mx=Matrix(), color=(1,1,1,1), indices=None, xray=True):
+def draw_tris(coords, mx=_IDENTITY, color=(1,1,1,1), indices=None, xray=True):
     shader = _uniform_shader()
     shader.bind()
     shader.uniform_float('color', color)
     gpu.state.depth_test_set('NONE' if xray else 'LESS_EQUAL')
     gpu.state.blend_set('ALPHA' if color[-1] < 1 else 'NONE')
-    pos = [mx @ c for c in coords] if mx != Matrix() else coords
-    batch = batch_for_shader(shader, 'TRIS', {"pos": pos}, indices=indices)
-    batch.draw(shader)
+    batch = _build_batch(shader, 'TRIS', {"pos": coords}, indices=indices)
+    _draw_with_matrix(batch, shader, mx)
 
 def draw_image_2d(image, x, y, w, h, color=(1,1,1,1), src_rect=None):
     """Draw a Blender image in 2D screen space (POST_PIXEL).
@@ -162,7 +261,7 @@ def draw_image_2d(image, x, y, w, h, color=(1,1,1,1), src_rect=None):
         tex = gpu.texture.from_image(image)
     except Exception:
         return
-    shader = gpu.shader.from_builtin('IMAGE')
+    shader = get_shader('IMAGE')
     # positions in screen space
     pos = [(x, y, 0), (x+w, y, 0), (x+w, y+h, 0), (x, y+h, 0)]
     if src_rect is None:
@@ -180,7 +279,7 @@ def draw_image_2d(image, x, y, w, h, color=(1,1,1,1), src_rect=None):
     gpu.state.blend_set('ALPHA')
     shader.bind()
     shader.uniform_sampler('image', tex)
-    batch = batch_for_shader(shader, 'TRIS', {"pos": pos, "texCoord": uv}, indices=idx)
+    batch = _build_batch(shader, 'TRIS', {"pos": pos, "texCoord": uv}, indices=idx)
     batch.draw(shader)
 
 def draw_mesh_wire(data, color=(1,1,1,1), width=1.0, xray=True):
@@ -197,10 +296,10 @@ def draw_mesh_wire(data, color=(1,1,1,1), width=1.0, xray=True):
     shader.uniform_float('color', color)
     shader.uniform_float('lineWidth', float(width))
     shader.uniform_float('viewportSize', gpu.state.scissor_get()[2:])
-    batch = batch_for_shader(shader, 'LINES', {"pos": coords}, indices=indices)
+    batch = _build_batch(shader, 'LINES', {"pos": coords}, indices=indices)
     batch.draw(shader)
 
-def draw_bbox(bbox, mx=Matrix(), color=(1,1,1,1), width=1.0, corners=0.0, xray=True):
+def draw_bbox(bbox, mx=_IDENTITY, color=(1,1,1,1), width=1.0, corners=0.0, xray=True):
     if corners and corners > 0:
         # Draw corner ticks instead of full edges
         coords = []
@@ -221,29 +320,37 @@ def draw_bbox(bbox, mx=Matrix(), color=(1,1,1,1), width=1.0, corners=0.0, xray=T
             b[6], b[6] + (b[2]-b[6])*c, b[6], b[6] + (b[5]-b[6])*c, b[6], b[6] + (b[7]-b[6])*c,
             b[7], b[7] + (b[3]-b[7])*c, b[7], b[7] + (b[4]-b[7])*c, b[7], b[7] + (b[6]-b[7])*c,
         ]
-        draw_lines([mx @ p for p in coords], color=color, width=width, xray=xray)
+        draw_lines(coords, mx=mx, color=color, width=width, xray=xray)
         return
     # Full wireframe bbox
     indices = [(0,1),(1,2),(2,3),(3,0),(4,5),(5,6),(6,7),(7,4),(0,4),(1,5),(2,6),(3,7)]
-    draw_line([mx @ p for p in bbox], color=color, width=width, xray=xray, indices=indices)
+    draw_line(bbox, mx=mx, color=color, width=width, xray=xray, indices=indices)
+
+_UNIT_CIRCLES = {}
+
+def _unit_circle(segs):
+    # Closed unit circle polyline, built once per segment count and scaled via the matrix stack
+    coords = _UNIT_CIRCLES.get(segs)
+    if coords is None:
+        coords = [Vector((cos(2*pi*i/segs), sin(2*pi*i/segs), 0)) for i in range(segs)]
+        # close the loop by repeating the first vertex so polyline drawing connects end->start
+        coords.append(coords[0])
+        _UNIT_CIRCLES[segs] = coords
+    return coords
 
 def draw_circle(loc=Vector(), rot=Quaternion(), radius=1.0, segments=64, color=(1,1,1,1), width=1.0, xray=True):
     segs = max(16, int(radius*segments) if segments == 'AUTO' else int(segments))
-    coords = []
-    for i in range(segs):
-        theta = 2*pi*i/segs
-        coords.append(Vector((cos(theta)*radius, sin(theta)*radius, 0)))
-    # close the loop by repeating the first vertex so polyline drawing connects end->start
-    if coords:
-        coords.append(coords[0])
     # transform into place
-    mx = Matrix.LocRotScale(loc, rot, Vector((1,1,1))) if len(loc) == 3 else Matrix()
-    draw_line([mx @ p for p in coords], color=color, width=width, xray=xray)
+    if len(loc) == 3:
+        mx = Matrix.LocRotScale(Vector(loc), rot, Vector((radius, radius, radius)))
+    else:
+        mx = Matrix.Diagonal((radius, radius, radius, 1.0))
+    draw_line(_unit_circle(segs), mx=mx, color=color, width=width, xray=xray)
 
-def draw_cross_3d(co, mx=Matrix(), color=(1,1,1,1), width=1.0, length=1.0, xray=True):
+def draw_cross_3d(co, mx=_IDENTITY, color=(1,1,1,1), width=1.0, length=1.0, xray=True):
     x = Vector((1,0,0)); y = Vector((0,1,0)); z = Vector((0,0,1))
     coords = [co - x*length, co + x*length, co - y*length, co + y*length, co - z*length, co + z*length]
-    draw_lines([mx @ p for p in coords], color=color, width=width, xray=xray)
+    draw_lines(coords, mx=mx, color=color, width=width, xray=xray)
 
 def draw_label(context, title='', coords=None, center=True, size=12, color=(1,1,1,1)):
     # Simple label draw; when center=True, centers horizontally around coords.x
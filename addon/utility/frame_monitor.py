@@ -0,0 +1,148 @@
+import math
+import time
+from collections import deque
+
+import bpy
+
+from . import draw
+
+# Frame-time monitor for the add-on's viewport draw handlers (Preferences > Profiling).
+# Handlers are added with add_handler() instead of SpaceView3D.draw_handler_add(); every call
+# is then timed and the GPU batches it built are counted through draw.BATCH_STATS. A call is
+# one frame of that handler. Calls slower than the budget are counted and reported on the
+# console, at most once per WARN_INTERVAL for each handler. While disabled the wrapper only
+# forwards the call.
+#
+# Query from Python with stats(name) / stats(), e.g. in a headless test:
+#   frame_monitor.enable(); handler(...); assert frame_monitor.stats('hud_pie')['batches_last'] <= 4
+
+DEFAULT_BUDGET_MS = 1.0
+WINDOW = 240  # frames kept per handler for mean / p95
+WARN_INTERVAL = 5.0  # seconds
+
+HANDLERS = {}  # name -> {'times', 'batches', 'frames', 'over_budget', 'max_ms', 'last_retained', 'last_warned'}
+_STATE = {'enabled': False, 'budget_ms': DEFAULT_BUDGET_MS}
+
+
+#region Recording
+def _entry(name):
+    entry = HANDLERS.get(name)
+    if entry is None:
+        entry = HANDLERS[name] = {
+            'times': deque(maxlen=WINDOW),
+            'batches': deque(maxlen=WINDOW),
+            'frames': 0,
+            'over_budget': 0,
+            'max_ms': 0.0,
+            'last_retained': 0,
+            'last_warned': -WARN_INTERVAL,
+        }
+    return entry
+
+def _record(name, duration_ms, batches, retained):
+    entry = _entry(name)
+    entry['times'].append(duration_ms)
+    entry['batches'].append(batches)
+    entry['frames'] += 1
+    entry['max_ms'] = max(entry['max_ms'], duration_ms)
+    entry['last_retained'] = retained
+    budget = _STATE['budget_ms']
+    if duration_ms > budget:
+        entry['over_budget'] += 1
+        now = time.monotonic()
+        if now - entry['last_warned'] >= WARN_INTERVAL:
+            entry['last_warned'] = now
+            print("HS Tool draw handler '%s' took %.2f ms (budget %.2f ms, %d batches built)"
+                  % (name, duration_ms, budget, batches))
+
+def monitored(name, callback):
+    '''Wrap a draw callback so each call is timed under name'''
+    counters = draw.BATCH_STATS
+
+    def wrapper(*args):
+        if not _STATE['enabled']:
+            return callback(*args)
+        built, retained = counters['built'], counters['retained']
+        start = time.perf_counter()
+        try:
+            return callback(*args)
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000.0
+            _record(name, duration_ms, counters['built'] - built, counters['retained'] - retained)
+
+    wrapper.__name__ = getattr(callback, '__name__', name)
+    wrapper._hs_monitored = name
+    return wrapper
+
+def add_handler(name, callback, args, draw_type, region_type='WINDOW', space=None):
+    '''SpaceView3D.draw_handler_add() with monitoring; remove the handle as usual'''
+    space = space or bpy.types.SpaceView3D
+    return space.draw_handler_add(monitored(name, callback), args, region_type, draw_type)
+#endregion
+
+
+#region Control
+def enable(budget_ms=None):
+    if budget_ms is not None:
+        set_budget(budget_ms)
+    _STATE['enabled'] = True
+
+def disable():
+    _STATE['enabled'] = False
+
+def is_enabled():
+    return _STATE['enabled']
+
+def set_budget(budget_ms):
+    _STATE['budget_ms'] = max(0.0, float(budget_ms))
+
+def sync_from_prefs():
+    '''Apply the draw monitor preferences; called on register and from the preference updates'''
+    from .addon import get_prefs
+    try:
+        prefs = get_prefs()
+        enabled, budget_ms = prefs.draw_monitor_enabled, prefs.draw_budget_ms
+    except (KeyError, AttributeError):
+        return
+    set_budget(budget_ms)
+    if enabled:
+        enable()
+    else:
+        disable()
+
+def reset(name=None):
+    if name is None:
+        HANDLERS.clear()
+    else:
+        HANDLERS.pop(name, None)
+#endregion
+
+
+#region Reporting
+def _percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+def stats(name=None):
+    '''Summary of one handler, or {name: summary} for all of them. Means and p95 cover the
+    last WINDOW frames; frames, over_budget and max_ms cover everything since the last reset.'''
+    if name is None:
+        return {key: stats(key) for key in HANDLERS}
+    entry = HANDLERS.get(name)
+    if entry is None or not entry['times']:
+        return None
+    times, batches = entry['times'], entry['batches']
+    return {
+        'frames': entry['frames'],
+        'mean_ms': sum(times) / len(times),
+        'p95_ms': _percentile(times, 0.95),
+        'max_ms': entry['max_ms'],
+        'last_ms': times[-1],
+        'batches_last': batches[-1],
+        'batches_mean': sum(batches) / len(batches),
+        'batches_max': max(batches),
+        'retained_rebuilds_last': entry['last_retained'],
+        'over_budget': entry['over_budget'],
+        'budget_ms': _STATE['budget_ms'],
+    }
+#endregion
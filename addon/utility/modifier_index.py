@@ -0,0 +1,169 @@
+import bpy
+from bpy.app.handlers import persistent
+
+# Reverse index: target object -> modifiers that reference it.
+# Built once on first query, patched per owner object from depsgraph updates and
+# validated on every lookup, so callers pay O(users) instead of O(scene objects x modifiers).
+
+# Modifier type -> properties holding an Object (BOOLEAN 'collection' operands are expanded per object)
+TARGET_PROPERTIES = {
+    'MIRROR': ('mirror_object',),
+    'BOOLEAN': ('object', 'collection'),
+    'ARRAY': ('offset_object', 'start_cap', 'end_cap'),
+    'CURVE': ('object',),
+    'LATTICE': ('object',),
+    'HOOK': ('object',),
+    'SHRINKWRAP': ('target', 'auxiliary_target'),
+    'SCREW': ('object',),
+    'SIMPLE_DEFORM': ('origin',),
+    'CAST': ('object',),
+    'WARP': ('object_from', 'object_to'),
+    'DATA_TRANSFER': ('object',),
+    'NORMAL_EDIT': ('target',),
+    'SURFACE_DEFORM': ('target',),
+    'MESH_DEFORM': ('object',),
+}
+
+# Keys are as_pointer() values so renaming a target or owner doesn't invalidate them;
+# undo/redo/load and object deletion (which can reuse pointers) force a full rebuild.
+_INDEX = {}        # target pointer (0 = property left empty) -> {(owner pointer, modifier name, property): owner}
+_OWNER_KEYS = {}   # owner pointer -> set of target pointers it contributes to
+_STATE = {'dirty': True, 'object_count': -1}
+
+
+def _owner_entries(obj):
+    for mod in obj.modifiers:
+        for prop in TARGET_PROPERTIES.get(mod.type, ()):
+            value = getattr(mod, prop, None)
+            if prop == 'collection':
+                if value is not None and getattr(mod, 'operand_type', 'OBJECT') == 'COLLECTION':
+                    for target in value.all_objects:
+                        yield target.as_pointer(), (obj.as_pointer(), mod.name, prop)
+                continue
+            if prop == 'object' and mod.type == 'BOOLEAN' and getattr(mod, 'operand_type', 'OBJECT') != 'OBJECT':
+                continue
+            yield (value.as_pointer() if value is not None else 0), (obj.as_pointer(), mod.name, prop)
+
+
+def _remove_owner(pointer):
+    for key in _OWNER_KEYS.pop(pointer, ()):
+        entries = _INDEX.get(key)
+        if entries:
+            for entry in [e for e in entries if e[0] == pointer]:
+                del entries[entry]
+            if not entries:
+                del _INDEX[key]
+
+
+def _add_owner(obj):
+    keys = set()
+    for key, entry in _owner_entries(obj):
+        _INDEX.setdefault(key, {})[entry] = obj
+        keys.add(key)
+    if keys:
+        _OWNER_KEYS[obj.as_pointer()] = keys
+
+
+def rebuild_modifier_index():
+    _INDEX.clear()
+    _OWNER_KEYS.clear()
+    for obj in bpy.data.objects:
+        if obj.modifiers:
+            _add_owner(obj)
+    _STATE['dirty'] = False
+    _STATE['object_count'] = len(bpy.data.objects)
+
+
+@persistent
+def mark_modifier_index_dirty(*args):
+    _STATE['dirty'] = True
+
+
+def _ensure_index():
+    if _STATE['dirty'] or _STATE['object_count'] != len(bpy.data.objects):
+        rebuild_modifier_index()
+
+
+def _resolve(entry, obj, target):
+    _, mod_name, prop = entry
+    try:
+        mod = obj.modifiers.get(mod_name)
+    except ReferenceError:
+        return None
+    if mod is None:
+        return None
+    value = getattr(mod, prop, None)
+    if prop == 'collection':
+        return (obj, mod) if value is not None and target is not None and target.name in value.all_objects else None
+    if value != target:
+        return None
+    return obj, mod
+
+
+def find_modifier_users(target, modifier_type=None):
+    '''[(owner object, modifier)] referencing target (None finds modifiers whose
+    target is left empty). A stale entry triggers one rebuild.'''
+    _ensure_index()
+    key = target.as_pointer() if target is not None else 0
+    for attempt in range(2):
+        users = []
+        stale = False
+        for entry, obj in list(_INDEX.get(key, {}).items()):
+            resolved = _resolve(entry, obj, target)
+            if resolved is None:
+                stale = True
+                continue
+            if modifier_type is None or resolved[1].type == modifier_type:
+                users.append(resolved)
+        if not stale or attempt:
+            break
+        rebuild_modifier_index()
+    users.sort(key=lambda u: (u[0].name, u[1].name))
+    return users
+
+
+@persistent
+def modifier_index_depsgraph_handler(scene, depsgraph):
+    '''Re-index only the objects the depsgraph reports as updated'''
+    if _STATE['dirty']:
+        return
+    if _STATE['object_count'] != len(bpy.data.objects):
+        _STATE['dirty'] = True
+        return
+    try:
+        for update in depsgraph.updates:
+            id_data = update.id
+            if not isinstance(id_data, bpy.types.Object):
+                if isinstance(id_data, bpy.types.Collection):
+                    # collection operands may have gained or lost objects
+                    _STATE['dirty'] = True
+                    return
+                continue
+            obj = id_data.original
+            _remove_owner(obj.as_pointer())
+            if obj.modifiers:
+                _add_owner(obj)
+    except ReferenceError:
+        _STATE['dirty'] = True
+
+
+def register():
+    handlers = bpy.app.handlers
+    if modifier_index_depsgraph_handler not in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.append(modifier_index_depsgraph_handler)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        if mark_modifier_index_dirty not in handler_list:
+            handler_list.append(mark_modifier_index_dirty)
+    _STATE['dirty'] = True
+
+
+def unregister():
+    handlers = bpy.app.handlers
+    if modifier_index_depsgraph_handler in handlers.depsgraph_update_post:
+        handlers.depsgraph_update_post.remove(modifier_index_depsgraph_handler)
+    for handler_list in (handlers.load_post, handlers.undo_post, handlers.redo_post):
+        if mark_modifier_index_dirty in handler_list:
+            handler_list.remove(mark_modifier_index_dirty)
+    _INDEX.clear()
+    _OWNER_KEYS.clear()
+    _STATE['dirty'] = True
@@ -0,0 +1,234 @@
+import os
+import sys
+import json
+import time
+import marshal
+import cProfile
+import functools
+import tempfile
+import threading
+from collections import deque
+from datetime import datetime
+
+import bpy
+import bmesh
+
+# Opt-in instrumentation (Preferences > Profiling).
+# While disabled nothing is wrapped. Enabling wraps execute/invoke/modal of the TMC operator
+# classes and the helper functions in HOT_FUNCTIONS; every call then appends one record to a
+# ring buffer and updates per-name totals. Disabling puts the original callables back.
+# Records export as Chrome trace JSON (chrome://tracing, ui.perfetto.dev) and, when cProfile
+# capture is on, as .prof files readable with pstats/snakeviz.
+
+OPERATOR_PREFIXES = ('TMC_OP_', 'TMC_OT_')
+OPERATOR_METHODS = ('execute', 'invoke', 'modal')
+# operator module -> helper functions timed alongside the operators
+HOT_FUNCTIONS = {
+    'modeling': ('GetEdgeList', 'get_mapping'),
+    'looptools': ('get_mapping',),
+    'bakeset': ('check_overlap', 'export_fbx_for_baking'),
+}
+DEFAULT_BUFFER_SIZE = 5000
+
+RECORDS = deque(maxlen=DEFAULT_BUFFER_SIZE)  # {'name', 'cat', 'ts_us', 'dur_us', 'tid', 'counts', 'result', 'profile'}
+STATS = {}  # name -> {'calls', 'total_ms', 'max_ms', 'counts'}
+_STATE = {'enabled': False, 'cprofile': False, 'depth': 0}
+_WRAPPED = []  # (owner, attribute, original) in wrapping order
+_EPOCH = time.perf_counter()
+
+
+#region Recording
+def mesh_counts(context):
+    '''Size of what an operator worked on: the edit mesh, or the selected mesh objects'''
+    try:
+        obj = context.edit_object
+        if obj is not None and obj.type == 'MESH':
+            bm = bmesh.from_edit_mesh(obj.data)
+            return {'objects': 1, 'verts': len(bm.verts), 'edges': len(bm.edges), 'faces': len(bm.faces)}
+        meshes = [o.data for o in context.selected_objects if o.type == 'MESH']
+        return {'objects': len(meshes),
+                'verts': sum(len(me.vertices) for me in meshes),
+                'edges': sum(len(me.edges) for me in meshes),
+                'faces': sum(len(me.polygons) for me in meshes)}
+    except (AttributeError, ReferenceError, RuntimeError):
+        # context members go away when an operator loads a file or deletes the data
+        return None
+
+def _record(name, cat, start, end, counts=None, result=None, profile=None):
+    duration_ms = (end - start) * 1000.0
+    RECORDS.append({
+        'name': name,
+        'cat': cat,
+        'ts_us': (start - _EPOCH) * 1e6,
+        'dur_us': duration_ms * 1000.0,
+        'tid': threading.get_ident(),
+        'counts': counts,
+        'result': result,
+        'profile': profile,
+    })
+    stats = STATS.get(name)
+    if stats is None:
+        stats = STATS[name] = {'calls': 0, 'total_ms': 0.0, 'max_ms': 0.0, 'counts': None}
+    stats['calls'] += 1
+    stats['total_ms'] += duration_ms
+    stats['max_ms'] = max(stats['max_ms'], duration_ms)
+    if counts is not None:
+        stats['counts'] = counts
+
+def _wrap(name, cat, func, phase=None):
+    operator_call = cat == 'operator' and phase != 'modal'
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if not _STATE['enabled']:
+            return func(*args, **kwargs)
+        profile = None
+        if operator_call and _STATE['cprofile'] and _STATE['depth'] == 0:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # another profiler (debugger, coverage) owns the hook
+                profile = None
+        _STATE['depth'] += 1
+        result = None
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+            return result
+        finally:
+            end = time.perf_counter()
+            _STATE['depth'] -= 1
+            dump = None
+            if profile is not None:
+                profile.disable()
+                profile.create_stats()
+                dump = marshal.dumps(profile.stats)
+            counts = mesh_counts(args[1]) if operator_call and len(args) > 1 else None
+            _record(name, cat, start, end, counts,
+                    sorted(result) if isinstance(result, (set, frozenset)) else None, dump)
+
+    wrapper._hs_profiled = func
+    return wrapper
+#endregion
+
+
+#region Instrumenting
+def _replace(owner, attribute, wrapper):
+    _WRAPPED.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, wrapper)
+
+def instrument_operator_classes(classes):
+    for cls in classes:
+        if not cls.__name__.startswith(OPERATOR_PREFIXES):
+            continue
+        for method in OPERATOR_METHODS:
+            func = cls.__dict__.get(method)
+            if func is None or hasattr(func, '_hs_profiled'):
+                continue
+            _replace(cls, method, _wrap("%s %s" % (cls.bl_idname, method), 'operator', func, method))
+
+def instrument_module(module_name, module):
+    for function_name in HOT_FUNCTIONS.get(module_name, ()):
+        func = getattr(module, function_name, None)
+        if func is None or hasattr(func, '_hs_profiled'):
+            continue
+        _replace(module, function_name, _wrap("%s.%s" % (module_name, function_name), 'function', func))
+
+def _instrument_loaded_module(module_name, module):
+    if _STATE['enabled']:
+        instrument_module(module_name, module)
+
+def enable(cprofile=False):
+    from ..operator import classes
+    from ..register import lazy
+    _STATE['cprofile'] = cprofile
+    if _STATE['enabled']:
+        return
+    instrument_operator_classes(classes)
+    package = __name__.rpartition('.utility.')[0] + '.operator'
+    for module_name in HOT_FUNCTIONS:
+        # modules still waiting behind lazy stubs are instrumented when they load
+        module = sys.modules.get(package + '.' + module_name)
+        if module is not None:
+            instrument_module(module_name, module)
+    if _instrument_loaded_module not in lazy.LOAD_CALLBACKS:
+        lazy.LOAD_CALLBACKS.append(_instrument_loaded_module)
+    _STATE['enabled'] = True
+
+def disable():
+    from ..register import lazy
+    _STATE['enabled'] = False
+    while _WRAPPED:
+        owner, attribute, original = _WRAPPED.pop()
+        setattr(owner, attribute, original)
+    if _instrument_loaded_module in lazy.LOAD_CALLBACKS:
+        lazy.LOAD_CALLBACKS.remove(_instrument_loaded_module)
+
+def set_buffer_size(size):
+    global RECORDS
+    size = max(1, int(size))
+    if RECORDS.maxlen != size:
+        RECORDS = deque(RECORDS, maxlen=size)
+
+def sync_from_prefs():
+    '''Apply the Profiling preferences; called on register and from the preference updates'''
+    from .addon import get_prefs
+    try:
+        prefs = get_prefs()
+        enabled, cprofile, size = prefs.profiling_enabled, prefs.profiling_cprofile, prefs.profiling_buffer_size
+    except (KeyError, AttributeError):
+        return
+    set_buffer_size(size)
+    if enabled:
+        enable(cprofile)
+    else:
+        disable()
+
+def is_enabled():
+    return _STATE['enabled']
+
+def clear():
+    RECORDS.clear()
+    STATS.clear()
+#endregion
+
+
+#region Reporting
+def top_stats(count=10, key='total_ms'):
+    return sorted(STATS.items(), key=lambda item: item[1][key], reverse=True)[:count]
+
+def chrome_trace():
+    '''Chrome trace event format: one complete ('X') event per record'''
+    pid = os.getpid()
+    events = []
+    for rec in RECORDS:
+        args = dict(rec['counts'] or {})
+        if rec['result'] is not None:
+            args['result'] = rec['result']
+        events.append({'name': rec['name'], 'cat': rec['cat'], 'ph': 'X',
+                       'ts': round(rec['ts_us'], 3), 'dur': round(rec['dur_us'], 3),
+                       'pid': pid, 'tid': rec['tid'], 'args': args})
+    return {'traceEvents': events, 'displayTimeUnit': 'ms',
+            'otherData': {'blender': bpy.app.version_string, 'created': datetime.now().isoformat(timespec='seconds')}}
+
+def default_export_dir():
+    return os.path.join(tempfile.gettempdir(), "hstool_profile")
+
+def export(folder):
+    '''Write the trace and any cProfile captures to folder; returns (trace path, dump count)'''
+    os.makedirs(folder, exist_ok=True)
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    trace_path = os.path.join(folder, "hstool_trace_%s.json" % stamp)
+    with open(trace_path, 'w', encoding='utf-8') as f:
+        json.dump(chrome_trace(), f)
+    dumps = 0
+    for index, rec in enumerate(RECORDS):
+        if rec['profile'] is None:
+            continue
+        safe_name = "".join(c if c.isalnum() else "_" for c in rec['name'])
+        with open(os.path.join(folder, "hstool_%s_%05d_%s.prof" % (stamp, index, safe_name)), 'wb') as f:
+            f.write(rec['profile'])
+        dumps += 1
+    return trace_path, dumps
+#endregion
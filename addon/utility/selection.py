@@ -0,0 +1,29 @@
+# Cheap edit-mode selection queries for polls and UI redraws.
+# Mesh.total_*_sel read the BMesh selection counters directly while in Edit Mode,
+# so these are O(1) instead of walking every vert/edge/face through bmesh.
+
+def selection_summary(obj):
+    '''Return (selected verts, selected edges, selected faces) for a mesh object'''
+    if not obj or obj.type != 'MESH':
+        return (0, 0, 0)
+    me = obj.data
+    try:
+        return (me.total_vert_sel, me.total_edge_sel, me.total_face_sel)
+    except AttributeError:
+        return (0, 0, 0)
+
+def has_selection(obj):
+    '''True if any vert/edge/face of the mesh object is selected'''
+    return any(selection_summary(obj))
+
+def has_face_selection(obj):
+    return selection_summary(obj)[2] > 0
+
+def edit_mesh_has_selection(context):
+    '''Poll helper: active object is a mesh in Edit Mode with any component selected'''
+    obj = getattr(context, 'active_object', None)
+    if not obj or obj.type != 'MESH':
+        return False
+    if getattr(context, 'mode', '') != 'EDIT_MESH':
+        return False
+    return has_selection(obj)
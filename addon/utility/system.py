@@ -0,0 +1,24 @@
+import os
+import sys
+import subprocess
+
+def open_folder(path):
+    '''Reveal a folder in the platform file browser (os.startfile only exists on Windows)'''
+    if not path or not os.path.isdir(path):
+        return False
+    try:
+        if sys.platform.startswith('win'):
+            os.startfile(path)
+        elif sys.platform == 'darwin':
+            subprocess.Popen(['open', path])
+        else:
+            subprocess.Popen(['xdg-open', path])
+    except (OSError, AttributeError):
+        return False
+    return True
+
+def default_exchange_dir():
+    '''Folder shared with the Maya/Max side when no cache directory is configured'''
+    if sys.platform.startswith('win'):
+        return 'C:/Blender_ImportExport'
+    return os.path.join(os.path.expanduser('~'), 'Blender_ImportExport')
@@ -11,9 +11,7 @@ CHECK_SILHOUETTE = True
 
 # Show/hide collection:
 TOGGLE_COLLECTION_BOOL_LIST = [True, True, True, True, True, True, True, True, True]
-UNHIDE_COLLECTION_BOOL = True
 TOGGLE_REFERENCE_DATA = False
-HIDE_COLLECTION_LIST = []
 
 # Model tool:
 LOCK_VERTEX_INDEX_LIST = []
@@ -21,10 +19,13 @@ PRIORITY_CIRCLE_VERTEX_INDEX_LIST = []
 
 # Screenshot Tool
 CAMERA_LIST = ["top", "bottom", "front", "left", "right", "back", "persp1", "persp2", "persp3", "persp4"]
+## Per-view (width, height) overrides, e.g. {"persp1": (1920, 1080)}; other views use the scene resolution
+CAMERA_RESOLUTION = {}
 
 # File Tool:
 ## Maya
-BLENDER_MAYA_MAX_FBX_PATH = "C:/Blender_ImportExport/BLENDER_MAYA_MAX.fbx"
+## Written by the Maya/Max side into the bridge cache directory
+BLENDER_MAYA_MAX_FBX_NAME = "BLENDER_MAYA_MAX.fbx"
 
 ## Rizom
 RIZOM_CONFIG = None
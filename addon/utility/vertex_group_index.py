@@ -0,0 +1,69 @@
+import bmesh
+import numpy as np
+
+# Vertex -> vertex group membership, read once per operator call.
+# In Edit Mode this walks the bmesh deform layer, otherwise it makes one pass over
+# Mesh.vertices (selection read with foreach_get), so a query costs
+# O(vertices visited x groups per vertex) instead of O(vertices x groups x vertices).
+
+
+def _selected_indices(mesh):
+    mask = np.zeros(len(mesh.vertices), dtype=bool)
+    mesh.vertices.foreach_get('select', mask)
+    return np.flatnonzero(mask).tolist()
+
+
+def bmesh_group_membership(bm, selected_only=False):
+    '''{vertex index: tuple of group indices} for the vertices of bm that belong to any group'''
+    deform = bm.verts.layers.deform.active
+    if deform is None:
+        return {}
+    bm.verts.index_update()
+    membership = {}
+    for vert in bm.verts:
+        if selected_only and not vert.select:
+            continue
+        groups = tuple(vert[deform].keys())
+        if groups:
+            membership[vert.index] = groups
+    return membership
+
+
+def mesh_group_membership(mesh, selected_only=False):
+    '''{vertex index: tuple of group indices}, read from Mesh.vertices (Object Mode data)'''
+    vertices = mesh.vertices
+    indices = _selected_indices(mesh) if selected_only else range(len(vertices))
+    membership = {}
+    for index in indices:
+        groups = tuple(g.group for g in vertices[index].groups)
+        if groups:
+            membership[index] = groups
+    return membership
+
+
+def group_membership(obj, selected_only=False):
+    '''Membership index of a mesh object, from the live edit mesh while in Edit Mode'''
+    if not obj.vertex_groups:
+        return {}
+    if obj.mode == 'EDIT':
+        return bmesh_group_membership(bmesh.from_edit_mesh(obj.data), selected_only)
+    return mesh_group_membership(obj.data, selected_only)
+
+
+def groups_in_membership(obj, membership):
+    '''Names of the vertex groups referenced by a membership index'''
+    used = set()
+    for groups in membership.values():
+        used.update(groups)
+    return {vg.name for vg in obj.vertex_groups if vg.index in used}
+
+
+def remove_from_groups(bm, membership):
+    '''Drop every vertex of the membership index from all its groups; returns the vertex count'''
+    deform = bm.verts.layers.deform.active
+    if deform is None or not membership:
+        return 0
+    bm.verts.ensure_lookup_table()
+    for index in membership:
+        bm.verts[index][deform].clear()
+    return len(membership)
@@ -19,6 +19,9 @@
 __version__ = "1.1.1"
 
 import errno
+import hashlib
+import http.client
+import time
 import traceback
 import platform
 import ssl
@@ -36,6 +39,10 @@ from datetime import datetime, timedelta
 import bpy
 import addon_utils
 
+# File names inside the updater folder.
+INSTALL_MANIFEST_NAME = "install_manifest.json"
+BACKUP_MANIFEST_NAME = "backup_manifest.json"
+
 # -----------------------------------------------------------------------------
 # The main class
 # -----------------------------------------------------------------------------
@@ -98,6 +105,14 @@ class SingletonUpdater:
         self._source_zip = None
         self._check_thread = None
         self._select_link = None
+        self._select_checksum = None
+        self._checksum_manifest = "sha256sums.txt"
+        self._require_checksum = False
+        self._download_chunk_size = 64 * 1024
+        self._download_retries = 3
+        self._download_timeout = 30
+        self._download_progress = (0, None)
+        self._installed_manifest = None
         self.skip_tag = None
 
         # Get data from the running blender module (addon).
@@ -123,6 +138,15 @@ class SingletonUpdater:
 
         self._select_link = select_link_function
 
+        # pre-assign checksum manifest lookup, a release asset by file name
+        def select_checksum_function(self, tag):
+            for asset in tag.get("assets", ()):
+                if asset.get("name") == self._checksum_manifest:
+                    return asset.get("browser_download_url")
+            return None
+
+        self._select_checksum = select_checksum_function
+
     def print_trace(self):
         """Print handled exception details when use_print_traces is set"""
         if self._use_print_traces:
@@ -202,6 +226,17 @@ class SingletonUpdater:
                 self._check_interval_hours,
                 self._check_interval_minutes)
 
+    @property
+    def checksum_manifest(self):
+        return self._checksum_manifest
+
+    @checksum_manifest.setter
+    def checksum_manifest(self, value):
+        if value is None:
+            self._checksum_manifest = None
+        else:
+            self._checksum_manifest = str(value)
+
     @property
     def current_version(self):
         return self._current_version
@@ -223,6 +258,22 @@ class SingletonUpdater:
                     "current_version must be a tuple of integers")
         self._current_version = tuple(tuple_values)
 
+    @property
+    def download_progress(self):
+        """(bytes downloaded, total bytes or None) of the current download"""
+        return self._download_progress
+
+    @property
+    def download_retries(self):
+        return self._download_retries
+
+    @download_retries.setter
+    def download_retries(self, value):
+        try:
+            self._download_retries = max(0, int(value))
+        except:
+            raise ValueError("download_retries must be an integer value")
+
     @property
     def engine(self):
         return self._engine.name
@@ -370,6 +421,29 @@ class SingletonUpdater:
         except:
             raise ValueError("repo must be a string value")
 
+    @property
+    def require_checksum(self):
+        return self._require_checksum
+
+    @require_checksum.setter
+    def require_checksum(self, value):
+        try:
+            self._require_checksum = bool(value)
+        except:
+            raise ValueError("require_checksum must be a boolean value")
+
+    @property
+    def select_checksum(self):
+        return self._select_checksum
+
+    @select_checksum.setter
+    def select_checksum(self, value):
+        # ensure it is a function assignment, with signature:
+        # input self, tag; returns checksum manifest link or None
+        if not hasattr(value, "__call__"):
+            raise ValueError("select_checksum must be a function")
+        self._select_checksum = value
+
     @property
     def select_link(self):
         return self._select_link
@@ -733,20 +807,33 @@ class SingletonUpdater:
             return None
 
     def stage_repository(self, url):
-        """Create a working directory and download the new files"""
+        """Create a working directory and download the new files.
+
+        The installed files are hashed on a worker thread while the zip
+        downloads. A partial download of the same url is kept in the
+        staging folder, so a failed update resumes where it stopped.
+        """
 
         local = os.path.join(self._updater_path, "update_staging")
+        partial_name = self.partial_download_name(url)
         error = None
 
-        # Make/clear the staging folder, to ensure the folder is always clean.
+        # Make/clear the staging folder, keeping only a partial download of
+        # this same url so it can be resumed.
         self.print_verbose(
             "Preparing staging folder for download:\n" + str(local))
         if os.path.isdir(local):
             try:
-                shutil.rmtree(local)
-                os.makedirs(local)
+                for name in os.listdir(local):
+                    if name == partial_name:
+                        continue
+                    path = os.path.join(local, name)
+                    if os.path.isdir(path):
+                        shutil.rmtree(path)
+                    else:
+                        os.remove(path)
             except:
-                error = "failed to remove existing staging directory"
+                error = "failed to clear existing staging directory"
                 self.print_trace()
         else:
             try:
@@ -761,33 +848,29 @@ class SingletonUpdater:
             self._error_msg = "Error: {}".format(error)
             return False
 
-        if self._backup_current:
-            self.create_backup()
+        # Hash the installed files while the zip downloads; the delta merge
+        # and backup compare them against the unpacked update.
+        self._installed_manifest = None
+        scan_thread = threading.Thread(
+            target=self.scan_installed_files, name="addon_updater_scan")
+        scan_thread.daemon = True
+        scan_thread.start()
 
         self.print_verbose("Now retrieving the new source zip")
         self._source_zip = os.path.join(local, "source.zip")
-        self.print_verbose("Starting download update zip")
         try:
-            request = urllib.request.Request(url)
-            context = ssl._create_unverified_context()
-
-            # Setup private token if appropriate.
-            if self._engine.token is not None:
-                if self._engine.name == "gitlab":
-                    request.add_header('PRIVATE-TOKEN', self._engine.token)
-                else:
-                    self.print_verbose(
-                        "Tokens not setup for selected engine yet")
-
-            # Always set user agent
-            request.add_header(
-                'User-Agent', "Python/" + str(platform.python_version()))
-
-            self.url_retrieve(urllib.request.urlopen(request, context=context),
-                              self._source_zip)
-            # Add additional checks on file size being non-zero.
+            expected = self.get_expected_checksum(url)
+            self.print_verbose("Starting download update zip")
+            self.url_retrieve(url, self._source_zip, expected,
+                              os.path.join(local, partial_name))
             self.print_verbose("Successfully downloaded update zip")
             return True
+        except ValueError as e:
+            self._error = "Update aborted, download could not be verified"
+            self._error_msg = "Error: {}".format(e)
+            print(self._error)
+            print(self._error_msg)
+            return False
         except Exception as e:
             self._error = "Error retrieving download, bad link?"
             self._error_msg = "Error: {}".format(e)
@@ -795,6 +878,94 @@ class SingletonUpdater:
             print("Error: {}".format(e))
             self.print_trace()
             return False
+        finally:
+            scan_thread.join()
+
+    def get_expected_checksum(self, url):
+        """SHA-256 of the file at url, read from the release checksum manifest.
+
+        Returns None when the release has no manifest, unless
+        require_checksum is set. Raises ValueError when a manifest exists but
+        can't be read or has no entry for the download.
+        """
+        manifest_link = None
+        for tag in self._tags:
+            try:
+                if self._select_link(self, tag) == url:
+                    manifest_link = self._select_checksum(self, tag)
+                    break
+            except (KeyError, TypeError, AttributeError):
+                continue
+
+        if manifest_link is None:
+            if self._require_checksum:
+                raise ValueError("No checksum manifest found for this release")
+            self.print_verbose(
+                "No checksum manifest found, download is not verified")
+            return None
+
+        self.print_verbose("Reading checksum manifest " + manifest_link)
+        manifest = self.get_raw(manifest_link)
+        if manifest is None:
+            raise ValueError("Could not read checksum manifest")
+        digest = self.parse_checksum_manifest(manifest, url)
+        if digest is None:
+            raise ValueError("Checksum manifest has no entry for the download")
+        return digest
+
+    @staticmethod
+    def parse_checksum_manifest(text, url):
+        """Digest for url from a sha256sum style or JSON checksum manifest.
+
+        Accepted forms: lines of "<sha256>  <file name>", a JSON object
+        mapping file names to digests (optionally under "files"), or a JSON
+        object with a single "sha256" value. A manifest with one entry
+        applies to any download.
+        """
+        name = os.path.basename(urllib.parse.urlparse(url).path)
+        entries = dict()
+        text = text.strip()
+        if text.startswith("{"):
+            data = json.loads(text)
+            if "sha256" in data:
+                return str(data["sha256"]).strip().lower()
+            for key, value in data.get("files", data).items():
+                entries[key] = str(value).strip().lower()
+        else:
+            for line in text.splitlines():
+                parts = line.split(None, 1)
+                if len(parts) == 2:
+                    entries[parts[1].strip().lstrip("*")] = parts[0].lower()
+                elif len(parts) == 1:
+                    entries[""] = parts[0].lower()
+
+        if name in entries:
+            return entries[name]
+        if len(entries) == 1:
+            return next(iter(entries.values()))
+        return None
+
+    @staticmethod
+    def partial_download_name(url):
+        """Staging file name of an unfinished download of url"""
+        return "source-{}.part".format(
+            hashlib.sha1(url.encode("utf-8")).hexdigest()[:12])
+
+    def form_download_request(self, url):
+        request = urllib.request.Request(url)
+
+        # Setup private token if appropriate.
+        if self._engine.token is not None:
+            if self._engine.name == "gitlab":
+                request.add_header('PRIVATE-TOKEN', self._engine.token)
+            else:
+                self.print_verbose(
+                    "Tokens not setup for selected engine yet")
+
+        # Always set user agent
+        request.add_header(
+            'User-Agent', "Python/" + str(platform.python_version()))
+        return request
 
     def create_backup(self):
         """Save a backup of the current installed addon prior to an update."""
@@ -823,23 +994,27 @@ class SingletonUpdater:
                     "Failed to remove existing temp folder, continuing")
                 self.print_trace()
 
-        # Make a full addon copy, temporarily placed outside the addon folder.
         if self._backup_ignore_patterns is not None:
-            try:
-                shutil.copytree(self._addon_root, tempdest,
-                                ignore=shutil.ignore_patterns(
-                                    *self._backup_ignore_patterns))
-            except:
-                print("Failed to create backup, still attempting update.")
-                self.print_trace()
-                return
+            ignore_patterns = shutil.ignore_patterns(
+                *self._backup_ignore_patterns)
         else:
-            try:
-                shutil.copytree(self._addon_root, tempdest)
-            except:
-                print("Failed to create backup, still attempting update.")
-                self.print_trace()
-                return
+            ignore_patterns = None
+        updater_path = os.path.normpath(self._updater_path)
+
+        def ignore(path, names):
+            ignored = set(ignore_patterns(path, names)) if ignore_patterns else set()
+            # The update zip downloads into the staging folder during the copy.
+            if os.path.normpath(path) == updater_path:
+                ignored.add("update_staging")
+            return ignored
+
+        # Make a full addon copy, temporarily placed outside the addon folder.
+        try:
+            shutil.copytree(self._addon_root, tempdest, ignore=ignore)
+        except:
+            print("Failed to create backup, still attempting update.")
+            self.print_trace()
+            return
         shutil.move(tempdest, local)
 
         # Save the date for future reference.
@@ -850,16 +1025,34 @@ class SingletonUpdater:
 
     def restore_backup(self):
         """Restore the last backed up addon version, user initiated only"""
-        self.print_verbose("Restoring backup, backing up current addon folder")
         backuploc = os.path.join(self._updater_path, "backup")
-        tempdest = os.path.join(
-            self._addon_root, os.pardir, self._addon + "_updater_backup_temp")
-        tempdest = os.path.abspath(tempdest)
+        manifest_path = os.path.join(backuploc, BACKUP_MANIFEST_NAME)
+
+        if os.path.isfile(manifest_path):
+            self.print_verbose("Restoring backup, reversing the last update")
+            with open(manifest_path) as data_file:
+                manifest = json.load(data_file)
+            self.restore_delta_backup(backuploc, manifest)
+        elif not os.path.isfile(os.path.join(backuploc, "__init__.py")):
+            # Neither a delta backup nor a full copy of the addon (e.g. an
+            # interrupted backup), replacing the addon with it would break it.
+            self._error = "Restore failed"
+            self._error_msg = "Backup folder is incomplete"
+            print("Backup at {} is incomplete, not restoring".format(backuploc))
+            return False
+        else:
+            # Full copy of the addon folder, from create_backup.
+            self.print_verbose(
+                "Restoring backup, backing up current addon folder")
+            tempdest = os.path.join(
+                self._addon_root, os.pardir,
+                self._addon + "_updater_backup_temp")
+            tempdest = os.path.abspath(tempdest)
 
-        # Move instead contents back in place, instead of copy.
-        shutil.move(backuploc, tempdest)
-        shutil.rmtree(self._addon_root)
-        os.rename(tempdest, self._addon_root)
+            # Move instead contents back in place, instead of copy.
+            shutil.move(backuploc, tempdest)
+            shutil.rmtree(self._addon_root)
+            os.rename(tempdest, self._addon_root)
 
         self._json["backup_date"] = ""
         self._json["just_restored"] = True
@@ -987,7 +1180,13 @@ class SingletonUpdater:
         return 0
 
     def deep_merge_directory(self, base, merger, clean=False):
-        """Merge folder 'merger' into 'base' without deleting existing"""
+        """Merge folder 'merger' into 'base' as a delta of changed files.
+
+        Only files the update adds, overwrites with different content or
+        removes are touched. With backup_current on, the originals of
+        overwritten and removed files are saved first so restore_backup can
+        reverse exactly this delta.
+        """
         if not os.path.exists(base):
             self.print_verbose("Base path does not exist:" + str(base))
             return -1
@@ -998,100 +1197,35 @@ class SingletonUpdater:
         # Path to be aware of and not overwrite/remove/etc.
         staging_path = os.path.join(self._updater_path, "update_staging")
 
-        # If clean install is enabled, clear existing files ahead of time
-        # note: will not delete the update.json, update folder, staging, or
-        # staging but will delete all other folders/files in addon directory.
-        error = None
-        if clean:
-            try:
-                # Implement clearing of all folders/files, except the updater
-                # folder and updater json.
-                # Careful, this deletes entire subdirectories recursively...
-                # Make sure that base is not a high level shared folder, but
-                # is dedicated just to the addon itself.
-                self.print_verbose(
-                    "clean=True, clearing addon folder to fresh install state")
+        # Hashed on a worker thread during the download, see stage_repository.
+        installed = self._installed_manifest
+        self._installed_manifest = None
+        if installed is None:
+            installed = self.scan_installed_files()
 
-                # Remove root files and folders (except update folder).
-                files = [f for f in os.listdir(base)
-                         if os.path.isfile(os.path.join(base, f))]
-                folders = [f for f in os.listdir(base)
-                           if os.path.isdir(os.path.join(base, f))]
+        delta = self.plan_update_delta(installed, merger, clean)
+        self.print_verbose("Update delta: {} new, {} changed, {} removed".format(
+            len(delta["add"]), len(delta["change"]), len(delta["remove"])))
 
-                for f in files:
-                    os.remove(os.path.join(base, f))
-                    self.print_verbose(
-                        "Clean removing file {}".format(os.path.join(base, f)))
-                for f in folders:
-                    if os.path.join(base, f) is self._updater_path:
-                        continue
-                    shutil.rmtree(os.path.join(base, f))
-                    self.print_verbose(
-                        "Clean removing folder and contents {}".format(
-                            os.path.join(base, f)))
+        if self._backup_current:
+            self.create_delta_backup(base, delta)
 
-            except Exception as err:
-                error = "failed to create clean existing addon folder"
-                print(error, str(err))
+        for rel in delta["remove"]:
+            try:
+                os.remove(os.path.join(base, rel))
+                self.print_verbose("Removed file " + rel)
+            except OSError:
+                print("Failed to remove " + rel)
                 self.print_trace()
+            self._prune_empty_dirs(base, rel)
 
-        # Walk through the base addon folder for rules on pre-removing
-        # but avoid removing/altering backup and updater file.
-        for path, dirs, files in os.walk(base):
-            # Prune ie skip updater folder.
-            dirs[:] = [d for d in dirs
-                       if os.path.join(path, d) not in [self._updater_path]]
-            for file in files:
-                for pattern in self.remove_pre_update_patterns:
-                    if fnmatch.filter([file], pattern):
-                        try:
-                            fl = os.path.join(path, file)
-                            os.remove(fl)
-                            self.print_verbose("Pre-removed file " + file)
-                        except OSError:
-                            print("Failed to pre-remove " + file)
-                            self.print_trace()
-
-        # Walk through the temp addon sub folder for replacements
-        # this implements the overwrite rules, which apply after
-        # the above pre-removal rules. This also performs the
-        # actual file copying/replacements.
-        for path, dirs, files in os.walk(merger):
-            # Verify structure works to prune updater sub folder overwriting.
-            dirs[:] = [d for d in dirs
-                       if os.path.join(path, d) not in [self._updater_path]]
-            rel_path = os.path.relpath(path, merger)
-            dest_path = os.path.join(base, rel_path)
+        for rel in delta["add"] + delta["change"]:
+            dest_file = os.path.join(base, rel)
+            dest_path = os.path.dirname(dest_file)
             if not os.path.exists(dest_path):
                 os.makedirs(dest_path)
-            for file in files:
-                # Bring in additional logic around copying/replacing.
-                # Blender default: overwrite .py's, don't overwrite the rest.
-                dest_file = os.path.join(dest_path, file)
-                srcFile = os.path.join(path, file)
-
-                # Decide to replace if file already exists, and copy new over.
-                if os.path.isfile(dest_file):
-                    # Otherwise, check each file for overwrite pattern match.
-                    replaced = False
-                    for pattern in self._overwrite_patterns:
-                        if fnmatch.filter([file], pattern):
-                            replaced = True
-                            break
-                    if replaced:
-                        os.remove(dest_file)
-                        os.rename(srcFile, dest_file)
-                        self.print_verbose(
-                            "Overwrote file " + os.path.basename(dest_file))
-                    else:
-                        self.print_verbose(
-                            "Pattern not matched to {}, not overwritten".format(
-                                os.path.basename(dest_file)))
-                else:
-                    # File did not previously exist, simply move it over.
-                    os.rename(srcFile, dest_file)
-                    self.print_verbose(
-                        "New file " + os.path.basename(dest_file))
+            os.replace(os.path.join(merger, rel), dest_file)
+            self.print_verbose("Wrote file " + rel)
 
         # now remove the temp staging folder and downloaded zip
         try:
@@ -1102,6 +1236,222 @@ class SingletonUpdater:
             self.print_verbose(error)
             self.print_trace()
 
+        self.save_install_manifest(self.file_manifest(base, installed))
+        return 0
+
+    # -------------------------------------------------------------------------
+    # File manifests, delta merges and backups
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def _match_patterns(rel, patterns):
+        """True if any path component of rel matches one of the patterns"""
+        if not patterns:
+            return False
+        for name in rel.split("/"):
+            for pattern in patterns:
+                if fnmatch.fnmatch(name, pattern):
+                    return True
+        return False
+
+    @staticmethod
+    def file_sha256(path):
+        hasher = hashlib.sha256()
+        with open(path, "rb") as f:
+            for data in iter(lambda: f.read(1024 * 1024), b""):
+                hasher.update(data)
+        return hasher.hexdigest()
+
+    def iter_addon_files(self, base):
+        """Relative '/' separated paths of files in base, minus the updater folder"""
+        updater_path = os.path.normpath(self._updater_path)
+        for path, dirs, files in os.walk(base):
+            dirs[:] = [d for d in dirs
+                       if os.path.normpath(os.path.join(path, d)) != updater_path]
+            for file in files:
+                rel = os.path.relpath(os.path.join(path, file), base)
+                yield rel.replace(os.sep, "/")
+
+    def file_manifest(self, base, cache=None):
+        """{relative path: {"size", "mtime", "sha256"}} of the files in base.
+
+        Hashes are reused from cache (a previous manifest) when a file's size
+        and mtime are unchanged, so only modified files are read.
+        """
+        manifest = dict()
+        for rel in self.iter_addon_files(base):
+            full = os.path.join(base, rel)
+            try:
+                stat = os.stat(full)
+                entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+                cached = cache.get(rel) if cache else None
+                if (cached and cached.get("size") == entry["size"]
+                        and cached.get("mtime") == entry["mtime"]):
+                    entry["sha256"] = cached["sha256"]
+                else:
+                    entry["sha256"] = self.file_sha256(full)
+            except OSError:
+                self.print_verbose("Could not read file for manifest: " + rel)
+                continue
+            manifest[rel] = entry
+        return manifest
+
+    def get_install_manifest_path(self):
+        return os.path.join(self._updater_path, INSTALL_MANIFEST_NAME)
+
+    def save_install_manifest(self, manifest):
+        path = self.get_install_manifest_path()
+        try:
+            with open(path + ".tmp", "w") as outf:
+                json.dump(manifest, outf)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            self.print_verbose("Failed to save install manifest")
+            self.print_trace()
+
+    def scan_installed_files(self):
+        """Manifest of the installed addon, reusing the last saved hashes"""
+        cache = None
+        try:
+            with open(self.get_install_manifest_path()) as data_file:
+                cache = json.load(data_file)
+        except (OSError, ValueError):
+            pass
+        manifest = self.file_manifest(self._addon_root, cache)
+        self._installed_manifest = manifest
+        return manifest
+
+    def plan_update_delta(self, installed, merger, clean=False):
+        """Relative paths an update adds, changes and removes.
+
+        Follows the merge rules: with clean, or when matching
+        remove_pre_update_patterns, installed files are replaced or removed.
+        Other existing files are only replaced when matching
+        overwrite_patterns, and new files are always added. Files whose
+        content would stay the same are left out.
+        """
+        delta = {"add": list(), "change": list(), "remove": list()}
+        incoming = set()
+        for rel in self.iter_addon_files(merger):
+            incoming.add(rel)
+            current = installed.get(rel)
+            if current is None:
+                delta["add"].append(rel)
+                continue
+            name = rel.rsplit("/", 1)[-1]
+            replace = (clean
+                       or self._match_patterns(name, self._remove_pre_update_patterns)
+                       or self._match_patterns(name, self._overwrite_patterns))
+            if not replace:
+                continue
+            src = os.path.join(merger, rel)
+            if (os.path.getsize(src) == current["size"]
+                    and self.file_sha256(src) == current["sha256"]):
+                continue
+            delta["change"].append(rel)
+
+        for rel in installed:
+            if rel in incoming:
+                continue
+            name = rel.rsplit("/", 1)[-1]
+            if clean or self._match_patterns(name, self._remove_pre_update_patterns):
+                delta["remove"].append(rel)
+        return delta
+
+    def create_delta_backup(self, base, delta):
+        """Back up the files an update will overwrite or remove.
+
+        The backup folder holds those files and a manifest of the whole delta,
+        so restore_backup can delete the added files and put the rest back.
+        Files matching backup_ignore_patterns are not saved. The backup is
+        built in a temporary folder and moved into place only once its
+        manifest is written, so a failed backup never leaves a partial
+        folder for restore_backup to act on.
+        """
+        self.print_verbose("Backing up files changed by the update")
+        local = os.path.join(self._updater_path, "backup")
+        building = os.path.join(self._updater_path, "backup_building")
+        # The previous backup reverses an older update, it can't be kept.
+        for folder in (local, building):
+            if os.path.isdir(folder):
+                try:
+                    shutil.rmtree(folder)
+                except:
+                    self.print_verbose(
+                        "Failed to removed previous backup folder, continuing")
+                    self.print_trace()
+
+        saved = dict()
+        try:
+            for rel in delta["change"] + delta["remove"]:
+                if self._match_patterns(rel, self._backup_ignore_patterns):
+                    continue
+                dest = os.path.join(building, "files", rel)
+                os.makedirs(os.path.dirname(dest), exist_ok=True)
+                shutil.copy2(os.path.join(base, rel), dest)
+                saved[rel] = True
+            manifest = {
+                "version": 1,
+                "created": str(datetime.now()),
+                "added": delta["add"],
+                "changed": delta["change"],
+                "removed": delta["remove"],
+                "saved": sorted(saved),
+            }
+            os.makedirs(building, exist_ok=True)
+            with open(os.path.join(building, BACKUP_MANIFEST_NAME), "w") as outf:
+                json.dump(manifest, outf, indent=4)
+            os.replace(building, local)
+        except:
+            print("Failed to create backup, still attempting update.")
+            self.print_trace()
+            for folder in (building, local):
+                if os.path.isdir(folder):
+                    shutil.rmtree(folder, ignore_errors=True)
+            return
+
+        # Save the date for future reference.
+        now = datetime.now()
+        self._json["backup_date"] = "{m}-{d}-{yr}".format(
+            m=now.strftime("%B"), d=now.day, yr=now.year)
+        self.save_updater_json()
+
+    def restore_delta_backup(self, backuploc, manifest):
+        """Reverse an update recorded by create_delta_backup"""
+        base = self._addon_root
+        for rel in manifest["added"]:
+            try:
+                os.remove(os.path.join(base, rel))
+            except FileNotFoundError:
+                pass
+            self._prune_empty_dirs(base, rel)
+
+        saved = set(manifest["saved"])
+        for rel in manifest["changed"] + manifest["removed"]:
+            dest = os.path.join(base, rel)
+            if rel not in saved:
+                # Not backed up (ignored pattern, e.g. caches), drop the new copy.
+                if os.path.isfile(dest):
+                    os.remove(dest)
+                    self._prune_empty_dirs(base, rel)
+                continue
+            os.makedirs(os.path.dirname(dest), exist_ok=True)
+            os.replace(os.path.join(backuploc, "files", rel), dest)
+
+        shutil.rmtree(backuploc)
+        self.save_install_manifest(self.file_manifest(base))
+
+    @staticmethod
+    def _prune_empty_dirs(base, rel):
+        """Remove the folders of rel left empty, up to (not including) base"""
+        path = os.path.dirname(os.path.join(base, rel))
+        base = os.path.normpath(base)
+        while os.path.normpath(path) != base:
+            try:
+                os.rmdir(path)
+            except OSError:
+                break
+            path = os.path.dirname(path)
+
     def reload_addon(self):
         # if post_update false, skip this function
         # else, unload/reload addon & trigger popup
@@ -1137,18 +1487,93 @@ class SingletonUpdater:
         self._error = None
         self._error_msg = None
 
-    def url_retrieve(self, url_file, filepath):
-        """Custom urlretrieve implementation"""
-        chunk = 1024 * 8
-        f = open(filepath, "wb")
-        while 1:
-            data = url_file.read(chunk)
-            if not data:
-                # print("done.")
+    def url_retrieve(self, url, filepath, expected_sha256=None,
+                     partial_path=None):
+        """Custom urlretrieve implementation, chunked and resumable.
+
+        Data is written to partial_path and hashed as it arrives. After a
+        dropped connection the request is retried with an HTTP Range header
+        from the bytes already on disk, and a partial file left by an earlier
+        attempt is resumed the same way. The file is moved to filepath only
+        once it is complete and matches expected_sha256 (if given).
+        """
+        if partial_path is None:
+            partial_path = filepath + ".part"
+        chunk = self._download_chunk_size
+
+        hasher = hashlib.sha256()
+        size = 0
+        if os.path.isfile(partial_path):
+            with open(partial_path, "rb") as f:
+                for data in iter(lambda: f.read(chunk), b""):
+                    hasher.update(data)
+                    size += len(data)
+            self.print_verbose("Resuming download at {} bytes".format(size))
+
+        try:
+            context = ssl._create_unverified_context()
+        except:
+            context = None
+
+        attempt = 0
+        while True:
+            request = self.form_download_request(url)
+            if size:
+                request.add_header('Range', "bytes={}-".format(size))
+            try:
+                if context:
+                    url_file = urllib.request.urlopen(
+                        request, context=context, timeout=self._download_timeout)
+                else:
+                    url_file = urllib.request.urlopen(
+                        request, timeout=self._download_timeout)
+                with url_file:
+                    if size and url_file.getcode() != 206:
+                        # Range ignored, the server is sending the whole file.
+                        hasher = hashlib.sha256()
+                        size = 0
+                    length = url_file.headers.get("Content-Length")
+                    total = size + int(length) if length else None
+                    self._download_progress = (size, total)
+                    with open(partial_path, "ab" if size else "wb") as f:
+                        while True:
+                            data = url_file.read(chunk)
+                            if not data:
+                                break
+                            f.write(data)
+                            hasher.update(data)
+                            size += len(data)
+                            self._download_progress = (size, total)
+                if total is not None and size < total:
+                    raise http.client.IncompleteRead(b"", total - size)
                 break
-            f.write(data)
-            # print("Read %s bytes" % len(data))
-        f.close()
+            except urllib.error.HTTPError as e:
+                if e.code != 416 or not size:
+                    raise
+                # Range past the end of the file, the partial data is stale.
+                self.print_verbose("Partial download rejected, restarting")
+                os.remove(partial_path)
+                hasher = hashlib.sha256()
+                size = 0
+                error = e
+            except (urllib.error.URLError, http.client.HTTPException,
+                    OSError) as e:
+                error = e
+
+            attempt += 1
+            if attempt > self._download_retries:
+                raise error
+            self.print_verbose("Download interrupted ({}), retry {} of {}".format(
+                error, attempt, self._download_retries))
+            time.sleep(min(2 ** attempt, 8))
+
+        digest = hasher.hexdigest()
+        if expected_sha256 is not None and digest != expected_sha256.lower():
+            os.remove(partial_path)
+            raise ValueError("Checksum mismatch, expected {} got {}".format(
+                expected_sha256, digest))
+        os.replace(partial_path, filepath)
+        self.print_verbose("Downloaded {} bytes, sha256 {}".format(size, digest))
 
     def version_tuple_from_text(self, text):
         """Convert text into a tuple of numbers (int).
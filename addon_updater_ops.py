@@ -577,7 +577,9 @@ class AddonUpdaterRestoreBackup(bpy.types.Operator):
         # in case of error importing updater
         if updater.invalid_updater:
             return {'CANCELLED'}
-        updater.restore_backup()
+        if updater.restore_backup() is False:
+            self.report({'ERROR'}, updater.error_msg)
+            return {'CANCELLED'}
         return {'FINISHED'}
 
 
@@ -1395,6 +1397,17 @@ def register(bl_info):
     # Alternate example patterns:
     # updater.backup_ignore_patterns = [".git", "__pycache__", "*.bat", ".gitignore", "*.exe"]
 
+    # Release asset holding the SHA-256 of the update zip, either lines of
+    # "<sha256>  <file name>" (sha256sum output) or a JSON object. Downloads
+    # are verified against it when the selected release has this asset.
+    updater.checksum_manifest = "sha256sums.txt"
+    # Set True to refuse updates from releases without a checksum manifest.
+    updater.require_checksum = False
+
+    # Interrupted downloads are retried from the last received byte (HTTP
+    # Range) this many times before the update fails.
+    updater.download_retries = 3
+
     # Patterns for files to actively overwrite if found in new update file and
     # are also found in the currently installed addon. Note that by default
     # (ie if set to []), updates are installed in the same way as blender:
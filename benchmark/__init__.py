@@ -0,0 +1,10 @@
+# Headless benchmark suite for HS Tool operators.
+#
+#   blender -b --factory-startup --python <addon folder>/benchmark/run.py -- [options]
+#
+# Options (see runner.parse_args): --cases, --profile quick|full, --sizes, --warmup, --repeats,
+# --output results.json, --baseline path (default benchmark/baseline.json), --threshold 0.15,
+# --update-baseline. Blender exits with code 1 when a case raised, regressed against the baseline,
+# or is in the baseline but produced no timing this run.
+#
+# Scenes are generated procedurally (scenes.py); cases live in cases.py.
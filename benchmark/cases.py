@@ -0,0 +1,141 @@
+import types
+
+import bpy
+
+from . import scenes
+
+# Each case builds a scene for one size (untimed), optionally restores state before every
+# timed run (untimed), then times run(). Sizes are listed per profile: 'quick' for a smoke
+# run, 'full' for release comparisons.
+
+
+class BenchmarkCase:
+    def __init__(self, name, unit, sizes, setup, run, prepare=None, fresh=True, iterations=1):
+        self.name = name
+        self.unit = unit              # what size counts, e.g. 'objects'
+        self.sizes = sizes            # {profile: [size, ...]}
+        self.setup = setup            # size -> state
+        self.run = run                # state -> None, the timed part
+        self.prepare = prepare        # state -> None, before every timed run
+        self.fresh = fresh            # rebuild the scene for every run (the operator edits it)
+        self.iterations = iterations  # run() calls per timed sample; samples are per call
+
+
+def operator_driver(op_class, **state):
+    '''Plain object carrying op_class's methods and the given attributes.
+    Modal operators need a window, so their per-step work is driven through this instead.'''
+    methods = {k: v for k, v in vars(op_class).items() if isinstance(v, types.FunctionType)}
+    driver = type(op_class.__name__ + "Driver", (), methods)()
+    driver.__dict__.update(state)
+    return driver
+
+
+#region check_all
+def setup_check_all(count):
+    return {'objects': scenes.make_kitbash(count)}
+
+def prepare_check_all(state):
+    scenes.select_objects(state['objects'])
+
+def run_check_all(state):
+    bpy.ops.tmc.check_all()
+#endregion
+
+
+#region relax_edge / circle_edge
+def _clear_looptools_cache():
+    from ..addon.operator import modeling
+    modeling.looptools_cache.clear()
+
+def setup_relax_edge(size):
+    obj = scenes.make_grid("Relax_Grid", size, noise=0.25)
+    rows = sorted({size // 4, size // 2, (3 * size) // 4})
+    scenes.select_objects([obj], mode='EDIT')
+    scenes.edit_select_edges(obj, scenes.grid_edges(obj, size, scenes.grid_rows_mask(size, rows)))
+    return {'object': obj, 'info': {'loops': len(rows), 'mesh_verts': len(obj.data.vertices)}}
+
+def run_relax_edge(state):
+    bpy.ops.tmc.relax_edge()
+
+def setup_circle_edge(size):
+    obj = scenes.make_grid("Circle_Grid", size, noise=0.1)
+    lo, hi = size // 4, size - size // 4
+    scenes.select_objects([obj], mode='EDIT')
+    scenes.edit_select_edges(obj, scenes.grid_edges(obj, size, scenes.grid_square_mask(size, lo, hi)))
+    return {'object': obj, 'info': {'loop_verts': 4 * (hi - lo), 'mesh_verts': len(obj.data.vertices)}}
+
+def run_circle_edge(state):
+    bpy.ops.tmc.circle_edge()
+#endregion
+
+
+#region re_bevel
+def setup_re_bevel(segments):
+    from ..addon.operator.rebevel import TMC_OP_Unbevel
+    obj, rings = scenes.make_beveled_cylinder("ReBevel_Cylinder", segments, bevel_segments=3)
+    scenes.select_objects([obj], mode='EDIT')
+    bm = scenes.edit_select_edges(obj, rings)
+    # same state the operator's invoke/modal leaves before execute()
+    driver = operator_driver(TMC_OP_Unbevel, tension=0.5, start_tenison=0.5, use_profile=False,
+                             only_resize=True, resize_mode='UNIFORM', run_exec=False)
+    vert_loops, _ = driver.my_get_sorted_loops(bm)
+    driver.segments = driver.start_segments = len(vert_loops[0]) - 2
+    return {'object': obj, 'driver': driver, 'info': {'rings': len(vert_loops), 'ring_edges': len(rings)}}
+
+def run_re_bevel(state):
+    state['driver'].rebevel(bpy.context, 1.5)
+#endregion
+
+
+#region auto_create_bakeset
+def setup_auto_create_bakeset(count):
+    pairs = scenes.make_bake_pairs(count)
+    scenes.select_objects([pairs[0][0]])
+    return {'pairs': pairs}
+
+def run_auto_create_bakeset(state):
+    bpy.ops.tmc.auto_create_bakeset()
+#endregion
+
+
+#region edge constraint frame
+EDGE_CONSTRAINT_GRID = 256
+
+def setup_edge_constraint_frame(loops):
+    '''Frame cost of tmc.edge_constraints against selection size: loops rows of a fixed grid'''
+    from ..addon.operator.edge_constraint import TMC_OP_EdgeConstraints, _get_selected_vert_sequences
+    size = EDGE_CONSTRAINT_GRID
+    obj = scenes.make_grid("EdgeConstraint_Grid", size, noise=0.05)
+    step = max(1, size // (loops + 1))
+    rows = [step * (k + 1) for k in range(loops)]
+    scenes.select_objects([obj], mode='EDIT')
+    bm = scenes.edit_select_edges(obj, scenes.grid_edges(obj, size, scenes.grid_rows_mask(size, rows)))
+    bm.normal_update()
+    bm.verts.ensure_lookup_table()
+    sequences = _get_selected_vert_sequences([v for v in bm.verts if v.select], ensure_seq_len=True)
+    driver = operator_driver(TMC_OP_EdgeConstraints, active=obj, mx=obj.matrix_world.copy(), bm=bm)
+    driver.data = driver._build_selection_data(sequences)
+    return {'object': obj, 'driver': driver, 'info': {
+        'selected_verts': len(driver.verts), 'update_faces': len(driver.update_faces),
+        'mesh_verts': len(bm.verts)}}
+
+def run_edge_constraint_frame(state):
+    # per-frame mesh work of the modal: write coords, local normals, edit-mesh update
+    state['driver']._reset_mesh()
+#endregion
+
+
+CASES = [
+    BenchmarkCase("check_all", "objects", {'quick': [10, 100], 'full': [10, 100, 1000, 10000]},
+                  setup_check_all, run_check_all, prepare=prepare_check_all, fresh=False),
+    BenchmarkCase("relax_edge", "loop verts", {'quick': [32, 128], 'full': [32, 128, 512]},
+                  setup_relax_edge, run_relax_edge, prepare=lambda state: _clear_looptools_cache()),
+    BenchmarkCase("circle_edge", "grid size", {'quick': [32, 128], 'full': [32, 128, 512]},
+                  setup_circle_edge, run_circle_edge),
+    BenchmarkCase("re_bevel", "cylinder segments", {'quick': [32, 128], 'full': [32, 128, 512, 2048]},
+                  setup_re_bevel, run_re_bevel),
+    BenchmarkCase("auto_create_bakeset", "pairs", {'quick': [10, 50], 'full': [10, 50, 200, 500]},
+                  setup_auto_create_bakeset, run_auto_create_bakeset),
+    BenchmarkCase("edge_constraint_frame", "selected loops", {'quick': [1, 8], 'full': [1, 4, 16, 64]},
+                  setup_edge_constraint_frame, run_edge_constraint_frame, fresh=False, iterations=20),
+]
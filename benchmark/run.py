@@ -0,0 +1,26 @@
+import importlib
+import os
+import sys
+
+# Entry script for `blender -b --python benchmark/run.py -- ...`. Blender runs it as a plain
+# script, so it puts the add-on's parent folder on sys.path, enables the add-on (registering
+# its operators and scene settings) and hands over to the package runner.
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def main():
+    import addon_utils
+    module_name = os.path.basename(ADDON_DIR)
+    parent = os.path.dirname(ADDON_DIR)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    if addon_utils.enable(module_name, default_set=False) is None:
+        print("Could not enable the add-on module", module_name)
+        sys.exit(2)
+    runner = importlib.import_module(module_name + ".benchmark.runner")
+    sys.exit(runner.main(runner.argv_after_separator()))
+
+
+if __name__ == "__main__":
+    main()
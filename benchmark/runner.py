@@ -0,0 +1,211 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import bpy
+
+from .. import bl_info
+from . import scenes
+from .cases import CASES
+
+RESULTS_VERSION = 1
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+#region Timing
+def time_case(case, size, warmup, repeats):
+    samples = []
+    state = None
+    for index in range(warmup + repeats):
+        if state is None or case.fresh:
+            scenes.reset_scene()
+            state = case.setup(size)
+        if case.prepare:
+            case.prepare(state)
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(case.iterations):
+            case.run(state)
+        elapsed = (time.perf_counter() - start) * 1000.0 / case.iterations
+        if index >= warmup:
+            samples.append(elapsed)
+    info = state.get('info', {}) if isinstance(state, dict) else {}
+    return {
+        'case': case.name,
+        'size': size,
+        'unit': case.unit,
+        'iterations': case.iterations,
+        'samples_ms': [round(s, 4) for s in samples],
+        'min_ms': min(samples),
+        'median_ms': statistics.median(samples),
+        'mean_ms': statistics.fmean(samples),
+        'stdev_ms': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'info': info,
+    }
+
+def run_suite(case_names=None, profile='full', sizes=None, warmup=1, repeats=5, log=print):
+    results = []
+    for case in CASES:
+        if case_names and case.name not in case_names:
+            continue
+        for size in sizes or case.sizes[profile]:
+            log("  %-24s %-18s %8s ..." % (case.name, case.unit, size))
+            try:
+                row = time_case(case, size, warmup, repeats)
+            except Exception as e:
+                # keep going; a broken case must not hide the timings of the others
+                row = {'case': case.name, 'size': size, 'unit': case.unit, 'error': repr(e)}
+                log("    failed: %r" % e)
+            else:
+                log("    median %.3f ms  (min %.3f, stdev %.3f)" % (row['median_ms'], row['min_ms'], row['stdev_ms']))
+            results.append(row)
+    scenes.reset_scene()
+    return {
+        'version': RESULTS_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'addon_version': list(bl_info['version']),
+        'blender': bpy.app.version_string,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'profile': profile,
+        'cases': sorted(case_names) if case_names else None,
+        'sizes': list(sizes) if sizes else None,
+        'warmup': warmup,
+        'repeats': repeats,
+        'results': results,
+    }
+#endregion
+
+
+#region Baseline comparison
+def _planned(current, case_name, size):
+    '''Whether this run was asked to time (case_name, size); a case that no longer
+    exists counts as planned, so renaming or dropping a case shows up as missing'''
+    if current.get('cases') and case_name not in current['cases']:
+        return False
+    if current.get('sizes'):
+        return size in current['sizes']
+    case = next((c for c in CASES if c.name == case_name), None)
+    return case is None or size in case.sizes.get(current.get('profile'), ())
+
+def compare_results(current, baseline, threshold=0.15, min_delta_ms=0.5):
+    '''Pair rows by (case, size) and flag medians slower than the baseline by more than
+    threshold (relative) and min_delta_ms (absolute, so sub-millisecond noise is ignored).
+    Cases that raised and baseline rows this run should have produced but didn't are
+    failures as well.'''
+    base_rows = {(r['case'], r['size']): r for r in baseline.get('results', []) if 'median_ms' in r}
+    rows = []
+    seen = set()
+    for row in current['results']:
+        key = (row['case'], row['size'])
+        seen.add(key)
+        base = base_rows.get(key)
+        if 'median_ms' not in row:
+            rows.append({'case': row['case'], 'size': row['size'], 'status': 'error', 'error': row.get('error'),
+                         'baseline_ms': base['median_ms'] if base else None})
+            continue
+        if base is None:
+            rows.append({'case': row['case'], 'size': row['size'], 'status': 'new', 'median_ms': row['median_ms']})
+            continue
+        delta = row['median_ms'] - base['median_ms']
+        ratio = row['median_ms'] / base['median_ms'] if base['median_ms'] > 0 else float('inf')
+        if ratio > 1.0 + threshold and delta > min_delta_ms:
+            status = 'regression'
+        elif ratio < 1.0 - threshold and -delta > min_delta_ms:
+            status = 'improved'
+        else:
+            status = 'same'
+        rows.append({'case': row['case'], 'size': row['size'], 'status': status,
+                     'median_ms': row['median_ms'], 'baseline_ms': base['median_ms'], 'ratio': ratio})
+    for key, base in base_rows.items():
+        if key not in seen and _planned(current, *key):
+            rows.append({'case': key[0], 'size': key[1], 'status': 'missing', 'baseline_ms': base['median_ms']})
+    counts = {status: sum(1 for r in rows if r['status'] == status) for status in ('regression', 'error', 'missing')}
+    return {
+        'baseline_created': baseline.get('created'),
+        'baseline_addon_version': baseline.get('addon_version'),
+        'threshold': threshold,
+        'min_delta_ms': min_delta_ms,
+        'regressions': counts['regression'],
+        'errors': counts['error'],
+        'missing': counts['missing'],
+        'failures': sum(counts.values()),
+        'rows': rows,
+    }
+
+def count_errors(current):
+    return sum(1 for row in current['results'] if 'median_ms' not in row)
+
+def format_comparison(comparison):
+    lines = ["Compared with baseline from %s (addon %s), threshold %d%%:" % (
+        comparison['baseline_created'], comparison['baseline_addon_version'], round(comparison['threshold'] * 100))]
+    lines.append("  %-24s %8s %12s %12s %8s  %s" % ("case", "size", "baseline ms", "current ms", "ratio", "status"))
+    for row in comparison['rows']:
+        if row['status'] == 'new':
+            lines.append("  %-24s %8s %12s %12.3f %8s  new" % (row['case'], row['size'], "-", row['median_ms'], "-"))
+            continue
+        if row['status'] in ('error', 'missing'):
+            baseline_ms = "%12.3f" % row['baseline_ms'] if row['baseline_ms'] is not None else "%12s" % "-"
+            lines.append("  %-24s %8s %s %12s %8s  %s" % (row['case'], row['size'], baseline_ms, "-", "-",
+                                                          row['status'].upper()))
+            continue
+        lines.append("  %-24s %8s %12.3f %12.3f %8.2f  %s" % (
+            row['case'], row['size'], row['baseline_ms'], row['median_ms'], row['ratio'],
+            row['status'].upper() if row['status'] == 'regression' else row['status']))
+    lines.append("  %d regression(s), %d error(s), %d missing" % (
+        comparison['regressions'], comparison['errors'], comparison['missing']))
+    return "\n".join(lines)
+#endregion
+
+
+#region Command line
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="blender -b --python benchmark/run.py --",
+                                     description="Time HS Tool operators on generated scenes.")
+    parser.add_argument("--cases", help="comma separated case names (default: all): " + ", ".join(c.name for c in CASES))
+    parser.add_argument("--profile", choices=("quick", "full"), default="full")
+    parser.add_argument("--sizes", help="comma separated sizes, overrides the profile")
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--output", help="write the JSON results here")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="results JSON to compare with")
+    parser.add_argument("--threshold", type=float, default=0.15, help="relative slowdown counted as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5)
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    return parser.parse_args(argv)
+
+def main(argv):
+    args = parse_args(argv)
+    case_names = set(args.cases.split(",")) if args.cases else None
+    sizes = [int(s) for s in args.sizes.split(",")] if args.sizes else None
+    print("HS Tool benchmark, Blender %s, profile %s" % (bpy.app.version_string, args.profile))
+    current = run_suite(case_names, args.profile, sizes, max(0, args.warmup), max(1, args.repeats))
+
+    # a case that raised fails the run even without a baseline to compare with
+    failures = count_errors(current)
+    if args.baseline and os.path.isfile(args.baseline) and not args.update_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        current['comparison'] = compare_results(current, baseline, args.threshold, args.min_delta_ms)
+        failures = current['comparison']['failures']
+        print(format_comparison(current['comparison']))
+
+    targets = [args.output] if args.output else []
+    if args.update_baseline:
+        targets.append(args.baseline)
+    for path in targets:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+        print("Wrote", path)
+    return 1 if failures else 0
+
+def argv_after_separator():
+    return sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+#endregion
@@ -0,0 +1,198 @@
+import math
+import random
+
+import bpy
+import bmesh
+import numpy as np
+from mathutils import Vector
+
+# Procedural scenes for the benchmark cases. Everything is built from code so a run
+# needs no .blend files, and sizes are parameters of the generators.
+
+
+#region Scene state
+def reset_scene():
+    '''Remove every object, mesh and collection so a case starts from an empty file'''
+    obj = bpy.context.object
+    if obj and obj.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    ids = list(bpy.data.objects) + list(bpy.data.meshes) + list(bpy.data.collections)
+    if hasattr(bpy.data, 'batch_remove'):
+        bpy.data.batch_remove(ids)
+    else:
+        for obj in list(bpy.data.objects):
+            bpy.data.objects.remove(obj, do_unlink=True)
+        for mesh in list(bpy.data.meshes):
+            bpy.data.meshes.remove(mesh)
+        for coll in list(bpy.data.collections):
+            bpy.data.collections.remove(coll)
+
+def select_objects(objects, active=None, mode='OBJECT'):
+    obj = bpy.context.object
+    if obj and obj.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = active or (objects[0] if objects else None)
+    if mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode=mode)
+
+def edit_select_edges(obj, edge_indices):
+    '''Edge-mode selection of edge_indices on obj, which must be in Edit Mode'''
+    bpy.context.scene.tool_settings.mesh_select_mode = (False, True, False)
+    bm = bmesh.from_edit_mesh(obj.data)
+    for seq in (bm.verts, bm.edges, bm.faces):
+        for elem in seq:
+            elem.select = False
+    bm.edges.ensure_lookup_table()
+    for index in edge_indices:
+        edge = bm.edges[index]
+        edge.select = True
+        edge.verts[0].select = True
+        edge.verts[1].select = True
+    bm.select_history.clear()
+    bmesh.update_edit_mesh(obj.data)
+    return bm
+#endregion
+
+
+#region Builders
+def link_mesh_object(name, mesh, location=(0.0, 0.0, 0.0)):
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+def bmesh_to_mesh(name, bm):
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return mesh
+
+def _bevel_edges(bm, edges, offset, segments):
+    geom = list(edges) + list({v for e in edges for v in e.verts})
+    try:
+        return bmesh.ops.bevel(bm, geom=geom, offset=offset, offset_type='OFFSET',
+                               segments=segments, profile=0.5, affect='EDGES')
+    except TypeError:
+        # before 2.90 the edge/vertex switch was vertex_only
+        return bmesh.ops.bevel(bm, geom=geom, offset=offset, offset_type='OFFSET',
+                               segments=segments, profile=0.5, vertex_only=False)
+
+def make_grid(name, size, noise=0.0, seed=0):
+    '''size x size quads on XY, vertex (i, j) at index j * (size + 1) + i.
+    noise jitters Z so relax/circle have real work to do.'''
+    n = size + 1
+    i, j = np.meshgrid(np.arange(n), np.arange(n))
+    co = np.zeros((n * n, 3))
+    co[:, 0] = i.ravel() - size * 0.5
+    co[:, 1] = j.ravel() - size * 0.5
+    if noise:
+        co[:, 2] = np.random.default_rng(seed).uniform(-noise, noise, n * n)
+    a = (j[:-1, :-1] * n + i[:-1, :-1]).ravel()
+    faces = np.stack((a, a + 1, a + n + 1, a + n), axis=1)
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(co.tolist(), [], faces.tolist())
+    mesh.update()
+    return link_mesh_object(name, mesh)
+
+def grid_edges(obj, size, vert_mask):
+    '''Indices of the grid edges whose two verts are both in vert_mask'''
+    mesh = obj.data
+    edge_verts = np.empty(len(mesh.edges) * 2, dtype=np.int32)
+    mesh.edges.foreach_get('vertices', edge_verts)
+    edge_verts = edge_verts.reshape(-1, 2)
+    return np.flatnonzero(vert_mask[edge_verts[:, 0]] & vert_mask[edge_verts[:, 1]]).tolist()
+
+def grid_rows_mask(size, rows):
+    n = size + 1
+    mask = np.zeros(n * n, dtype=bool)
+    for row in rows:
+        mask[row * n:(row + 1) * n] = True
+    return mask
+
+def grid_square_mask(size, lo, hi):
+    '''Boundary of the square [lo, hi] x [lo, hi]: one closed loop'''
+    n = size + 1
+    i, j = np.meshgrid(np.arange(n), np.arange(n))
+    inside = (i >= lo) & (i <= hi) & (j >= lo) & (j <= hi)
+    border = (i == lo) | (i == hi) | (j == lo) | (j == hi)
+    return (inside & border).ravel()
+
+def make_beveled_cylinder(name, segments, bevel_segments=3, radius=1.0, depth=2.0):
+    '''Capped cylinder with beveled rims. Returns (object, indices of the edges running
+    across the bevels), which is the ring selection tmc.re_bevel expects.'''
+    bm = bmesh.new()
+    bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=segments,
+                          radius1=radius, radius2=radius, depth=depth)
+    half = depth * 0.5
+    rims = [e for e in bm.edges
+            if all(abs(abs(v.co.z) - half) < 1e-5 for v in e.verts)
+            and all(abs(v.co.xy.length - radius) < 1e-5 for v in e.verts)]
+    result = _bevel_edges(bm, rims, radius * 0.1, bevel_segments)
+    bevel_faces = set(result['faces'])
+    ring_edges = []
+    for edge in bm.edges:
+        if not edge.link_faces or not all(f in bevel_faces for f in edge.link_faces):
+            continue
+        a, b = edge.verts[0].co, edge.verts[1].co
+        mid = (a + b) * 0.5
+        tangent = Vector((-mid.y, mid.x, 0.0)).normalized()
+        if abs((b - a).normalized().dot(tangent)) < 0.1:
+            ring_edges.append(edge)
+    bm.edges.index_update()
+    ring_indices = [e.index for e in ring_edges]
+    return link_mesh_object(name, bmesh_to_mesh(name, bm)), ring_indices
+
+def _kitbash_templates():
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    _bevel_edges(bm, list(bm.edges), 0.08, 2)
+    clean = bmesh_to_mesh("Kitbash_Template", bm)
+
+    # variant with two 5-sided faces, so the n-gon check has something to report
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    bm.edges.ensure_lookup_table()
+    bmesh.ops.subdivide_edges(bm, edges=[bm.edges[0]], cuts=1)
+    ngon = bmesh_to_mesh("Kitbash_Template_Ngon", bm)
+    return clean, ngon
+
+def make_kitbash(count, spacing=2.0, ngon_every=7, seed=0):
+    '''count separate mesh objects on a square grid; every ngon_every-th one has n-gons'''
+    clean, ngon = _kitbash_templates()
+    rng = random.Random(seed)
+    side = max(1, math.ceil(math.sqrt(count)))
+    objects = []
+    for index in range(count):
+        template = ngon if ngon_every and index % ngon_every == ngon_every - 1 else clean
+        location = ((index % side) * spacing, (index // side) * spacing, rng.uniform(-0.2, 0.2))
+        objects.append(link_mesh_object("Kitbash_%05d" % index, template.copy(), location))
+    bpy.data.meshes.remove(clean)
+    bpy.data.meshes.remove(ngon)
+    return objects
+
+def make_bake_pairs(count, spacing=3.0, high_subdivisions=2):
+    '''count low/high pairs at matching locations, highs named for check_highpoly_name'''
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    low = bmesh_to_mesh("Bake_Low_Template", bm)
+    bm = bmesh.new()
+    bmesh.ops.create_cube(bm, size=1.0)
+    bmesh.ops.subdivide_edges(bm, edges=list(bm.edges), cuts=high_subdivisions, use_grid_fill=True)
+    high = bmesh_to_mesh("Bake_High_Template", bm)
+
+    side = max(1, math.ceil(math.sqrt(count)))
+    pairs = []
+    for index in range(count):
+        location = ((index % side) * spacing, (index // side) * spacing, 0.0)
+        low_obj = link_mesh_object("Part_%05d" % index, low.copy(), location)
+        high_obj = link_mesh_object("HSTool_High_%05d" % index, high.copy(), location)
+        pairs.append((low_obj, high_obj))
+    bpy.data.meshes.remove(low)
+    bpy.data.meshes.remove(high)
+    return pairs
+#endregion
@@ -0,0 +1,16 @@
+"""pytest plugin (loaded from pytest.ini) for running the tests from the repository root.
+
+The root directory is the add-on package itself, so pytest would collect it as a Package
+and import its __init__.py, which needs Blender. Collecting it as a plain directory keeps
+pytest away from the add-on, the same way unittest discovery does.
+"""
+import os
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def pytest_collect_directory(path, parent):
+    if str(path) == ROOT:
+        return pytest.Dir.from_parent(parent, path=path)
@@ -0,0 +1,213 @@
+"""Offline tests for the updater's delta merge, backup and restore.
+
+Runs without Blender like test_addon_updater_download: the add-on is a small file
+tree in a temp folder, the update a staged copy of it next to the updater folder.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+for _name in ("bpy", "addon_utils"):
+    try:
+        __import__(_name)
+    except ImportError:
+        sys.modules[_name] = types.ModuleType(_name)
+
+import addon_updater  # noqa: E402
+
+ADDON = "hardsurface_tool"
+
+INSTALLED = {
+    "__init__.py": b"version = (1, 0)\n",
+    "core.py": b"def run(): return 1\n",
+    "old_module.py": b"# dropped by the update\n",
+    "README.md": b"old readme\n",
+    "settings.json": b'{"user": true}\n',
+    "icons/tool.png": b"old png",
+    "icons/legacy.png": b"png only the old version has",
+    "ops/__init__.py": b"",
+    "ops/legacy.py": b"# folder removed by the update\n",
+}
+
+UPDATE = {
+    "__init__.py": b"version = (1, 1)\n",
+    "core.py": b"def run(): return 1\n",  # same content, not part of the delta
+    "new_module.py": b"# added by the update\n",
+    "README.md": b"new readme\n",
+    "settings.json": b'{"user": false}\n',
+    "icons/tool.png": b"new png",
+    "icons/new.png": b"png only the new version has",
+}
+
+
+def write_tree(base, files):
+    for rel, data in files.items():
+        path = os.path.join(base, *rel.split("/"))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+
+class BackupTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.folder)
+        self.addon_root = os.path.join(self.folder, ADDON)
+        write_tree(self.addon_root, INSTALLED)
+
+        self.updater = addon_updater.SingletonUpdater()
+        self.updater.addon = ADDON
+        self.updater._addon_root = self.addon_root
+        self.updater._updater_path = os.path.join(self.addon_root, ADDON + "_updater")
+        os.makedirs(self.updater._updater_path)
+        # Same setup as addon_updater_ops.register
+        self.updater.backup_ignore_patterns = ["__pycache__"]
+        self.updater.overwrite_patterns = ["*.png", "*.jpg", "README.md", "LICENSE.txt"]
+        self.updater.remove_pre_update_patterns = ["*.py", "*.pyc"]
+        for name in ("save_updater_json", "reload_addon"):
+            patcher = mock.patch.object(self.updater, name)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.backup = os.path.join(self.updater._updater_path, "backup")
+        self.building = os.path.join(self.updater._updater_path, "backup_building")
+
+    def snapshot(self):
+        """{relative path: bytes} of the add-on, minus the updater folder"""
+        files = dict()
+        for rel in self.updater.iter_addon_files(self.addon_root):
+            with open(os.path.join(self.addon_root, rel), "rb") as f:
+                files[rel] = f.read()
+        return files
+
+    def stage(self, files=UPDATE):
+        merger = os.path.join(self.updater._updater_path, "update_staging", "source")
+        write_tree(merger, files)
+        return merger
+
+    def update(self, clean=False):
+        merger = self.stage()
+        self.assertEqual(self.updater.deep_merge_directory(self.addon_root, merger, clean), 0)
+
+
+class ManifestTest(BackupTestCase):
+
+    def test_file_manifest_skips_updater_folder(self):
+        write_tree(self.updater._updater_path, {"state.json": b"{}"})
+        manifest = self.updater.file_manifest(self.addon_root)
+        self.assertEqual(set(manifest), set(INSTALLED))
+        self.assertEqual(manifest["core.py"]["size"], len(INSTALLED["core.py"]))
+
+    def test_file_manifest_reuses_cached_hashes(self):
+        cache = self.updater.file_manifest(self.addon_root)
+        write_tree(self.addon_root, {"core.py": b"def run(): return 22\n"})
+        with mock.patch.object(self.updater, "file_sha256",
+                               wraps=self.updater.file_sha256) as hashed:
+            manifest = self.updater.file_manifest(self.addon_root, cache)
+        self.assertEqual([c.args[0] for c in hashed.call_args_list],
+                         [os.path.join(self.addon_root, "core.py")])
+        self.assertNotEqual(manifest["core.py"]["sha256"], cache["core.py"]["sha256"])
+
+    def test_plan_update_delta(self):
+        installed = self.updater.file_manifest(self.addon_root)
+        delta = self.updater.plan_update_delta(installed, self.stage())
+        self.assertEqual(sorted(delta["add"]), ["icons/new.png", "new_module.py"])
+        # settings.json matches no pattern and stays, core.py is unchanged
+        self.assertEqual(sorted(delta["change"]), ["README.md", "__init__.py", "icons/tool.png"])
+        self.assertEqual(sorted(delta["remove"]),
+                         ["old_module.py", "ops/__init__.py", "ops/legacy.py"])
+
+    def test_plan_clean_update_delta(self):
+        installed = self.updater.file_manifest(self.addon_root)
+        delta = self.updater.plan_update_delta(installed, self.stage(), clean=True)
+        self.assertIn("settings.json", delta["change"])
+        self.assertIn("icons/legacy.png", delta["remove"])
+        self.assertNotIn("core.py", delta["change"])
+
+
+class DeltaBackupTest(BackupTestCase):
+
+    def test_update_applies_delta(self):
+        self.update()
+        expected = dict(UPDATE)
+        expected["settings.json"] = INSTALLED["settings.json"]
+        expected["icons/legacy.png"] = INSTALLED["icons/legacy.png"]
+        self.assertEqual(self.snapshot(), expected)
+        self.assertFalse(os.path.isdir(os.path.join(self.addon_root, "ops")))
+        self.assertFalse(os.path.isdir(
+            os.path.join(self.updater._updater_path, "update_staging")))
+
+    def test_restore_reverses_update(self):
+        before = self.snapshot()
+        self.update()
+        self.assertTrue(os.path.isfile(
+            os.path.join(self.backup, addon_updater.BACKUP_MANIFEST_NAME)))
+        self.assertNotEqual(self.snapshot(), before)
+
+        self.updater.restore_backup()
+        self.assertEqual(self.snapshot(), before)
+        self.assertFalse(os.path.isdir(self.backup))
+        self.updater.reload_addon.assert_called_once_with()
+
+    def test_restore_reverses_clean_update(self):
+        before = self.snapshot()
+        self.update(clean=True)
+        self.assertEqual(self.snapshot(), UPDATE)
+
+        self.updater.restore_backup()
+        self.assertEqual(self.snapshot(), before)
+
+    def test_backup_holds_only_the_delta(self):
+        self.update()
+        saved = set(self.updater.iter_addon_files(os.path.join(self.backup, "files")))
+        self.assertEqual(saved, {"README.md", "__init__.py", "icons/tool.png",
+                                 "old_module.py", "ops/__init__.py", "ops/legacy.py"})
+
+    def test_failed_copy_leaves_no_backup(self):
+        write_tree(self.backup, {addon_updater.BACKUP_MANIFEST_NAME: b"{}"})
+        installed = self.updater.file_manifest(self.addon_root)
+        delta = self.updater.plan_update_delta(installed, self.stage())
+        with mock.patch.object(addon_updater.shutil, "copy2",
+                               side_effect=OSError("disk full")):
+            self.updater.create_delta_backup(self.addon_root, delta)
+        self.assertFalse(os.path.exists(self.backup))
+        self.assertFalse(os.path.exists(self.building))
+        self.updater.save_updater_json.assert_not_called()
+
+    def test_restore_refuses_incomplete_backup(self):
+        write_tree(self.backup, {"files/core.py": b"partial"})
+        before = self.snapshot()
+        self.assertFalse(self.updater.restore_backup())
+        self.assertEqual(self.updater.error_msg, "Backup folder is incomplete")
+        self.assertEqual(self.snapshot(), before)
+        self.updater.reload_addon.assert_not_called()
+
+
+class LegacyBackupTest(BackupTestCase):
+
+    def test_full_copy_restore(self):
+        write_tree(self.addon_root, {"__pycache__/core.cpython-311.pyc": b"cached"})
+        self.updater.create_backup()
+        self.assertTrue(os.path.isfile(os.path.join(self.backup, "__init__.py")))
+        self.assertFalse(os.path.exists(os.path.join(self.backup, "__pycache__")))
+        before = self.snapshot()
+        del before["__pycache__/core.cpython-311.pyc"]
+
+        write_tree(self.addon_root, {"core.py": b"broken", "extra.py": b""})
+        os.remove(os.path.join(self.addon_root, "README.md"))
+        self.updater.restore_backup()
+        self.assertEqual(self.snapshot(), before)
+        self.updater.reload_addon.assert_called_once_with()
+
+
+if __name__ == "__main__":
+    unittest.main()
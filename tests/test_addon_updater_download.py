@@ -0,0 +1,229 @@
+"""Offline tests for the updater's resumable download and checksum handling.
+
+Runs without Blender (python -m unittest discover -s tests, or python -m pytest from
+the repository root, see pytest.ini): a local
+http.server thread stands in for the release host, and bpy/addon_utils are only
+replaced when they can't be imported.
+"""
+import hashlib
+import http.server
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import types
+import unittest
+from unittest import mock
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+for _name in ("bpy", "addon_utils"):
+    try:
+        __import__(_name)
+    except ImportError:
+        sys.modules[_name] = types.ModuleType(_name)
+
+import addon_updater  # noqa: E402
+
+PAYLOAD = bytes(range(256)) * 1024  # 256 KiB, several download chunks
+
+
+class ReleaseHandler(http.server.BaseHTTPRequestHandler):
+    """Serves server.files; server.mode changes how /source.zip is answered."""
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append((self.path, self.headers.get("Range")))
+        body = server.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        range_header = self.headers.get("Range")
+        start = 0
+        if range_header and server.mode != "ignore_range":
+            start = int(range_header.split("=", 1)[1].rstrip("-"))
+            if start >= len(body):
+                self.send_error(416)
+                return
+        if server.mode == "drop_first" and len(server.requests) == 1:
+            # promise the whole file, send half of it, then hang up
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.send_response(206 if start else 200)
+        if start:
+            self.send_header("Content-Range", "bytes {}-{}/{}".format(
+                start, len(body) - 1, len(body)))
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        self.wfile.write(body[start:])
+
+
+class DownloadTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), ReleaseHandler)
+        self.server.files = {"/source.zip": PAYLOAD}
+        self.server.mode = "normal"
+        self.server.requests = []
+        self.thread = threading.Thread(target=self.server.serve_forever,
+                                       kwargs={"poll_interval": 0.05}, daemon=True)
+        self.thread.start()
+        self.base = "http://127.0.0.1:{}".format(self.server.server_address[1])
+        self.url = self.base + "/source.zip"
+
+        self.folder = tempfile.mkdtemp()
+        self.target = os.path.join(self.folder, "source.zip")
+        self.partial = os.path.join(self.folder, "source.zip.part")
+
+        self.updater = addon_updater.SingletonUpdater()
+        self.updater.engine = "github"
+        sleep = mock.patch.object(addon_updater.time, "sleep")
+        sleep.start()
+        self.addCleanup(sleep.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        shutil.rmtree(self.folder)
+
+    def read_target(self):
+        with open(self.target, "rb") as f:
+            return f.read()
+
+    def write_partial(self, data):
+        with open(self.partial, "wb") as f:
+            f.write(data)
+
+
+class UrlRetrieveTest(DownloadTestCase):
+
+    def test_plain_download(self):
+        self.updater.url_retrieve(self.url, self.target,
+                                  hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(self.read_target(), PAYLOAD)
+        self.assertFalse(os.path.exists(self.partial))
+
+    def test_resume_after_dropped_connection(self):
+        self.server.mode = "drop_first"
+        self.updater.url_retrieve(self.url, self.target,
+                                  hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(self.read_target(), PAYLOAD)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertIsNone(self.server.requests[0][1])
+        self.assertEqual(self.server.requests[1][1],
+                         "bytes={}-".format(len(PAYLOAD) // 2))
+
+    def test_resume_partial_file_from_earlier_attempt(self):
+        self.write_partial(PAYLOAD[:1000])
+        self.updater.url_retrieve(self.url, self.target,
+                                  hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(self.read_target(), PAYLOAD)
+        self.assertEqual(self.server.requests, [("/source.zip", "bytes=1000-")])
+
+    def test_server_ignoring_range_restarts_from_zero(self):
+        self.server.mode = "ignore_range"
+        self.write_partial(PAYLOAD[:1000])
+        self.updater.url_retrieve(self.url, self.target,
+                                  hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(self.read_target(), PAYLOAD)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_range_not_satisfiable_discards_partial(self):
+        self.write_partial(b"stale" * len(PAYLOAD))
+        self.updater.url_retrieve(self.url, self.target,
+                                  hashlib.sha256(PAYLOAD).hexdigest())
+        self.assertEqual(self.read_target(), PAYLOAD)
+        self.assertEqual([r for _, r in self.server.requests],
+                         ["bytes={}-".format(5 * len(PAYLOAD)), None])
+
+    def test_checksum_mismatch(self):
+        with self.assertRaises(ValueError):
+            self.updater.url_retrieve(self.url, self.target, "0" * 64)
+        self.assertFalse(os.path.exists(self.target))
+        self.assertFalse(os.path.exists(self.partial))
+
+    def test_gives_up_after_retries(self):
+        self.updater.download_retries = 1
+        with self.assertRaises(Exception):
+            self.updater.url_retrieve(self.base + "/missing.zip", self.target)
+        self.assertFalse(os.path.exists(self.target))
+
+
+class ChecksumManifestTest(DownloadTestCase):
+
+    DIGEST = hashlib.sha256(PAYLOAD).hexdigest()
+
+    def set_release(self, manifest_name=None, manifest_body=None):
+        assets = []
+        if manifest_name:
+            self.server.files["/" + manifest_name] = manifest_body.encode("utf-8")
+            assets.append({"name": manifest_name,
+                           "browser_download_url": self.base + "/" + manifest_name})
+        self.updater._tags = [
+            {"name": "v0.9", "zipball_url": self.base + "/old.zip", "assets": []},
+            {"name": "v1.0", "zipball_url": self.url, "assets": assets},
+        ]
+
+    def test_parse_sha256sum_lines(self):
+        text = "{}  other.zip\n{} *source.zip\n".format("a" * 64, self.DIGEST.upper())
+        self.assertEqual(self.updater.parse_checksum_manifest(text, self.url), self.DIGEST)
+
+    def test_parse_json_mapping(self):
+        text = json.dumps({"files": {"source.zip": self.DIGEST, "other.zip": "b" * 64}})
+        self.assertEqual(self.updater.parse_checksum_manifest(text, self.url), self.DIGEST)
+        text = json.dumps({"source.zip": self.DIGEST, "other.zip": "b" * 64})
+        self.assertEqual(self.updater.parse_checksum_manifest(text, self.url), self.DIGEST)
+
+    def test_parse_single_entry_applies_to_any_download(self):
+        self.assertEqual(self.updater.parse_checksum_manifest(
+            json.dumps({"sha256": self.DIGEST}), self.url), self.DIGEST)
+        self.assertEqual(self.updater.parse_checksum_manifest(
+            self.DIGEST + "\n", self.url), self.DIGEST)
+
+    def test_parse_missing_entry(self):
+        text = "{}  a.zip\n{}  b.zip\n".format("a" * 64, "b" * 64)
+        self.assertIsNone(self.updater.parse_checksum_manifest(text, self.url))
+
+    def test_expected_checksum_from_release_asset(self):
+        self.set_release("sha256sums.txt", "{}  source.zip\n".format(self.DIGEST))
+        self.assertEqual(self.updater.get_expected_checksum(self.url), self.DIGEST)
+
+    def test_expected_checksum_json_asset(self):
+        self.updater.checksum_manifest = "checksums.json"
+        self.set_release("checksums.json", json.dumps({"files": {"source.zip": self.DIGEST}}))
+        self.assertEqual(self.updater.get_expected_checksum(self.url), self.DIGEST)
+
+    def test_no_manifest(self):
+        self.set_release()
+        self.assertIsNone(self.updater.get_expected_checksum(self.url))
+        self.updater.require_checksum = True
+        with self.assertRaises(ValueError):
+            self.updater.get_expected_checksum(self.url)
+
+    def test_manifest_without_entry(self):
+        self.set_release("sha256sums.txt", "{}  a.zip\n{}  b.zip\n".format("a" * 64, "b" * 64))
+        with self.assertRaises(ValueError):
+            self.updater.get_expected_checksum(self.url)
+
+    def test_verified_download_end_to_end(self):
+        self.set_release("sha256sums.txt", "{}  source.zip\n".format(self.DIGEST))
+        self.updater.url_retrieve(self.url, self.target,
+                                  self.updater.get_expected_checksum(self.url))
+        self.assertEqual(self.read_target(), PAYLOAD)
+
+
+if __name__ == "__main__":
+    unittest.main()